@@ -58,6 +58,8 @@ for f in files:
         continue
     if Path(f).name == "operator.mustache":
         continue
+    if Path(f).name == "_lazy.py":
+        continue
     try:
         if os.path.isdir(f):
             shutil.rmtree(f)
@@ -95,11 +97,8 @@ for lib in LIB_OPTIONAL_TO_GENERATE:
     except Exception as e:
         print(f"Could not generate operators for optional library {lib}:\n{str(e)}")
 
-# Reorder imports alphabetically in __init__.py files to reduce changes raised
+# Turn the imports of the __init__.py files into sorted indexes of lazily loaded operators
 for init_file_path in glob.glob(os.path.join(TARGET_PATH, "**/__init__.py"), recursive=True):
-    with open(init_file_path, "r") as init_file:
-        lines = init_file.readlines()
-    with open(init_file_path, "w") as init_file:
-        init_file.writelines(sorted(lines))
+    build.build_lazy_init(init_file_path)
 
 build.build_operators()
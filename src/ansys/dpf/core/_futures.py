@@ -0,0 +1,47 @@
+"""
+Futures
+=======
+Run server requests in the background and retrieve their results through futures.
+"""
+import asyncio
+from concurrent.futures import Future
+
+
+class _AwaitableFuture(Future):
+    """Future which can also be awaited in a coroutine."""
+
+    def __await__(self):
+        return asyncio.wrap_future(self).__await__()
+
+
+def _submit(server, func, *args, **kwargs):
+    """Run a function in the thread pool of a server.
+
+    Parameters
+    ----------
+    server : server.DPFServer
+        Server whose thread pool runs the function.
+    func : callable
+        Function to run.
+    *args, **kwargs
+        Arguments of the function.
+
+    Returns
+    -------
+    future : concurrent.futures.Future
+        Future holding the result of the function, which can also be awaited.
+    """
+    future = _AwaitableFuture()
+
+    def run():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            result = func(*args, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+        else:
+            future.set_result(result)
+
+    server._thread_pool.submit(run)
+    return future
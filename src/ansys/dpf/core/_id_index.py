@@ -0,0 +1,107 @@
+"""
+IdToIndexMap
+============
+NumPy-backed mapping between entity IDs and their indices, shared by the nodes,
+elements and faces collections of a mesh.
+"""
+from collections.abc import Mapping
+
+import numpy as np
+
+# A dense lookup table is used when the range of the IDs is at most this many
+# times larger than the number of IDs, otherwise a sorted search is used.
+_DENSE_RANGE_FACTOR = 4
+
+
+class IdToIndexMap(Mapping):
+    """Map entity IDs to their zero-based indices without building a Python dictionary.
+
+    When the IDs are compact, a dense lookup table indexed by ``id - min_id`` is
+    used. Otherwise, the IDs are sorted once and looked up with
+    :func:`numpy.searchsorted`. In both cases, a duplicated ID maps to the index
+    of its first occurrence.
+
+    Parameters
+    ----------
+    ids : list[int], numpy.ndarray
+        IDs of the entities ordered by index.
+
+    Examples
+    --------
+    >>> from ansys.dpf.core._id_index import IdToIndexMap
+    >>> mapping = IdToIndexMap([10, 30, 20])
+    >>> mapping[20]
+    2
+    >>> indices, mask = mapping.lookup([20, 40, 10])
+    >>> indices
+    array([2, 0], dtype=int32)
+    >>> mask
+    array([ True, False,  True])
+
+    """
+
+    def __init__(self, ids):
+        self._ids = np.asarray(ids, dtype=np.int64).ravel()
+        self._min_id = 0
+        self._table = None
+        self._sorted_ids = None
+        self._sorter = None
+        n_ids = self._ids.size
+        if n_ids == 0:
+            return
+        self._min_id = int(self._ids.min())
+        id_range = int(self._ids.max()) - self._min_id + 1
+        if id_range <= _DENSE_RANGE_FACTOR * n_ids:
+            unique_ids, first_indices = np.unique(self._ids, return_index=True)
+            self._table = np.full(id_range, -1, dtype=np.int32)
+            self._table[unique_ids - self._min_id] = first_indices
+        else:
+            self._sorter = np.argsort(self._ids, kind="stable").astype(np.int32)
+            self._sorted_ids = self._ids[self._sorter]
+
+    def lookup(self, ids):
+        """Retrieve the indices of the given IDs.
+
+        Parameters
+        ----------
+        ids : list[int], numpy.ndarray
+            IDs to look up.
+
+        Returns
+        -------
+        indices : numpy.ndarray
+            Indices of the IDs found, as ``int32``.
+        mask : numpy.ndarray
+            Boolean array which is ``True`` for the input IDs found in the mapping.
+        """
+        ids = np.asarray(ids, dtype=np.int64).ravel()
+        if self._ids.size == 0:
+            return np.empty(0, dtype=np.int32), np.zeros(ids.size, dtype=bool)
+        if self._table is not None:
+            offsets = ids - self._min_id
+            mask = (offsets >= 0) & (offsets < self._table.size)
+            indices = np.full(ids.size, -1, dtype=np.int32)
+            indices[mask] = self._table[offsets[mask]]
+            mask &= indices >= 0
+            return indices[mask], mask
+        # the sort is stable and searchsorted returns the leftmost position, so
+        # duplicated IDs resolve to their first occurrence
+        positions = np.searchsorted(self._sorted_ids, ids)
+        positions[positions == self._sorted_ids.size] = 0
+        mask = self._sorted_ids[positions] == ids
+        return self._sorter[positions[mask]], mask
+
+    def __getitem__(self, id):
+        indices, mask = self.lookup([id])
+        if not mask[0]:
+            raise KeyError(id)
+        return int(indices[0])
+
+    def __contains__(self, id):
+        return bool(self.lookup([id])[1][0])
+
+    def __iter__(self):
+        return iter(self._ids.tolist())
+
+    def __len__(self):
+        return self._ids.size
@@ -1,4 +1,11 @@
+import os
 import weakref
+from collections import OrderedDict
+
+from ansys.dpf.gate import integral_types
+
+# Number of result files whose metadata is kept per server.
+_METADATA_CACHE_MAX_SIZE = 32
 
 
 class DataSourcesOrStreamsConnector:
@@ -45,3 +52,87 @@ class DataSourcesOrStreamsConnector:
 
         if mesh_by_default and self.mesh_provider and hasattr(op.inputs, "mesh"):
             op.inputs.mesh.connect(self.mesh_provider)
+
+
+def _data_sources_paths(data_sources):
+    """List the key and path of each file of data sources.
+
+    ``None`` is returned when the data sources may have upstream data sources,
+    which cannot be listed, or when they hold no file.
+    """
+    if getattr(data_sources, "_has_upstream", None) is not False:
+        return None
+    api = data_sources._api
+    paths = []
+    try:
+        for i_key in range(api.data_sources_get_num_keys(data_sources)):
+            num_paths = integral_types.MutableInt32()
+            key = api.data_sources_get_key(data_sources, i_key, num_paths)
+            for i_path in range(int(num_paths)):
+                paths.append((key, api.data_sources_get_path(data_sources, key, i_path)))
+    except NotImplementedError:
+        return None
+    return paths or None
+
+
+def _data_sources_content_key(data_sources):
+    """Build a key identifying the files of data sources by their content.
+
+    The key holds the result key and the key, absolute path, size and
+    modification time of each file of the data sources. The files are only
+    inspected when the server runs on the client machine, so ``None`` is returned
+    for a remote server, whose paths may name other files than the client ones.
+    ``None`` is also returned when the files are not accessible, or when the data
+    sources may have upstream data sources, which cannot be listed.
+    """
+    if not data_sources._server.local_server:
+        return None
+    paths = _data_sources_paths(data_sources)
+    if paths is None:
+        return None
+    entries = []
+    try:
+        for key, path in paths:
+            path = os.path.abspath(path)
+            stat = os.stat(path)
+            entries.append((key, path, stat.st_size, stat.st_mtime_ns))
+        result_key = data_sources.result_key
+    except (OSError, NotImplementedError):
+        return None
+    return (result_key,) + tuple(sorted(entries))
+
+
+def _data_sources_path_key(data_sources):
+    """Build a key identifying the files of data sources by their path on their server.
+
+    The key holds the address of the server, the result key and the key and path
+    of each file of the data sources, whose content is not checked. ``None`` is
+    returned when the files cannot be listed.
+    """
+    paths = _data_sources_paths(data_sources)
+    if paths is None:
+        return None
+    server = data_sources._server
+    try:
+        result_key = data_sources.result_key
+    except NotImplementedError:
+        return None
+    return (server.ip, server.port, result_key) + tuple(sorted(paths))
+
+
+def _get_metadata_cache_entry(server, key):
+    """Retrieve the dictionary of metadata cached on a server for a content key.
+
+    The least recently used entries are dropped once more than
+    ``_METADATA_CACHE_MAX_SIZE`` result files are cached on the server.
+    """
+    cache = server._metadata_cache
+    if cache is None:
+        cache = server._metadata_cache = OrderedDict()
+    if key in cache:
+        cache.move_to_end(key)
+        return cache[key]
+    entry = cache[key] = {}
+    if len(cache) > _METADATA_CACHE_MAX_SIZE:
+        cache.popitem(last=False)
+    return entry
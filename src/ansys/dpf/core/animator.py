@@ -5,10 +5,16 @@ This module contains the DPF animator class.
 
 Contains classes used to animate results based on workflows using PyVista.
 """
+import multiprocessing
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
 import numpy as np
 from typing import Union, Sequence
 
 import ansys.dpf.core as core
+from ansys.dpf.core._futures import _submit
 from ansys.dpf.core.helpers.utils import _sort_supported_kwargs
 from ansys.dpf.core.plotter import _PyVistaPlotter
 
@@ -27,6 +33,8 @@ class _PyVistaAnimator(_PyVistaPlotter):
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
+        # kept to create the plotters rendering frames in other processes
+        self._init_kwargs = dict(kwargs)
 
     def animate_workflow(
         self,
@@ -37,6 +45,8 @@ class _PyVistaAnimator(_PyVistaPlotter):
         save_as="",
         mode_number=None,
         scale_factor=1.0,
+        pipeline=False,
+        n_processes=1,
         **kwargs,
     ):
 
@@ -57,8 +67,15 @@ class _PyVistaAnimator(_PyVistaPlotter):
                 "Argument scale_factor must be an int, a float, or a list of either, "
                 f"(not {type_scale})"
             )
+        if n_processes > 1 and not save_as:
+            raise ValueError("Rendering frames in several processes requires save_as.")
+        if n_processes > 1 and kwargs.get("meshed_region") is not None:
+            # the processes only receive the workflow, and render the supports of its outputs
+            raise ValueError(
+                "A meshed_region cannot be given when rendering frames in several processes."
+            )
         # Initiate movie or gif file if necessary
-        if save_as:
+        if save_as and n_processes <= 1:
             if save_as.endswith(".gif"):
                 self._plotter.open_gif(save_as)
             else:  # pragma: no cover
@@ -82,39 +99,37 @@ class _PyVistaAnimator(_PyVistaPlotter):
             if isinstance(cpos[0][0], float):
                 cpos = [cpos] * len(indices)
 
-        def render_frame(frame):
-            self._plotter.clear()
+        renderer = _FrameRenderer(
+            workflow=workflow,
+            output_name=output_name,
+            input_name=input_name,
+            loop_values=np.array(loop_over.data),
+            indices=list(indices),
+            unit=unit,
+            mode_number=mode_number,
+            scale_factor=scale_factor,
+            freq_kwargs=freq_kwargs,
+            freq_fmt=freq_fmt,
+            cpos=cpos,
+            meshed_region=kwargs.pop("meshed_region", None),
+            kwargs=kwargs,
+        )
+        if n_processes > 1:
+            return self._animate_in_processes(renderer, save_as, n_processes, kwargs)
 
-            if mode_number is None:
-                workflow.connect(input_name, [frame])
+        # In pipelined mode, the workflow outputs of the next frame are evaluated in the
+        # background while the current frame is rendered.
+        prefetched = {}
 
-            else:
-                workflow.connect(input_name, loop_over.data[frame])
-
-            field = workflow.get_output(output_name, core.types.field)
-            deform = None
-            if "deform_by" in workflow.output_names:
-                deform = workflow.get_output("deform_by", core.types.field)
-            self.add_field(
-                field,
-                deform_by=deform,
-                scale_factor_legend=scale_factor[frame],
-                **kwargs,
-            )
-            kwargs_in = _sort_supported_kwargs(bound_method=self._plotter.add_text, **freq_kwargs)
-            if mode_number is None:
-                str_template = "t={0:{2}} {1}"
-                self._plotter.add_text(
-                    str_template.format(indices[frame], unit, freq_fmt), **kwargs_in
-                )
-            else:
-                str_template = "frq={0:{2}} {1}"
-                self._plotter.add_text(
-                    str_template.format(mode_number, unit, freq_fmt), **kwargs_in
-                )
+        def evaluate_frame(frame):
+            future = prefetched.pop(frame, None)
+            outputs = future.result() if future is not None else renderer.evaluate(frame)
+            if pipeline and frame + 1 < len(indices):
+                prefetched[frame + 1] = _submit(workflow._server, renderer.evaluate, frame + 1)
+            return outputs
 
-            if cpos:
-                self._plotter.camera_position = cpos[frame]
+        def render_frame(frame):
+            renderer.draw(self, frame, *evaluate_frame(frame))
 
         try:
 
@@ -166,6 +181,191 @@ class _PyVistaAnimator(_PyVistaPlotter):
         self._plotter.close()
         return result
 
+    def _animate_in_processes(self, renderer, save_as, n_processes, kwargs):
+        """Render disjoint ranges of frames off-screen in several processes and stitch them."""
+        from ansys.dpf.core.server_types import InProcessServer
+
+        workflow = renderer.workflow
+        server = workflow._server
+        if isinstance(server, InProcessServer):
+            raise ValueError(
+                "Rendering frames in several processes requires a gRPC server, "
+                "to which each process connects."
+            )
+        n_frames = len(renderer.indices)
+        if not renderer.cpos:
+            # all the processes use the default camera position of the first frame
+            renderer.draw(self, 0, *renderer.evaluate(0))
+            self._plotter.view_isometric()
+            renderer.cpos = [self._plotter.camera_position.to_list()] * n_frames
+        text_stream = workflow._api.work_flow_write_to_text(workflow)
+        frame_ranges = [
+            frames.tolist()
+            for frames in np.array_split(np.arange(n_frames), min(n_processes, n_frames))
+        ]
+        with tempfile.TemporaryDirectory() as directory:
+            with ProcessPoolExecutor(
+                max_workers=len(frame_ranges), mp_context=multiprocessing.get_context("spawn")
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        _render_frames_to_images,
+                        server.ip,
+                        server.port,
+                        server.config,
+                        text_stream,
+                        renderer,
+                        frames,
+                        directory,
+                        self._init_kwargs,
+                    )
+                    for frames in frame_ranges
+                ]
+                paths = [path for future in futures for path in future.result()]
+            _stitch_images(paths, save_as, **kwargs)
+        self._plotter.close()
+
+
+class _FrameRenderer:
+    """Evaluate the workflow of an animation and draw its frames.
+
+    The renderer can be pickled without its workflow and mesh to draw frames in
+    other processes.
+    """
+
+    def __init__(
+        self,
+        workflow,
+        output_name,
+        input_name,
+        loop_values,
+        indices,
+        unit,
+        mode_number,
+        scale_factor,
+        freq_kwargs,
+        freq_fmt,
+        cpos,
+        meshed_region,
+        kwargs,
+    ):
+        self.workflow = workflow
+        self.output_name = output_name
+        self.input_name = input_name
+        self.loop_values = loop_values
+        self.indices = indices
+        self.unit = unit
+        self.mode_number = mode_number
+        self.scale_factor = scale_factor
+        self.freq_kwargs = freq_kwargs
+        self.freq_fmt = freq_fmt
+        self.cpos = cpos
+        # Unless a mesh is given, the support of the previous frame is reused while it is
+        # unchanged, so that the VTK topology of the mesh is only built once for the animation.
+        self.meshed_region = meshed_region
+        self.reuse_mesh = meshed_region is None
+        self.kwargs = kwargs
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        state["workflow"] = None
+        state["meshed_region"] = None
+        state["reuse_mesh"] = True
+        return state
+
+    def evaluate(self, frame):
+        """Connect the input of a frame and return the field and deformation to render."""
+        if self.mode_number is None:
+            self.workflow.connect(self.input_name, [frame])
+        else:
+            self.workflow.connect(self.input_name, self.loop_values[frame])
+
+        field = self.workflow.get_output(self.output_name, core.types.field)
+        deform = None
+        if "deform_by" in self.workflow.output_names:
+            deform = self.workflow.get_output("deform_by", core.types.field)
+        return field, deform
+
+    def draw(self, animator, frame, field, deform):
+        """Draw a frame with an animator."""
+        animator._plotter.clear()
+        if self.reuse_mesh:
+            self.meshed_region = _reuse_mesh(self.meshed_region, field.meshed_region)
+        animator.add_field(
+            field,
+            meshed_region=self.meshed_region,
+            deform_by=deform,
+            scale_factor_legend=self.scale_factor[frame],
+            **self.kwargs,
+        )
+        kwargs_in = _sort_supported_kwargs(
+            bound_method=animator._plotter.add_text, **self.freq_kwargs
+        )
+        if self.mode_number is None:
+            str_template = "t={0:{2}} {1}"
+            animator._plotter.add_text(
+                str_template.format(self.indices[frame], self.unit, self.freq_fmt), **kwargs_in
+            )
+        else:
+            str_template = "frq={0:{2}} {1}"
+            animator._plotter.add_text(
+                str_template.format(self.mode_number, self.unit, self.freq_fmt), **kwargs_in
+            )
+
+        if self.cpos:
+            animator._plotter.camera_position = self.cpos[frame]
+
+
+def _render_frames_to_images(
+    ip, port, config, text_stream, renderer, frames, directory, plotter_kwargs
+):
+    """Render frames of an animation off-screen to PNG images in a new process."""
+    server = core.connect_to_server(ip=ip, port=port, config=config)
+    renderer.workflow = core.Workflow._create_from_text(text_stream, server)
+    renderer.workflow.progress_bar = False
+    animator = _PyVistaAnimator(**dict(plotter_kwargs, off_screen=True))
+    paths = []
+    for frame in frames:
+        renderer.draw(animator, frame, *renderer.evaluate(frame))
+        path = os.path.join(directory, f"frame_{frame:06d}.png")
+        animator._plotter.screenshot(path)
+        paths.append(path)
+    animator._plotter.close()
+    return paths
+
+
+def _stitch_images(paths, save_as, **kwargs):
+    """Write images as the frames of a gif or a movie, as ``Plotter.open_movie`` does."""
+    try:
+        import imageio.v2 as imageio
+    except ImportError:  # pragma: no cover
+        import imageio
+
+    if save_as.endswith(".gif"):
+        writer = imageio.get_writer(save_as, mode="I")
+    else:  # pragma: no cover
+        writer = imageio.get_writer(
+            save_as, fps=kwargs.get("framerate", 24), quality=kwargs.get("quality", 5)
+        )
+    with writer:
+        for path in paths:
+            writer.append_data(imageio.imread(path))
+
+
+def _reuse_mesh(previous_mesh, mesh):
+    """Return the previous mesh if it has the same nodes and elements as the given one."""
+    if previous_mesh is None or previous_mesh is mesh:
+        return mesh
+    if len(previous_mesh.nodes) != len(mesh.nodes):
+        return mesh
+    if len(previous_mesh.elements) != len(mesh.elements):
+        return mesh
+    if np.array_equal(previous_mesh.nodes.scoping.ids, mesh.nodes.scoping.ids) and np.array_equal(
+        previous_mesh.elements.scoping.ids, mesh.elements.scoping.ids
+    ):
+        return previous_mesh
+    return mesh
+
 
 class Animator:
     def __init__(self, workflow=None, **kwargs):
@@ -242,6 +442,8 @@ class Animator:
         save_as: str = None,
         scale_factor: Union[float, Sequence[float]] = 1.0,
         freq_kwargs: dict = None,
+        pipeline: bool = False,
+        n_processes: int = 1,
         **kwargs,
     ):
         """
@@ -269,6 +471,17 @@ class Animator:
             Dictionary of kwargs given to the :func:`pyvista.Plotter.add_text` method, used to
             format the frequency information. Can also contain a "fmt" key,
             defining the format for the frequency displayed with a string such as ".3e".
+        pipeline : bool, optional
+            Whether to evaluate the workflow for the next frame in the background while
+            the current frame is rendered. Defaults to False.
+        n_processes : int, optional
+            Number of processes rendering disjoint ranges of frames off-screen to images,
+            which are then stitched into ``save_as``. Each process connects to the gRPC
+            server of the workflow and renders its frames with the camera position of
+            ``cpos``, or of the first frame by default, and nothing is returned. The
+            fields are rendered on their supports, so ``meshed_region`` cannot be given.
+            Defaults to 1, in which case the frames are rendered one after the other
+            by this process.
         **kwargs : optional
             Additional keyword arguments for the animator.
             Used by :func:`pyvista.Plotter` (off_screen, cpos, ...),
@@ -289,6 +502,8 @@ class Animator:
             save_as=save_as,
             scale_factor=scale_factor,
             freq_kwargs=freq_kwargs,
+            pipeline=pipeline,
+            n_processes=n_processes,
             **kwargs,
         )
 
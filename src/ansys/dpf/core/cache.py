@@ -1,5 +1,13 @@
+import functools
+from collections import OrderedDict
 from typing import NamedTuple
 
+import numpy as np
+
+from ansys.dpf.gate.dpf_array import DPFArray
+
+_DEFAULT_CACHE_MAX_SIZE = 128
+
 
 def class_handling_cache(cls):
     """Class decorator used to handle cache.
@@ -8,50 +16,84 @@ def class_handling_cache(cls):
     At initialization, this decorator add a ''_cache'' property to the class.
     This new property is an instance of ''CacheHandler''.
 
+    The number of results cached per instance is bounded by the optional
+    ''_cache_max_size'' static attribute of the class, the least recently
+    used results being evicted first.
+
     .. note::
        The method must be used as a class decorator.
     """
     if hasattr(cls, "_to_cache"):
+        max_size = getattr(cls, "_cache_max_size", _DEFAULT_CACHE_MAX_SIZE)
 
-        def get_handler(mesh):
-            if hasattr(mesh, "__cache"):
-                return mesh.__cache
-            else:
-                setattr(mesh, "__cache", CacheHandler(cls, cls._to_cache))
-            return mesh.__cache
+        def get_handler(obj):
+            if hasattr(obj, "__cache"):
+                return getattr(obj, "__cache")
+            handler = CacheHandler(cls, cls._to_cache, max_size)
+            setattr(obj, "__cache", handler)
+            return handler
 
+        wrapped = set()
         for getter, setters in cls._to_cache.items():
             if setters:
                 for setter in setters:
-                    setattr(cls, setter.__name__, _handle_cache(setter))
+                    if setter.__name__ not in wrapped:
+                        setattr(cls, setter.__name__, _handle_cache(setter))
+                        wrapped.add(setter.__name__)
             setattr(cls, getter.__name__, _handle_cache(getter))
+            wrapped.add(getter.__name__)
 
         setattr(cls, "_cache", property(get_handler))
     return cls
 
 
+def _make_hashable(value):
+    """Convert a method argument to a hashable key.
+
+    Lists, tuples, dictionaries, sets and NumPy arrays are converted by value.
+    A ``TypeError`` is raised for other unhashable arguments.
+    """
+    if isinstance(value, (list, tuple)):
+        return (type(value).__name__,) + tuple(_make_hashable(item) for item in value)
+    if isinstance(value, dict):
+        return ("dict",) + tuple(
+            sorted(((key, _make_hashable(item)) for key, item in value.items()), key=repr)
+        )
+    if isinstance(value, (set, frozenset)):
+        return ("set", frozenset(_make_hashable(item) for item in value))
+    if isinstance(value, np.ndarray):
+        return ("ndarray", value.dtype.str, value.shape, value.tobytes())
+    hash(value)
+    return value
+
+
 class MethodIdentifier(NamedTuple):
     method_name: str
-    args: list
-    kwargs: dict
+    args: tuple
+    kwargs: tuple
 
-    def __eq__(self, other):
-        if isinstance(other, str):
-            return self.method_name == other
-        else:
-            return (
-                self.method_name == other.method_name
-                and self.args == other.args
-                and self.kwargs == other.kwargs
-            )
+    @staticmethod
+    def create(method_name, args, kwargs):
+        """Create an identifier of a method call from hashable versions of its arguments.
 
-    def __hash__(self):
-        hash = self.method_name.__hash__()
-        if self.args:
-            hash += self.args.__hash__()
-        if self.kwargs:
-            hash += self.kwargs.__hash__()
-        return hash
+        Raises
+        ------
+        TypeError
+            If one of the arguments cannot be converted to a hashable key.
+        """
+        return MethodIdentifier(
+            method_name,
+            tuple(_make_hashable(arg) for arg in args),
+            tuple(sorted((key, _make_hashable(value)) for key, value in kwargs.items())),
+        )
+
+
+class CacheStatistics(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    max_size: int
 
 
 class CacheHandler:
@@ -62,7 +104,12 @@ class CacheHandler:
     and their results are cached so that, when the getters are called again
     with the same parameters, the data is directly recovered instead of reevaluated.
     When the setters associated to getters in the input dictionary are called,
-    their associated getters' caches are cleared.
+    all their associated getters' caches are cleared.
+
+    At most ``max_size`` results are kept, the least recently used being evicted
+    first. Arrays which view server memory (``DPFArray``) are never cached so that
+    their modifications keep being sent to the server, and mutable containers are
+    copied when returned from the cache.
 
     Parameters
     ----------
@@ -71,9 +118,12 @@ class CacheHandler:
 
     getters_to_setters_dict : dict[function:list[function]]
         Map class getters to their list of setters which need to be cached
+
+    max_size : int, optional
+        Maximum number of results cached.
     """
 
-    def __init__(self, cls, getters_to_setters_dict):
+    def __init__(self, cls, getters_to_setters_dict, max_size=_DEFAULT_CACHE_MAX_SIZE):
 
         self.getter_to_setters_name = {}
         for getter, setters in getters_to_setters_dict.items():
@@ -86,28 +136,75 @@ class CacheHandler:
         self.setter_to_getter_names = {}
         for getter, setters in self.getter_to_setters_name.items():
             for setter in setters:
-                self.setter_to_getter_names[setter] = getter
+                self.setter_to_getter_names.setdefault(setter, []).append(getter)
 
-        self.cached = {}
+        self.max_size = max_size
+        self.cached = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
 
     def handle(self, object, func, *args, **kwargs):
-        identifier = MethodIdentifier(func.__name__, args, kwargs)
-        if identifier in self.cached:
-            return self.cached[identifier]
-        elif func.__name__ in self.getter_to_setters_name:
-            self.cached[identifier] = func(object, *args, **kwargs)
-            setattr(func, "under_cache", False)
-            return self.cached[identifier]
-        else:
-            if (
-                func.__name__ in self.setter_to_getter_names
-                and self.setter_to_getter_names[func.__name__] in self.cached
-            ):
-                del self.cached[self.setter_to_getter_names[func.__name__]]
-            return func(object, *args, **kwargs)
+        name = func.__name__
+        if name in self.getter_to_setters_name:
+            try:
+                identifier = MethodIdentifier.create(name, args, kwargs)
+            except TypeError:
+                self.misses += 1
+                return func(object, *args, **kwargs)
+            if identifier in self.cached:
+                self.hits += 1
+                self.cached.move_to_end(identifier)
+                return _copy_mutable(self.cached[identifier])
+            self.misses += 1
+            value = func(object, *args, **kwargs)
+            if not isinstance(value, DPFArray):
+                self.cached[identifier] = value
+                if len(self.cached) > self.max_size:
+                    self.cached.popitem(last=False)
+                    self.evictions += 1
+            return _copy_mutable(value)
+        if name in self.setter_to_getter_names:
+            self.invalidate(*self.setter_to_getter_names[name])
+        return func(object, *args, **kwargs)
+
+    def invalidate(self, *method_names):
+        """Clear the cached results of some getters.
+
+        Parameters
+        ----------
+        *method_names : str
+            Names of the getters whose results must be cleared. All the cached results
+            are cleared when no name is given.
+        """
+        if not method_names:
+            self.cached.clear()
+            return
+        for identifier in list(self.cached):
+            if identifier.method_name in method_names:
+                del self.cached[identifier]
 
     def clear(self):
-        self.cached = {}
+        self.cached = OrderedDict()
+
+    @property
+    def statistics(self):
+        """Number of cache hits, misses and evictions, and current and maximum sizes.
+
+        Returns
+        -------
+        CacheStatistics
+        """
+        return CacheStatistics(
+            self.hits, self.misses, self.evictions, len(self.cached), self.max_size
+        )
+
+
+def _copy_mutable(value):
+    """Copy the mutable containers returned by the cache so that the cached value is kept."""
+    if isinstance(value, (list, dict, np.ndarray)):
+        return value.copy()
+    return value
 
 
 def _handle_cache(func):
@@ -118,12 +215,13 @@ def _handle_cache(func):
        The method must be used as a decorator.
     """
 
+    @functools.wraps(func)
     def wrapper(self, *args, **kwargs):
         """Call the original function"""
         if hasattr(self, "_cache"):
             return self._cache.handle(self, func, *args, **kwargs)
         else:
-            func(self, *args, **kwargs)
+            return func(self, *args, **kwargs)
 
     return wrapper
 
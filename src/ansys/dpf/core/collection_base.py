@@ -16,6 +16,7 @@ from ansys.dpf.core.server_types import BaseServer
 from ansys.dpf.core.scoping import Scoping
 from ansys.dpf.core.label_space import LabelSpace
 from ansys.dpf.core import server as server_module
+from ansys.dpf.core.output_cache import _modifies_instance
 from ansys.dpf.gate import (
     collection_capi,
     collection_grpcapi,
@@ -145,6 +146,7 @@ class CollectionBase(Generic[TYPE]):
                 f"and not {type(inpt[0]).__name__}"
             )
 
+    @_modifies_instance
     def set_labels(self, labels):
         """Set labels for scoping the collection.
 
@@ -165,6 +167,7 @@ class CollectionBase(Generic[TYPE]):
         for label in labels:
             self.add_label(label)
 
+    @_modifies_instance
     def add_label(self, label, default_value=None):
         """Add the requested label to scope the collection.
 
@@ -381,6 +384,7 @@ class CollectionBase(Generic[TYPE]):
         core_api.init_data_processing_environment(self)
         return core_api
 
+    @_modifies_instance
     def _add_entry(self, label_space, entry):
         """Update or add an entry at a requested label space.
 
@@ -439,6 +443,7 @@ class CollectionBase(Generic[TYPE]):
         res = TimeFreqSupport(time_freq_support=time_freq, server=self._server)
         return res
 
+    @_modifies_instance
     def _set_time_freq_support(self, time_freq_support):
         """Set the time frequency support of the collection."""
         self._api.collection_set_support(self, "time", time_freq_support)
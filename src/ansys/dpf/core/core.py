@@ -404,6 +404,7 @@ class BaseService:
             self._internal_obj = self._api.data_processing_load_library(
                 name=name, dllPath=file_path, symbol=symbol
             )
+        self._server()._clear_operator_caches()
         if generate_operators:
             # TODO: fix code generation upload posix
             import os
@@ -469,6 +470,7 @@ class BaseService:
             self._api.data_processing_apply_context(
                 int(context.licensing_context_type), context.xml_path
             )
+        self._server()._clear_operator_caches()
 
     def initialize_with_context(self, context):
         """Defines the settings that will be used to initialize DPF.
@@ -498,6 +500,7 @@ class BaseService:
             self._api.data_processing_initialize_with_context(
                 int(context.licensing_context_type), context.xml_path
             )
+        self._server()._clear_operator_caches()
 
     @version_requires("6.0")
     def release_dpf(self):
@@ -511,6 +514,7 @@ class BaseService:
             error = self._api.data_processing_release_on_client(self._server().client, 1)
         else:
             error = self._api.data_processing_release(1)
+        self._server()._clear_operator_caches()
 
     @version_requires("4.0")
     def get_runtime_core_config(self):
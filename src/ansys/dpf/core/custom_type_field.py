@@ -13,6 +13,7 @@ from ansys.dpf.core import errors
 from ansys.dpf.core import scoping
 from ansys.dpf.core.common import locations, _get_size_of_list
 from ansys.dpf.core.field_base import _FieldBase
+from ansys.dpf.core.output_cache import _modifies_instance
 from ansys.dpf.core.field_definition import FieldDefinition
 from ansys.dpf.core.support import Support
 from ansys.dpf.gate import (
@@ -182,6 +183,7 @@ class CustomTypeField(_FieldBase):
             return self.field_definition.location
 
     @location.setter
+    @_modifies_instance
     def location(self, location):
         """Change the field location.
 
@@ -306,7 +308,7 @@ class CustomTypeField(_FieldBase):
             self._api.cscustom_type_field_get_entity_data_for_dpf_vector(
                 self, vec, vec.internal_data, vec.internal_size, index
             )
-            data = dpf_array.DPFArray(vec)
+            data = self._as_dpf_array(vec)
 
         except NotImplementedError:
             data = self._api.cscustom_type_field_get_entity_data(self, index)
@@ -346,7 +348,7 @@ class CustomTypeField(_FieldBase):
             self._api.cscustom_type_field_get_entity_data_by_id_for_dpf_vector(
                 self, vec, vec.internal_data, vec.internal_size, id
             )
-            data = dpf_array.DPFArray(vec)
+            data = self._as_dpf_array(vec)
 
         except NotImplementedError:
             index = self.scoping.index(id)
@@ -358,6 +360,7 @@ class CustomTypeField(_FieldBase):
             data.shape = (data.size // n_comp, n_comp)
         return data
 
+    @_modifies_instance
     def append(self, data, scopingid):
         if isinstance(data, list):
             data = np.array(data, dtype=self._type)
@@ -369,7 +372,7 @@ class CustomTypeField(_FieldBase):
             self._api.cscustom_type_field_get_data_pointer_for_dpf_vector(
                 self, vec, vec.internal_data, vec.internal_size
             )
-            return dpf_array.DPFArray(vec)
+            return self._as_dpf_array(vec)
 
         except NotImplementedError:
             return self._api.cscustom_type_field_get_data_pointer(self, True)
@@ -383,7 +386,7 @@ class CustomTypeField(_FieldBase):
             self._api.cscustom_type_field_get_data_for_dpf_vector(
                 self, vec, vec.internal_data, vec.internal_size
             )
-            data = dpf_array.DPFArray(vec) if np_array else dpf_array.DPFArray(vec).tolist()
+            data = self._as_dpf_array(vec) if np_array else dpf_array.DPFArray(vec).tolist()
         except NotImplementedError:
             data = self._api.cscustom_type_field_get_data(self, np_array)
         n_comp = self.component_count
@@ -513,6 +516,7 @@ class CustomTypeField(_FieldBase):
         return self._field_definition
 
     @field_definition.setter
+    @_modifies_instance
     def field_definition(self, value):
         self._set_field_definition(value)
 
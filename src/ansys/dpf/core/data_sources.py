@@ -68,6 +68,9 @@ class DataSources:
 
         # step4: if object exists: take instance, else create it:
         # object_name -> protobuf.message, DPFObject*
+        # Upstream data sources cannot be listed, so they are only known to be
+        # absent from data sources created here.
+        self._has_upstream = None
         if data_sources is not None:
             if isinstance(data_sources, DataSources):
                 # Make a Copy
@@ -90,6 +93,7 @@ class DataSources:
                 self._internal_obj = self._api.data_sources_new_on_client(self._server.client)
             else:
                 self._internal_obj = self._api.data_sources_new("data_sources")
+            self._has_upstream = False
 
         if result_path is not None:
             self.set_result_file_path(result_path)
@@ -284,6 +288,7 @@ class DataSources:
             Extension of the result file group with which this upstream belongs
 
         """
+        self._has_upstream = True
         if result_key == "":
             self._api.data_sources_add_upstream_data_sources(self, upstream_data_sources)
         else:
@@ -306,6 +311,7 @@ class DataSources:
             Domain id for distributed files.
 
         """
+        self._has_upstream = True
         self._api.data_sources_add_upstream_domain_data_sources(
             self, upstream_data_sources, domain_id
         )
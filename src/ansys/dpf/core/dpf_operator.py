@@ -13,7 +13,7 @@ import warnings
 from enum import Enum
 from ansys.dpf.core.check_version import version_requires, server_meet_version, server_meet_version_and_raise
 from ansys.dpf.core.config import Config
-from ansys.dpf.core.errors import DpfVersionNotSupported
+from ansys.dpf.core.errors import DpfVersionNotSupported, DPFServerException
 from ansys.dpf.core.inputs import Inputs
 from ansys.dpf.core.mapping_types import types
 from ansys.dpf.core.common import types_enum_to_types
@@ -101,6 +101,10 @@ class Operator:
         self._internal_obj = None
         self._description = None
         self._inputs = None
+        self._recorded_inputs = {}
+        self._recorded_config = None
+        self._workflow_input_pins = {}
+        self._output_cache = None
 
         # step 1: get server
         self._server = server_module.get_or_create_server(server)
@@ -229,6 +233,19 @@ class Operator:
         DPFArray([[0.59428386, 0.00201751, 0.0006032 ]]...
 
         """
+        self._connect(pin, inpt, pin_out)
+        self._record_input(pin, inpt, pin_out)
+
+    def _record_input(self, pin, inpt, pin_out):
+        """Record an input to fingerprint the operator for output caches."""
+        from ansys.dpf.core.output_cache import _record_input
+
+        self._recorded_inputs[pin] = (
+            _record_input(inpt, self._output_cache is not None),
+            pin_out,
+        )
+
+    def _connect(self, pin, inpt, pin_out=0):
         if inpt is self:
             raise ValueError("Cannot connect to itself.")
         elif isinstance(inpt, Operator):
@@ -280,6 +297,7 @@ class Operator:
             Requested type of the output. The default is ``None``.
         """
         self._api.operator_connect_operator_as_input(self, pin, op)
+        self._record_input(pin, op, None)
 
     @staticmethod
     def _getoutput_string(self, pin):
@@ -528,8 +546,112 @@ class Operator:
         type
             Output of the operator.
         """
+        return self._get_cached_output(pin, output_type, self.progress_bar)
+
+    def get_output_async(self, pin=0, output_type=None):
+        """Retrieve the output of the operator on the pin number without waiting for it.
+
+        The operator is evaluated in the thread pool of its server, so that several
+        independent requests overlap on a gRPC server. No progress bar is displayed.
+
+        Parameters
+        ----------
+        pin : int, optional
+            Number of the output pin. The default is ``0``.
+        output_type : :class:`ansys.dpf.core.common.types`, type,  optional
+            Requested type of the output. The default is ``None``.
+
+        Returns
+        -------
+        concurrent.futures.Future
+            Future holding the output of the operator. It can also be awaited in a
+            coroutine.
+
+        Examples
+        --------
+        >>> from ansys.dpf import core as dpf
+        >>> from ansys.dpf.core import examples
+        >>> model = dpf.Model(examples.find_simple_bar())
+        >>> disp_future = model.results.displacement().get_output_async(
+        ...     0, dpf.types.fields_container
+        ... )
+        >>> stress_future = model.results.stress().get_output_async(
+        ...     0, dpf.types.fields_container
+        ... )
+        >>> disp = disp_future.result()
+        >>> stress = stress_future.result()
+
+        In a coroutine, the future is awaited directly.
+
+        >>> import asyncio
+        >>> async def read_displacement():
+        ...     return await model.results.displacement().get_output_async(
+        ...         0, dpf.types.fields_container
+        ...     )
+        >>> disp = asyncio.run(read_displacement())
+
+        """
+        from ansys.dpf.core._futures import _submit
+
+        return _submit(self._server, self._get_cached_output, pin, output_type, False)
+
+    @property
+    def output_cache(self):
+        """Cache of the outputs of the operator, if any.
+
+        When a :class:`ansys.dpf.core.output_cache.OutputCache` is set, the outputs
+        requested with a type are memoized on the fingerprints of the connected inputs,
+        so that requesting them again with identical inputs does not evaluate the
+        operator. The same cache can be shared by several operators.
+
+        The inputs connected before the cache is set are not kept alive by the
+        operator, so the cache is bypassed once one of them is deleted.
+
+        The outputs returned from the cache are shared by the requests with identical
+        inputs, so they must be copied before being modified in place.
+
+        Returns
+        -------
+        :class:`ansys.dpf.core.output_cache.OutputCache`, None
+            Cache of the outputs, ``None`` by default.
+
+        Examples
+        --------
+        >>> from ansys.dpf import core as dpf
+        >>> from ansys.dpf.core import examples
+        >>> from ansys.dpf.core.output_cache import OutputCache
+        >>> data_src = dpf.DataSources(examples.find_simple_bar())
+        >>> disp_op = dpf.operators.result.displacement(data_sources=data_src)
+        >>> disp_op.output_cache = OutputCache()
+        >>> disp = disp_op.outputs.fields_container()
+        >>> disp_op.output_cache.invalidate(disp_op)
+
+        """
+        return self._output_cache
+
+    @output_cache.setter
+    def output_cache(self, value):
+        self._output_cache = value
+
+    def _output_cache_source(self):
+        from ansys.dpf.core.output_cache import _digest, _operator_fingerprint
+
+        return _digest(_operator_fingerprint(self, set()))
+
+    def _get_cached_output(self, pin, output_type, progress_bar):
+        if self._output_cache is None or output_type is None:
+            return self._get_output(pin, output_type, progress_bar)
         output_type = _write_output_type_to_type(output_type)
-        if self._server.meet_version("3.0") and self.progress_bar:
+        return self._output_cache._get_or_compute(
+            self,
+            lambda: self._get_output(pin, output_type, progress_bar),
+            pin,
+            output_type,
+        )
+
+    def _get_output(self, pin, output_type, progress_bar):
+        output_type = _write_output_type_to_type(output_type)
+        if self._server.meet_version("3.0") and progress_bar:
             self._server.session.add_operator(self, pin, "operator")
             self._progress_thread = self._server.session.listen_to_progress()
         if output_type is None:
@@ -604,6 +726,7 @@ class Operator:
         value : Config
         """
         self._api.operator_set_config(self, value)
+        self._recorded_config = value.options
 
     @property
     def inputs(self):
@@ -739,6 +862,45 @@ class Operator:
                 if output._pin == pin:
                     return output()
 
+    def eval_async(self, pin=None):
+        """Evaluate this operator without waiting for it.
+
+        The operator is evaluated in the thread pool of its server, so that several
+        independent requests overlap on a gRPC server. No progress bar is displayed.
+
+        Parameters
+        ----------
+        pin : int
+            Number of the output pin. The default is ``None``.
+
+        Returns
+        -------
+        concurrent.futures.Future
+            Future holding the output that :func:`Operator.eval` returns. It can also be
+            awaited in a coroutine.
+
+        Examples
+        --------
+        >>> from ansys.dpf import core as dpf
+        >>> from ansys.dpf.core import examples
+        >>> data_src = dpf.DataSources(examples.find_multishells_rst())
+        >>> disp_op = dpf.operators.result.displacement(data_sources=data_src)
+        >>> future = disp_op.eval_async()
+        >>> disp = future.result()
+
+        """
+        from ansys.dpf.core._futures import _submit
+
+        outputs = self.outputs._outputs if self.outputs is not None else []
+        if not pin:
+            if outputs:
+                return _submit(self._server, outputs[0]._get_data, False)
+            return _submit(self._server, self._get_cached_output, 0, None, False)
+        for output in outputs:
+            if output._pin == pin:
+                return _submit(self._server, output._get_data, False)
+        return _submit(self._server, lambda: None)
+
     def _find_outputs_corresponding_pins(self, type_names, inpt, pin, corresponding_pins):
         from ansys.dpf.core.results import Result
 
@@ -917,6 +1079,56 @@ def available_operator_names(server=None):
     return out
 
 
+def _cached_available_operator_names(server=None):
+    """Retrieve the set of operator names available in the server.
+
+    The names are requested once per server and cached until a library of operators
+    is loaded.
+
+    Parameters
+    ----------
+    server : server.DPFServer, optional
+        Server with channel connected to the remote or local instance. When
+        ``None``, attempts to use the global server.
+
+    Returns
+    -------
+    set, None
+        Names of the available operators, or ``None`` if the server cannot list them.
+    """
+    server = server_module.get_or_create_server(server)
+    if server._operator_names_cache is None:
+        try:
+            server._operator_names_cache = frozenset(available_operator_names(server))
+        except (DpfVersionNotSupported, DPFServerException, NotImplementedError):
+            return None
+    return server._operator_names_cache
+
+
+def _cached_operator_description(operator_name, server=None):
+    """Retrieve the description of an operator as returned by ``str(Operator(...))``.
+
+    The description is requested once per operator and per server.
+
+    Parameters
+    ----------
+    operator_name : str
+        Name of the operator.
+    server : server.DPFServer, optional
+        Server with channel connected to the remote or local instance. When
+        ``None``, attempts to use the global server.
+
+    Returns
+    -------
+    str
+    """
+    server = server_module.get_or_create_server(server)
+    descriptions = server._operator_descriptions_cache
+    if operator_name not in descriptions:
+        descriptions[operator_name] = Operator(operator_name, server=server).__str__()
+    return descriptions[operator_name]
+
+
 def _write_output_type_to_type(output_type):
     if isinstance(output_type, str):
         output_type = types[output_type]
@@ -8,6 +8,7 @@ from __future__ import annotations
 from enum import Enum
 import numpy as np
 from ansys.dpf.core import nodes
+from ansys.dpf.core._id_index import IdToIndexMap
 from ansys.dpf.core.common import locations, elemental_properties
 from ansys.dpf.core.element_descriptor import ElementDescriptor
 from ansys.dpf.gate import integral_types
@@ -32,6 +33,9 @@ class Element:
         Fortran-based (1-based) index of the element in the result.
     nodes : list
         List of DPF nodes belonging to the element.
+    element_type : int, optional
+        Type of the element when it is already known. If ``None``, the type is
+        requested from the server when needed.
 
     Examples
     --------
@@ -50,11 +54,12 @@ class Element:
 
     """
 
-    def __init__(self, mesh, elementid, index, nodes):
+    def __init__(self, mesh, elementid, index, nodes, element_type=None):
         self._id = elementid
         self._index = index
         self._nodes = nodes
         self._mesh = mesh
+        self._type = element_type
 
     @property
     def node_ids(self):
@@ -173,6 +178,8 @@ class Element:
 
     def _get_type(self):
         """Retrieve the Ansys element type."""
+        if self._type is not None:
+            return element_types(self._type)
         type = integral_types.MutableInt32()
         self._mesh._api.meshed_region_get_element_type(self._mesh, self.id, type, self.index)
         return element_types(int(type))
@@ -250,6 +257,8 @@ class Elements:
         self._mesh = mesh
         self._server = mesh._server
         self._mapping_id_to_index = None
+        self._arrays_cache = None
+        self._nodes = None
 
     def __str__(self):
         return "DPF Elements object with %d elements" % len(self)
@@ -262,8 +271,9 @@ class Elements:
         return self.n_elements
 
     def __iter__(self):
-        for i in range(len(self)):
-            yield self[i]
+        ids = self.to_arrays()[0]
+        for index in range(len(ids)):
+            yield self._element_from_arrays(index)
 
     def element_by_id(self, id) -> Element:
         """
@@ -345,6 +355,7 @@ class Elements:
             self._mesh._api.meshed_region_add_element_by_shape(
                 self._mesh, add.id, len(add.connectivity), add.connectivity, shape_id
             )
+            self._clear_prefetch()
 
     def add_solid_element(self, id, connectivity):
         """
@@ -421,6 +432,7 @@ class Elements:
         self._mesh._api.meshed_region_add_element_by_shape(
             self._mesh, id, len(connectivity), connectivity, shape_id
         )
+        self._clear_prefetch()
 
     def __get_element(self, elementindex=None, elementid=None):
         """
@@ -437,8 +449,16 @@ class Elements:
         -------
         element : Element
         """
+        if self._arrays_cache is not None:
+            if elementindex is None:
+                if elementid not in self.mapping_id_to_index:
+                    raise ValueError("element not found")
+                elementindex = self.mapping_id_to_index[elementid]
+            return self._element_from_arrays(elementindex)
         if elementindex is None:
             elementindex = self._mesh._api.meshed_region_get_element_index(self._mesh, elementid)
+            if elementindex < 0:
+                raise ValueError("element not found")
         elif elementid is None:
             elementid = self._mesh._api.meshed_region_get_element_id(self._mesh, elementindex)
         nodesOut = []
@@ -520,6 +540,7 @@ class Elements:
             PropertyField that contains element type values
         """
         self._mesh.set_property_field(elemental_properties.element_type, property_field)
+        self._clear_prefetch()
 
     @property
     def materials_field(self):
@@ -594,11 +615,92 @@ class Elements:
             PropertyField that contains connectivity value
         """
         self._mesh.set_property_field(elemental_properties.connectivity, property_field)
+        self._clear_prefetch()
 
     def _get_connectivities_field(self):
         """Retrieve the connectivities field."""
         return self._mesh.property_field(elemental_properties.connectivity)
 
+    def to_arrays(self):
+        """
+        Retrieve the IDs, types and connectivity of all the elements as arrays.
+
+        The scoping, the element types field and the connectivities field are
+        requested once and cached on this collection, so that iterating over it
+        or retrieving elements afterwards does not require any additional request
+        to the server.
+
+        Returns
+        -------
+        ids : numpy.ndarray
+            IDs of the elements ordered by index.
+        types : numpy.ndarray
+            Types of the elements ordered by index, or ``None`` when the mesh does not
+            hold the element types. See :class:`ansys.dpf.core.elements.element_types`.
+        offsets : numpy.ndarray
+            Offsets of the connectivity of each element in ``connectivity``, of
+            size ``n_elements + 1``.
+        connectivity : numpy.ndarray
+            Flat array of the node indices of all the elements.
+
+        Examples
+        --------
+        >>> import ansys.dpf.core as dpf
+        >>> from ansys.dpf.core import examples
+        >>> model = dpf.Model(examples.find_static_rst())
+        >>> elements = model.metadata.meshed_region.elements
+        >>> ids, types, offsets, connectivity = elements.to_arrays()
+        >>> ids.size
+        8
+        >>> first_element_node_indices = connectivity[offsets[0] : offsets[1]]
+
+        """
+        if self._arrays_cache is None:
+            element_scoping = self.scoping
+            if element_scoping is None:
+                ids = np.empty(0, dtype=np.int32)
+            else:
+                ids = np.asarray(element_scoping.ids)
+            types = np.empty(0, dtype=np.int32) if ids.size == 0 else None
+            offsets = np.zeros(ids.size + 1, dtype=np.int32)
+            connectivity = np.empty(0, dtype=np.int32)
+            if ids.size > 0:
+                element_types_data = np.asarray(self.element_types_field.data).ravel()
+                if element_types_data.size == ids.size:
+                    types = element_types_data
+                connectivities_field = self._get_connectivities_field()
+                connectivity = np.asarray(connectivities_field.data).ravel()
+                data_pointer = np.asarray(connectivities_field._data_pointer).ravel()
+                if data_pointer.size >= ids.size:
+                    offsets[:-1] = data_pointer[: ids.size]
+                    offsets[-1] = connectivity.size
+                else:
+                    offsets = np.arange(ids.size + 1, dtype=np.int32)
+                    offsets *= connectivity.size // ids.size
+            self._arrays_cache = (ids, types, offsets, connectivity)
+        return self._arrays_cache
+
+    def _element_from_arrays(self, index):
+        """Build an element from the cached arrays without any request to the server."""
+        ids, types, offsets, connectivity = self.to_arrays()
+        if self._nodes is None:
+            self._nodes = self._mesh.nodes
+        node_ids, coordinates = self._nodes._prefetch()
+        node_indices = connectivity[offsets[index] : offsets[index + 1]]
+        element_nodes = [
+            nodes.Node(self._mesh, int(node_ids[i]), int(i), coordinates[i])
+            for i in node_indices
+            if i >= 0
+        ]
+        element_type = int(types[index]) if types is not None else None
+        return Element(self._mesh, int(ids[index]), index, element_nodes, element_type)
+
+    def _clear_prefetch(self):
+        """Clear the cached arrays after a modification of the mesh."""
+        self._arrays_cache = None
+        self._nodes = None
+        self._mapping_id_to_index = None
+
     @property
     def n_elements(self) -> int:
         """Number of elements"""
@@ -606,13 +708,16 @@ class Elements:
 
     def _build_mapping_id_to_index(self):
         """Retrieve the mapping between the IDs and indices of the entity."""
-        return {eid: i for i, eid in enumerate(self.scoping.ids)}
+        ids = self._arrays_cache[0] if self._arrays_cache is not None else self.scoping.ids
+        return IdToIndexMap(ids)
 
     @property
-    def mapping_id_to_index(self) -> dict:
+    def mapping_id_to_index(self) -> IdToIndexMap:
         """
         Mapping between the IDs and indices of the entity.
 
+        The mapping is backed by NumPy arrays and behaves as a read-only dictionary.
+
         This property is useful for mapping scalar results from a field to the meshed region.
 
         Examples
@@ -661,10 +766,7 @@ class Elements:
         """
         if external_scope.location in ["Nodal", "NodalElemental"]:
             raise ValueError('Input scope location must be "Nodal"')
-        arr = np.array(list(map(self.mapping_id_to_index.get, external_scope.ids)))
-        mask = arr != None
-        ind = arr[mask].astype(np.int32)
-        return ind, mask
+        return self.mapping_id_to_index.lookup(external_scope.ids)
 
     @property
     def has_shell_elements(self) -> bool:
@@ -5,7 +5,8 @@ Faces
 =====
 """
 import numpy as np
-from ansys.dpf.core import scoping
+from ansys.dpf.core import nodes, scoping
+from ansys.dpf.core._id_index import IdToIndexMap
 from ansys.dpf.core.common import face_properties
 from ansys.dpf.core.elements import element_types
 from ansys.dpf.core.check_version import version_requires
@@ -30,6 +31,9 @@ class Face:
         Fortran-based (1-based) index of the face in the result.
     nodes : list
         List of DPF nodes belonging to the face.
+    face_type : int, optional
+        Type of the face when it is already known. If ``None``, the type is
+        requested from the server when needed.
 
     Examples
     --------
@@ -51,11 +55,12 @@ class Face:
     Class available with server's version starting at 7.0 (2024 R1 pre0).
     """
 
-    def __init__(self, mesh, faceid, index, nodes):
+    def __init__(self, mesh, faceid, index, nodes, face_type=None):
         self._id = faceid
         self._index = index
         self._nodes = nodes
         self._mesh = mesh
+        self._type = face_type
 
     @property
     def node_ids(self):
@@ -173,6 +178,8 @@ class Face:
 
     def _get_type(self):
         """Retrieve the Ansys element type."""
+        if self._type is not None:
+            return element_types(self._type)
         return element_types(
             self._mesh.property_field(face_properties.faces_type).get_entity_data(self._index)[0]
         )
@@ -222,6 +229,8 @@ class Faces:
         self._mesh = mesh
         self._server = mesh._server
         self._mapping_id_to_index = None
+        self._arrays_cache = None
+        self._nodes = None
 
     def __str__(self):
         return "DPF Faces object with %d faces" % len(self)
@@ -234,8 +243,9 @@ class Faces:
         return self.n_faces
 
     def __iter__(self):
-        for i in range(len(self)):
-            yield self[i]
+        ids = self.to_arrays()[0]
+        for index in range(len(ids)):
+            yield self._face_from_arrays(index)
 
     def face_by_id(self, id) -> Face:
         """
@@ -294,6 +304,12 @@ class Faces:
         -------
         face : Face
         """
+        if self._arrays_cache is not None:
+            if faceindex is None:
+                if faceid not in self.mapping_id_to_index:
+                    raise ValueError("face not found")
+                faceindex = self.mapping_id_to_index[faceid]
+            return self._face_from_arrays(faceindex)
         if faceindex is None:
             faceindex = self._mesh.property_field(face_properties.faces_type).scoping.index(faceid)
             if (faceindex < 0):
@@ -379,15 +395,83 @@ class Faces:
         """Number of faces"""
         return self._mesh._api.meshed_region_get_num_faces(self._mesh)
 
+    def to_arrays(self):
+        """
+        Retrieve the IDs, types and connectivity of all the faces as arrays.
+
+        The faces type field and the faces nodes connectivity field are requested
+        once and cached on this collection, so that iterating over it or retrieving
+        faces afterwards does not require any additional request to the server.
+
+        Returns
+        -------
+        ids : numpy.ndarray
+            IDs of the faces ordered by index.
+        types : numpy.ndarray
+            Types of the faces ordered by index. See
+            :class:`ansys.dpf.core.elements.element_types`.
+        offsets : numpy.ndarray
+            Offsets of the connectivity of each face in ``connectivity``, of
+            size ``n_faces + 1``.
+        connectivity : numpy.ndarray
+            Flat array of the node indices of all the faces.
+
+        Examples
+        --------
+        >>> import ansys.dpf.core as dpf
+        >>> from ansys.dpf.core import examples
+        >>> model = dpf.Model(examples.fluid_axial_model())
+        >>> faces = model.metadata.meshed_region.faces
+        >>> ids, types, offsets, connectivity = faces.to_arrays()
+        >>> ids.size
+        44242
+        >>> connectivity[offsets[1] : offsets[2]]
+        array([11415, 11347, 11387, 11454]...)
+
+        """
+        if self._arrays_cache is None:
+            faces_type_field = self.faces_type_field
+            ids = np.asarray(faces_type_field.scoping.ids)
+            types = np.asarray(faces_type_field.data).ravel()
+            offsets = np.zeros(ids.size + 1, dtype=np.int32)
+            connectivity = np.empty(0, dtype=np.int32)
+            if ids.size > 0:
+                connectivity_field = self.faces_nodes_connectivity_field
+                connectivity = np.asarray(connectivity_field.data).ravel()
+                data_pointer = np.asarray(connectivity_field._data_pointer).ravel()
+                if data_pointer.size >= ids.size:
+                    offsets[:-1] = data_pointer[: ids.size]
+                    offsets[-1] = connectivity.size
+                else:
+                    offsets = np.arange(ids.size + 1, dtype=np.int32)
+                    offsets *= connectivity.size // ids.size
+            self._arrays_cache = (ids, types, offsets, connectivity)
+        return self._arrays_cache
+
+    def _face_from_arrays(self, index):
+        """Build a face from the cached arrays without any request to the server."""
+        ids, types, offsets, connectivity = self.to_arrays()
+        if self._nodes is None:
+            self._nodes = self._mesh.nodes
+        node_ids, coordinates = self._nodes._prefetch()
+        face_nodes = [
+            nodes.Node(self._mesh, int(node_ids[i]), int(i), coordinates[i])
+            for i in connectivity[offsets[index] : offsets[index + 1]]
+        ]
+        return Face(self._mesh, int(ids[index]), index, face_nodes, int(types[index]))
+
     def _build_mapping_id_to_index(self):
         """Retrieve the mapping between the IDs and indices of the entity."""
-        return {eid: i for i, eid in enumerate(self.scoping.ids)}
+        ids = self._arrays_cache[0] if self._arrays_cache is not None else self.scoping.ids
+        return IdToIndexMap(ids)
 
     @property
-    def mapping_id_to_index(self) -> dict:
+    def mapping_id_to_index(self) -> IdToIndexMap:
         """
         Mapping between the IDs and indices of the entity.
 
+        The mapping is backed by NumPy arrays and behaves as a read-only dictionary.
+
         This property is useful for mapping scalar results from a field to the meshed region.
 
         Examples
@@ -436,7 +520,4 @@ class Faces:
         """
         if external_scope.location in ["Nodal", "NodalElemental", "Elemental", "ElementalNodal"]:
             raise ValueError('Input scope location must be "Faces"')
-        arr = np.array(list(map(self.mapping_id_to_index.get, external_scope.ids)))
-        mask = arr != None
-        ind = arr[mask].astype(np.int32)
-        return ind, mask
+        return self.mapping_id_to_index.lookup(external_scope.ids)
@@ -11,6 +11,7 @@ from ansys.dpf.core import errors, meshed_region, time_freq_support, scoping
 from ansys.dpf.core import dimensionality
 from ansys.dpf.core.common import locations, natures, types, _get_size_of_list
 from ansys.dpf.core.field_base import _FieldBase, _LocalFieldBase
+from ansys.dpf.core.output_cache import _modifies_instance
 from ansys.dpf.core.field_definition import FieldDefinition
 from ansys.dpf.gate import (
     field_abstract_api,
@@ -272,6 +273,7 @@ class Field(_FieldBase):
             return self.field_definition.location
 
     @location.setter
+    @_modifies_instance
     def location(self, value):
         """Change the field location.
 
@@ -344,7 +346,7 @@ class Field(_FieldBase):
             self._api.csfield_get_entity_data_for_dpf_vector(
                 self, vec, vec.internal_data, vec.internal_size, index
             )
-            data = dpf_array.DPFArray(vec)
+            data = self._as_dpf_array(vec)
 
         except NotImplementedError:
             data = self._api.csfield_get_entity_data(self, index)
@@ -359,7 +361,7 @@ class Field(_FieldBase):
             self._api.csfield_get_entity_data_by_id_for_dpf_vector(
                 self, vec, vec.internal_data, vec.internal_size, id
             )
-            data = dpf_array.DPFArray(vec)
+            data = self._as_dpf_array(vec)
 
         except NotImplementedError:
             index = self.scoping.index(id)
@@ -371,6 +373,7 @@ class Field(_FieldBase):
             data.shape = (data.size // n_comp, n_comp)
         return data
 
+    @_modifies_instance
     def append(self, data, scopingid):
         if isinstance(data, list):
             if isinstance(data[0], list):
@@ -383,7 +386,7 @@ class Field(_FieldBase):
             self._api.csfield_get_data_pointer_for_dpf_vector(
                 self, vec, vec.internal_data, vec.internal_size
             )
-            return dpf_array.DPFArray(vec)
+            return self._as_dpf_array(vec)
 
         except NotImplementedError:
             return self._api.csfield_get_data_pointer(self, True)
@@ -397,7 +400,7 @@ class Field(_FieldBase):
             self._api.csfield_get_data_for_dpf_vector(
                 self, vec, vec.internal_data, vec.internal_size
             )
-            data = dpf_array.DPFArray(vec) if np_array else dpf_array.DPFArray(vec).tolist()
+            data = self._as_dpf_array(vec) if np_array else dpf_array.DPFArray(vec).tolist()
         except NotImplementedError:
             data = self._api.csfield_get_data(self, np_array)
         n_comp = self.component_count
@@ -405,6 +408,60 @@ class Field(_FieldBase):
             data.shape = (data.size // n_comp, n_comp)
         return data
 
+    def read_data_into(self, out):
+        """Read the data of the field into a preallocated array or a memory-mapped file.
+
+        With a :class:`ansys.dpf.core.server_types.LegacyGrpcServer`, the streamed
+        chunks are copied directly into ``out``, without intermediate arrays. With
+        the other servers, the data is retrieved in a DPF vector and copied once into
+        ``out``.
+
+        Parameters
+        ----------
+        out : numpy.ndarray, str, os.PathLike
+            Writable C-contiguous array of floats holding at least ``field.size``
+            values, or path of a file to memory-map with the data.
+
+        Returns
+        -------
+        numpy.ndarray
+            View on ``out``, or memory-mapped array, holding the data with the shape
+            of :attr:`data`.
+
+        Raises
+        ------
+        ValueError
+            If ``out`` is not a writable C-contiguous array of floats, or if it is too
+            small to hold the data.
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> from ansys.dpf import core as dpf
+        >>> from ansys.dpf.core import examples
+        >>> model = dpf.Model(examples.find_simple_bar())
+        >>> disp = model.results.displacement().outputs.fields_container()[0]
+        >>> buffer = np.empty(disp.size)
+        >>> data = disp.read_data_into(buffer)
+
+        """
+        from ansys.dpf.gate.grpc_stream_helpers import _receive_buffer
+
+        try:
+            vec = dpf_vector.DPFVectorDouble(client=self._server.client)
+            self._api.csfield_get_data_for_dpf_vector(
+                self, vec, vec.internal_data, vec.internal_size
+            )
+            source = np.asarray(dpf_array.DPFArray(vec)).reshape(-1)
+            data = _receive_buffer(out, source.size, source.dtype)[: source.size]
+            data[:] = source
+        except NotImplementedError:
+            data = self._api.csfield_get_data(self, True, out=out)
+        n_comp = self.component_count
+        if n_comp != 1 and data.size != 0:
+            data.shape = (data.size // n_comp, n_comp)
+        return data
+
     def _set_data(self, data):
         if isinstance(data, list):
             if all(isinstance(d, list) for d in data):
@@ -632,6 +689,7 @@ class Field(_FieldBase):
         return self._field_definition
 
     @field_definition.setter
+    @_modifies_instance
     def field_definition(self, value):
         return self._set_field_definition(value)
 
@@ -1,5 +1,6 @@
 import traceback
 import warnings
+import weakref
 
 from abc import abstractmethod
 from ansys.dpf.gate.generated import field_abstract_api
@@ -9,9 +10,15 @@ from ansys.dpf.core.common import natures, locations
 from ansys.dpf.core import errors
 from ansys.dpf.core import server as server_module
 from ansys.dpf.core.cache import _setter
+from ansys.dpf.core.output_cache import (
+    _modifies_instance,
+    _reset_instance_token,
+    _reset_token_on_write_back,
+)
 from ansys.dpf.gate import (
     data_processing_capi,
     data_processing_grpcapi,
+    dpf_array,
 )
 
 import numpy as np
@@ -279,6 +286,7 @@ class _FieldBase:
         return self._get_scoping()
 
     @scoping.setter
+    @_modifies_instance
     def scoping(self, scoping):
         return self._set_scoping(scoping)
 
@@ -357,6 +365,107 @@ class _FieldBase:
         """
         pass
 
+    def get_entities_data(self, indices):
+        """Retrieve the data of several entities from their indices in the scoping.
+
+        The data, data pointer and scoping of the field are retrieved once, and the
+        data of the entities is gathered client side.
+
+        Parameters
+        ----------
+        indices : list[int], numpy.ndarray
+            Indices of the entities in the scoping.
+
+        Returns
+        -------
+        data : numpy.ndarray
+            Data of the entities stacked in the order of the indices.
+        offsets : numpy.ndarray
+            Index of the first elementary data of each entity in ``data``, followed by the
+            total number of elementary data. The data of the i-th entity is
+            ``data[offsets[i]:offsets[i + 1]]``.
+
+        Examples
+        --------
+        >>> from ansys.dpf import core as dpf
+        >>> from ansys.dpf.core import examples
+        >>> model = dpf.Model(examples.find_static_rst())
+        >>> stress_op = model.results.stress()
+        >>> field = stress_op.outputs.fields_container()[0]
+        >>> data, offsets = field.get_entities_data([0, 3])
+        >>> len(offsets)
+        3
+        >>> entity_3_data = data[offsets[1]:offsets[2]]
+
+        """
+        indices = np.asarray(indices, dtype=np.int64).reshape(-1)
+        n_comp = self.component_count
+        flat_data = np.asarray(self.data).reshape(-1)
+        data_pointer = np.asarray(self._data_pointer, dtype=np.int64).reshape(-1)
+        if data_pointer.size > 0:
+            n_entities = data_pointer.size
+            bounds = np.append(data_pointer, flat_data.size)
+        else:
+            n_entities = flat_data.size // n_comp
+            bounds = None
+        if indices.size > 0 and (indices.min() < 0 or indices.max() >= n_entities):
+            raise ValueError(
+                f"Requested indices must be between 0 and the number of entities {n_entities}."
+            )
+        if bounds is None:
+            lengths = np.full(indices.size, n_comp, dtype=np.int64)
+            starts = indices * n_comp
+        else:
+            starts = bounds[indices]
+            lengths = bounds[indices + 1] - starts
+        offsets = np.zeros(indices.size + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        positions = np.repeat(starts - offsets[:-1], lengths) + np.arange(offsets[-1])
+        data = flat_data[positions]
+        if n_comp > 1:
+            data = data.reshape(data.size // n_comp, n_comp)
+        return data, offsets // n_comp
+
+    def get_entities_data_by_ids(self, ids):
+        """Retrieve the data of several entities from their IDs.
+
+        The data, data pointer and scoping of the field are retrieved once, and the
+        data of the entities is gathered client side.
+
+        Parameters
+        ----------
+        ids : list[int], numpy.ndarray
+            IDs of the entities.
+
+        Returns
+        -------
+        data : numpy.ndarray
+            Data of the entities stacked in the order of the IDs.
+        offsets : numpy.ndarray
+            Index of the first elementary data of each entity in ``data``, followed by the
+            total number of elementary data. The data of the i-th entity is
+            ``data[offsets[i]:offsets[i + 1]]``.
+
+        Examples
+        --------
+        >>> from ansys.dpf import core as dpf
+        >>> from ansys.dpf.core import examples
+        >>> model = dpf.Model(examples.find_static_rst())
+        >>> disp_op = model.results.displacement()
+        >>> field = disp_op.outputs.fields_container()[0]
+        >>> data, offsets = field.get_entities_data_by_ids([1, 2, 3])
+        >>> data.shape
+        (3, 3)
+
+        """
+        from ansys.dpf.core._id_index import IdToIndexMap
+
+        ids = np.asarray(ids).reshape(-1)
+        indices, mask = IdToIndexMap(self.scoping.ids).lookup(ids)
+        if not mask.all():
+            raise ValueError(f"The ids {ids[~mask].tolist()} don't exist in the scoping")
+        return self.get_entities_data(indices)
+
     @abstractmethod
     def append(self, data, scopingid):
         """Add an entity data to the existing data.
@@ -433,6 +542,7 @@ class _FieldBase:
         return self._data_pointer.tolist()
 
     @_data_pointer.setter
+    @_modifies_instance
     def _data_pointer(self, data):
         self._set_data_pointer(data)
 
@@ -483,9 +593,15 @@ class _FieldBase:
         return self._get_data(np_array=False)
 
     @data.setter
+    @_modifies_instance
     def data(self, data):
         self._set_data(data)
 
+    def _as_dpf_array(self, vec):
+        """Wrap a vector of the field's data, which the field tracks the modifications of."""
+        _reset_token_on_write_back(vec, self)
+        return dpf_array.DPFArray(vec)
+
     @abstractmethod
     def _get_data(self, np_array=True):
         pass
@@ -514,15 +630,50 @@ class _LocalFieldBase(_FieldBase):
     """
 
     def __init__(self, field):
+        self._source_field = weakref.ref(field)
         self.__cache_data__(field)
 
     def __cache_data__(self, field):
         self._ncomp = super().component_count
-        self._data_copy = super().data_as_list
-        self._num_entities_reserved = len(self._data_copy)
-        self._data_pointer_copy = super()._get_data_pointer().tolist()
+        self._dtype = np.int32 if self._is_property_field else np.float64
+        self._data_buffer = np.array(self._get_data(), dtype=self._dtype).reshape(-1)
+        self._data_size = self._data_buffer.size
+        data_pointer = super()._get_data_pointer()
+        self._data_pointer_buffer = np.array(data_pointer, dtype=np.int32).reshape(-1)
+        self._n_data_pointers = self._data_pointer_buffer.size
         self._scoping_copy = super().scoping.as_local_scoping()
-        self._has_data_pointer = len(self._data_pointer_copy) > 0
+        self._has_data_pointer = self._n_data_pointers > 0
+
+    @property
+    def _data_copy(self):
+        return self._data_buffer[: self._data_size]
+
+    @property
+    def _data_pointer_copy(self):
+        return self._data_pointer_buffer[: self._n_data_pointers]
+
+    @staticmethod
+    def _grow(buffer, used, size):
+        """Return ``buffer``, or a geometrically grown copy of it, able to hold ``size`` values."""
+        if size <= buffer.size:
+            return buffer
+        grown = np.empty(max(size, 2 * buffer.size, 16), dtype=buffer.dtype)
+        grown[:used] = buffer[:used]
+        return grown
+
+    def _extend_data(self, data):
+        end = self._data_size + data.size
+        self._data_buffer = self._grow(self._data_buffer, self._data_size, end)
+        self._data_buffer[self._data_size : end] = data
+        self._data_size = end
+
+    def _extend_data_pointer(self, data_pointer):
+        end = self._n_data_pointers + data_pointer.size
+        self._data_pointer_buffer = self._grow(
+            self._data_pointer_buffer, self._n_data_pointers, end
+        )
+        self._data_pointer_buffer[self._n_data_pointers : end] = data_pointer
+        self._n_data_pointers = end
 
     @property
     def _num_entities(self):
@@ -540,7 +691,7 @@ class _LocalFieldBase(_FieldBase):
             Length of the data vector.
 
         """
-        return len(self._data_copy)
+        return self._data_size
 
     def get_entity_data(self, index):
         """Retrieve the elementary data of the scoping's index as an array.
@@ -584,18 +735,15 @@ class _LocalFieldBase(_FieldBase):
                 f"available indices {len(self._scoping_copy)}"
             )
         if self._has_data_pointer:
-            first_index = self._data_pointer_copy[index]
-            if index < len(self._data_pointer_copy) - 1:
-                last_index = self._data_pointer_copy[index + 1] - 1
+            first_index = self._data_pointer_buffer[index]
+            if index < self._n_data_pointers - 1:
+                last_index = self._data_pointer_buffer[index + 1] - 1
             else:
-                last_index = len(self._data_copy) - 1
+                last_index = self._data_size - 1
         else:
             first_index = self._ncomp * index
             last_index = self._ncomp * (index + 1) - 1
-        if self._is_property_field:
-            array = np.array(self._data_copy[first_index : last_index + 1], dtype=np.int32)
-        else:
-            array = np.array(self._data_copy[first_index : last_index + 1])
+        array = self._data_buffer[first_index : last_index + 1].copy()
 
         if self._ncomp > 1:
             return array.reshape((array.size // self._ncomp, self._ncomp))
@@ -672,24 +820,82 @@ class _LocalFieldBase(_FieldBase):
                 data = np.array(data, dtype=np.int32)
             if not isinstance(data[0], int) and not isinstance(data[0], np.int32):
                 raise errors.InvalidTypeError("data", "list of int")
-        if (len(data) > 0 and isinstance(data, list)) or isinstance(data, (np.ndarray, np.generic)):
-            data = np.array(data).flatten().tolist()
+        data = np.asarray(data, dtype=self._dtype).reshape(-1)
 
-        data_size = len(self._data_copy)
+        data_size = self._data_size
         self._scoping_copy.append(scopingid)
-        if len(self._data_pointer_copy) > 0:
-            self._data_pointer_copy.append(data_size)
+        if self._n_data_pointers > 0:
+            self._extend_data_pointer(np.array([data_size], dtype=np.int32))
 
-        self._data_copy.extend(data)
+        self._extend_data(data)
         if self._has_data_pointer == False:
-            if isinstance(data, (np.ndarray, np.generic)):
-                data_size = data.size
-            else:
-                data_size = len(data)
-            if data_size > self._ncomp:
-                self._data_pointer_copy = [i * self._ncomp for i in range(0, self._num_entities)]
+            if data.size > self._ncomp:
+                self._n_data_pointers = 0
+                self._extend_data_pointer(
+                    np.arange(self._num_entities, dtype=np.int32) * self._ncomp
+                )
                 self._has_data_pointer = True
 
+    @_setter
+    def append_entities(self, ids, data, n_elementary_data=None):
+        """Add the data of several entities to the existing data.
+
+        Parameters
+        ----------
+        ids : list[int], numpy.ndarray
+            IDs of the entities.
+        data : numpy.ndarray
+            Data of the entities, stacked in the order of the IDs.
+        n_elementary_data : list[int], numpy.ndarray, optional
+            Number of elementary data of each entity, for example the number of nodes
+            of each element for an ``ElementalNodal`` field. By default, the data is
+            split evenly between the entities.
+
+        Examples
+        --------
+        >>> from ansys.dpf import core as dpf
+        >>> import numpy as np
+        >>> num_entities = 100
+        >>> field_to_local = dpf.fields_factory.create_3d_vector_field(num_entities)
+        >>> with field_to_local.as_local_field() as f:
+        ...     f.append_entities(np.arange(1, num_entities + 1), np.ones((num_entities, 3)))
+        >>> field_to_local.scoping.size
+        100
+
+        """
+        ids = np.asarray(ids, dtype=np.int32).reshape(-1)
+        data = np.asarray(data, dtype=self._dtype).reshape(-1)
+        if n_elementary_data is None:
+            entity_size = max(ids.size, 1) * self._ncomp
+            if data.size % entity_size != 0 or (ids.size == 0 and data.size != 0):
+                raise ValueError(
+                    f"Data of size {data.size} cannot be split between {ids.size} entities "
+                    f"with {self._ncomp} components."
+                )
+            n_elementary_data = np.full(ids.size, data.size // entity_size)
+        else:
+            n_elementary_data = np.asarray(n_elementary_data).reshape(-1)
+            if n_elementary_data.size != ids.size or n_elementary_data.sum() * self._ncomp != (
+                data.size
+            ):
+                raise ValueError(
+                    "The numbers of elementary data do not match the IDs and the data size."
+                )
+        if ids.size == 0:
+            return
+        entity_sizes = n_elementary_data * self._ncomp
+        if not self._has_data_pointer and np.any(entity_sizes > self._ncomp):
+            self._n_data_pointers = 0
+            self._extend_data_pointer(np.arange(self._num_entities, dtype=np.int32) * self._ncomp)
+            self._has_data_pointer = True
+        if self._has_data_pointer:
+            offsets = np.empty(ids.size, dtype=np.int64)
+            offsets[0] = 0
+            np.cumsum(entity_sizes[:-1], out=offsets[1:])
+            self._extend_data_pointer((offsets + self._data_size).astype(np.int32))
+        self._scoping_copy.append_many(ids)
+        self._extend_data(data)
+
     def data_as_list(self):
         """Retrieve the data in the field as a Python list.
 
@@ -711,7 +917,7 @@ class _LocalFieldBase(_FieldBase):
         ...     my_data_list = f.data_as_list
 
         """
-        return self._data_copy
+        return self._data_copy.tolist()
 
     @property
     def data(self):
@@ -743,11 +949,9 @@ class _LocalFieldBase(_FieldBase):
         """
 
         if self._ncomp > 1:
-            return np.array(self._data_copy).reshape(
-                len(self._data_copy) // self._ncomp, self._ncomp
-            )
+            return self._data_copy.reshape(self._data_size // self._ncomp, self._ncomp).copy()
         else:
-            return np.array(self._data_copy)
+            return self._data_copy.copy()
 
     @data.setter
     @_setter
@@ -762,12 +966,8 @@ class _LocalFieldBase(_FieldBase):
                         f"An array of shape {self.shape} is expected and "
                         f"shape {data.shape} was input"
                     )
-        if isinstance(data, (np.ndarray, np.generic)):
-            self._data_copy = data.flatten().tolist()
-        elif len(data) > 0 and isinstance(data, list):
-            self._data_copy = np.array(data).flatten().tolist()
-        else:
-            self._data_copy = data
+        self._data_buffer = np.array(data, dtype=self._dtype).reshape(-1)
+        self._data_size = self._data_buffer.size
 
     @property
     def elementary_data_count(self):
@@ -779,8 +979,8 @@ class _LocalFieldBase(_FieldBase):
            Number of elementary data in the field.
 
         """
-        if hasattr(self, "_data_copy"):
-            return len(self._data_copy) / self._ncomp
+        if hasattr(self, "_data_buffer"):
+            return self._data_size // self._ncomp
         else:
             return super().elementary_data_count
 
@@ -805,7 +1005,7 @@ class _LocalFieldBase(_FieldBase):
         numpy.ndarray
             Array of first indexes of each entity data.
         """
-        return np.array(self._data_pointer_copy)
+        return self._data_pointer_copy.copy()
 
     @property
     def _data_pointer_as_list(self):
@@ -816,15 +1016,13 @@ class _LocalFieldBase(_FieldBase):
         List
             List of first indexes of each entity data.
         """
-        return self._data_pointer_copy
+        return self._data_pointer_copy.tolist()
 
     @_data_pointer.setter
     @_setter
     def _data_pointer(self, data):
-        if isinstance(data, (np.ndarray, np.generic)):
-            self._data_pointer_copy = data.tolist()
-        else:
-            self._data_pointer_copy = data
+        self._data_pointer_buffer = np.array(data, dtype=np.int32).reshape(-1)
+        self._n_data_pointers = self._data_pointer_buffer.size
         if self._has_data_pointer == False and len(data) > 0:
             self._has_data_pointer = True
 
@@ -870,6 +1068,9 @@ class _LocalFieldBase(_FieldBase):
             super()._set_data_pointer(self._data_pointer_copy)
             super()._set_scoping(self._scoping_copy)
             self._scoping_copy = None
+            source_field = self._source_field()
+            if source_field is not None:
+                _reset_instance_token(source_field)
 
     def __enter__(self):
         return self
@@ -0,0 +1,243 @@
+"""
+.. _ref_level_of_detail:
+
+LevelOfDetail
+=============
+Plot large meshes through a reduced surface mesh, extracted and optionally
+decimated on the server, while keeping the full-resolution mesh for probing.
+"""
+import numpy as np
+
+from ansys.dpf import core
+from ansys.dpf.core.common import locations
+
+_SURFACE_METHODS = ("skin", "external_layer")
+
+
+class LevelOfDetail:
+    """Reduced surface mesh plotted in place of a large mesh.
+
+    Only the surface of a mesh is visible, so meshes with solid elements are
+    replaced by their skin, extracted with the ``skin`` operator, or by their
+    external layer of solid elements, extracted with the ``external_layer``
+    operator. When the surface still has more cells than ``max_cells``, the skin
+    is decimated into triangles with the ``decimate_mesh`` operator.
+
+    The fields of the full-resolution mesh are mapped on the reduced mesh with
+    :func:`map_field`, and can be evaluated at any coordinates with
+    :func:`probe`, which uses the full-resolution mesh.
+
+    Parameters
+    ----------
+    meshed_region : MeshedRegion
+        Full-resolution mesh.
+    max_cells : int, optional
+        Target number of cells of the reduced mesh. The number of cells after the
+        decimation is only approximately met. The default is ``None``, in which
+        case the surface is not decimated.
+    method : str, optional
+        Surface extracted from the meshes with solid elements, either ``"skin"``,
+        made of the faces of the solid elements, or ``"external_layer"``, made of
+        the solid elements on the surface, which keep their IDs. The skin is always
+        used when the surface is decimated. The default is ``"skin"``.
+    aggressiveness : int, optional
+        Aggressiveness of the decimation, between ``0`` and ``150``. Lower values
+        give a better quality mesh in a longer time. The default is ``None``, in
+        which case the default of the ``decimate_mesh`` operator is used.
+
+    Examples
+    --------
+    Plot the stress of a model on the skin of its mesh decimated to 1000 cells,
+    and evaluate the stress of the full-resolution mesh at a point.
+
+    >>> from ansys.dpf import core as dpf
+    >>> from ansys.dpf.core import examples
+    >>> from ansys.dpf.core.level_of_detail import LevelOfDetail
+    >>> from ansys.dpf.core.plotter import DpfPlotter
+    >>> model = dpf.Model(examples.find_static_rst())
+    >>> mesh = model.metadata.meshed_region
+    >>> stress = model.results.stress.eqv().eval()[0]
+    >>> lod = LevelOfDetail(mesh, max_cells=1000)
+    >>> pl = DpfPlotter()
+    >>> pl.add_field(stress, mesh, lod=lod)
+    >>> probed = lod.probe(stress, [[0.015, 0.045, 0.015]])
+
+    """
+
+    def __init__(self, meshed_region, max_cells=None, method="skin", aggressiveness=None):
+        if method not in _SURFACE_METHODS:
+            raise ValueError(f"method must be one of {_SURFACE_METHODS}, not {method!r}.")
+        if max_cells is not None and max_cells < 1:
+            raise ValueError("max_cells must be at least 1.")
+        self._meshed_region = meshed_region
+        self._max_cells = max_cells
+        self._method = method
+        self._aggressiveness = aggressiveness
+        self._reduced_mesh = None
+        self._reduction = None
+
+    @property
+    def meshed_region(self):
+        """Full-resolution mesh.
+
+        Returns
+        -------
+        MeshedRegion
+        """
+        return self._meshed_region
+
+    @property
+    def reduced_mesh(self):
+        """Reduced mesh, built on the server when first requested.
+
+        Returns
+        -------
+        MeshedRegion
+        """
+        self._ensure_reduced()
+        return self._reduced_mesh
+
+    def _ensure_reduced(self):
+        """Build the reduced mesh on the server unless it is already built."""
+        if self._reduced_mesh is None:
+            self._reduced_mesh, self._reduction = self._reduce()
+
+    @property
+    def is_decimated(self):
+        """Whether the reduced mesh is decimated.
+
+        Returns
+        -------
+        bool
+        """
+        self._ensure_reduced()
+        return self._reduction == "decimate"
+
+    def _reduce(self):
+        """Build the reduced mesh and return it with the name of the reduction."""
+        mesh = self._meshed_region
+        server = mesh._server
+        if not mesh.elements.has_solid_elements:
+            surface, reduction = mesh, None
+        else:
+            surface = self._extract_surface(self._method)
+            reduction = self._method
+        if self._max_cells is None or surface.elements.n_elements <= self._max_cells:
+            return surface, reduction
+        if reduction == "external_layer":
+            surface = self._extract_surface("skin")
+        decimate_op = core.operators.mesh.decimate_mesh(
+            mesh=surface,
+            preservation_ratio=self._max_cells / surface.elements.n_elements,
+            server=server,
+        )
+        if self._aggressiveness is not None:
+            decimate_op.inputs.aggressiveness.connect(self._aggressiveness)
+        return decimate_op.outputs.mesh(), "decimate"
+
+    def _extract_surface(self, method):
+        mesh = self._meshed_region
+        if method == "skin":
+            surface_op = core.operators.mesh.skin(mesh=mesh, server=mesh._server)
+        else:
+            surface_op = core.operators.mesh.external_layer(mesh=mesh, server=mesh._server)
+        return surface_op.outputs.mesh()
+
+    def map_field(self, field):
+        """Map a field of the full-resolution mesh on the reduced mesh.
+
+        Nodal fields are rescoped on the nodes of the skin and elemental fields on
+        its faces. The external layer keeps the IDs of the nodes and elements, so
+        the fields are returned unchanged. On a decimated mesh, the fields are
+        averaged to the nodes and interpolated at the nodes of the reduced mesh.
+
+        Parameters
+        ----------
+        field : Field, FieldsContainer, Result, Operator
+            Field of the full-resolution mesh, or fields container, result or
+            operator whose fields are mapped.
+
+        Returns
+        -------
+        Field or FieldsContainer
+            Field, or fields container with the same labels, on the reduced mesh.
+        """
+        if hasattr(field, "eval"):
+            field = field.eval()
+        if isinstance(field, core.FieldsContainer):
+            fields_container = core.FieldsContainer(server=field._server)
+            fields_container.set_labels(field.labels)
+            for index, entry in enumerate(field):
+                fields_container.add_field(field.get_label_space(index), self.map_field(entry))
+            return fields_container
+        reduced_mesh = self.reduced_mesh
+        if field.location == locations.overall or self._reduction in (None, "external_layer"):
+            return field
+        if field.location == locations.faces:
+            raise ValueError("Fields located on faces cannot be mapped on a reduced mesh.")
+        if self._reduction == "skin":
+            return core.operators.mapping.solid_to_skin(
+                field=field,
+                mesh=reduced_mesh,
+                solid_mesh=self._meshed_region,
+                server=field._server,
+            ).outputs.field()
+        if field.location != locations.nodal:
+            field = core.operators.averaging.to_nodal(field=field, server=field._server).eval()
+        return self._interpolate(field, reduced_mesh.nodes.coordinates_field)
+
+    def probe(self, field, coordinates):
+        """Evaluate a field of the full-resolution mesh at coordinates.
+
+        The field is interpolated with the shape functions of the elements of the
+        full-resolution mesh, for example at the coordinates of a point picked on
+        the reduced mesh.
+
+        Parameters
+        ----------
+        field : Field
+            Field of the full-resolution mesh.
+        coordinates : Field, list, numpy.ndarray
+            Coordinates of the points, as a nodal 3D vector field or an array of
+            shape ``(n_points, 3)``.
+
+        Returns
+        -------
+        Field
+            Values of the field at the points found in the mesh, scoped on the IDs of
+            the coordinates field or on the one-based indices of the points.
+        """
+        if not isinstance(coordinates, core.Field):
+            coordinates = core.fields_factory.field_from_array(
+                np.asarray(coordinates, dtype=float).reshape(-1, 3), server=field._server
+            )
+        return self._interpolate(field, coordinates)
+
+    def _interpolate(self, field, coordinates):
+        mapping_op = core.operators.mapping.on_coordinates(
+            fields_container=core.fields_container_factory.over_time_freq_fields_container(
+                [field], server=field._server
+            ),
+            coordinates=coordinates,
+            mesh=self._meshed_region,
+            server=field._server,
+        )
+        return mapping_op.outputs.fields_container()[0]
+
+
+def _as_level_of_detail(meshed_region, lod):
+    """Retrieve the level of detail of a mesh requested by a ``lod`` argument.
+
+    ``True`` gives the surface of the mesh, an integer the surface decimated to
+    this number of cells and a :class:`LevelOfDetail` is returned unchanged. The
+    levels of detail built from integers or ``True`` are cached on the mesh, so
+    that the surface is only extracted once.
+    """
+    if lod is None or lod is False or isinstance(lod, LevelOfDetail):
+        return lod or None
+    max_cells = None if lod is True else int(lod)
+    level_of_detail = meshed_region._levels_of_detail.get(max_cells)
+    if level_of_detail is None:
+        level_of_detail = LevelOfDetail(meshed_region, max_cells=max_cells)
+        meshed_region._levels_of_detail[max_cells] = level_of_detail
+    return level_of_detail
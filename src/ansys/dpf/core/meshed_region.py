@@ -4,6 +4,9 @@ MeshedRegion
 """
 import traceback
 import warnings
+from collections import OrderedDict
+
+import numpy as np
 
 import ansys.dpf.core.errors
 
@@ -19,9 +22,13 @@ from ansys.dpf.core.nodes import Nodes
 from ansys.dpf.core.faces import Faces
 from ansys.dpf.core.plotter import DpfPlotter, Plotter
 from ansys.dpf.core.cache import class_handling_cache
+from ansys.dpf.core.output_cache import _modifies_instance, _reset_instance_token
 from ansys.dpf.core import server as server_module
 from ansys.dpf.gate import meshed_region_capi, meshed_region_grpcapi
 
+# Number of scoping mappings kept per mesh for plotting.
+_SCOPING_MAPPINGS_MAX_SIZE = 16
+
 
 def update_grid(func):
     # Decorate mesh setters to centralize the update logic of pyvista objects.
@@ -34,6 +41,9 @@ def update_grid(func):
                 from ansys.dpf.core.vtk_helper import vtk_update_coordinates
 
                 vtk_update_coordinates(vtk_grid=mesh._full_grid, coordinates_array=args[1].data)
+        # The reduced meshes of the levels of detail are extracted again from the modified mesh.
+        mesh._levels_of_detail.clear()
+        _reset_instance_token(mesh)
 
         return func(*args, **kwargs)
 
@@ -111,6 +121,9 @@ class MeshedRegion:
                 self._internal_obj = self._api.meshed_region_new()
 
         self._full_grid = None
+        self._vtk_topologies = {}
+        self._scoping_mappings = OrderedDict()
+        self._levels_of_detail = {}
         self._elements = None
         self._nodes = None
         self.as_linear = None
@@ -231,6 +244,7 @@ class MeshedRegion:
         return self._get_unit()
 
     @unit.setter
+    @_modifies_instance
     def unit(self, value):
         """
         Unit type.
@@ -300,6 +314,7 @@ class MeshedRegion:
         """
         return self.field_of_properties(property_name)
 
+    @_modifies_instance
     @version_requires("3.0")
     def set_property_field(self, property_name, value):
         """
@@ -385,6 +400,7 @@ class MeshedRegion:
                     "model for server version 2.0. Please update your server."
                 )
 
+    @_modifies_instance
     @version_requires("3.0")
     def set_named_selection_scoping(self, named_selection_name, scoping):
         """
@@ -494,6 +510,75 @@ class MeshedRegion:
         self.as_linear = as_linear  # store as_linear to avoid passing through here again
         return grid
 
+    def _as_vtk_deformed(self, coordinates, as_linear=True):
+        """Convert the DPF mesh with deformed coordinates to a PyVista unstructured grid.
+
+        The cells of the mesh are only converted once per ``as_linear`` value: the
+        returned grid is a shallow copy of the cached one, sharing its cells, cell
+        types and offsets, with its own points set to the deformed coordinates.
+
+        Parameters
+        ----------
+        coordinates : Field
+            Deformed coordinates of the nodes, ordered as the nodes of the mesh.
+        as_linear : bool, optional
+            Export quadratic surface elements as linear.
+        """
+        import pyvista as pv
+
+        topology = self._vtk_topologies.get(as_linear)
+        if topology is None:
+            topology = self._as_vtk(self.nodes.coordinates_field, as_linear=as_linear)
+            self._vtk_topologies[as_linear] = topology
+        grid = topology.copy(deep=False)
+        # the shallow copy shares the points of the topology, which must not be modified
+        grid.SetPoints(pv.vtk_points(np.asarray(coordinates.data), deep=True))
+        self.as_linear = as_linear
+        return grid
+
+    def _map_scoping(self, mesh_location, external_scope):
+        """Retrieve the indices mapping a scoping to nodes, elements or faces of the mesh.
+
+        The result of ``mesh_location.map_scoping`` is cached on the mesh, keyed by a
+        hash of the IDs of the scoping, so that the fields sharing the same scoping,
+        such as the time steps of a result, are only mapped once. The least recently
+        used mappings are dropped once more than ``_SCOPING_MAPPINGS_MAX_SIZE`` are cached.
+
+        Parameters
+        ----------
+        mesh_location : Nodes, Elements, Faces
+            Entities of the mesh to map to.
+        external_scope : Scoping
+            Scoping to map.
+
+        Returns
+        -------
+        indices : numpy.ndarray
+            Read-only indices of the entities of the mesh matching the scoping.
+        mask : numpy.ndarray
+            Read-only mask of the IDs of the scoping found in the mesh.
+        """
+        from ansys.dpf.core.output_cache import _digest
+
+        ids = np.asarray(external_scope.ids)
+        key = (
+            type(mesh_location).__name__,
+            external_scope.location,
+            len(mesh_location),
+            _digest(ids),
+        )
+        mapping = self._scoping_mappings.get(key)
+        if mapping is not None:
+            self._scoping_mappings.move_to_end(key)
+            return mapping
+        mapping = mesh_location.map_scoping(external_scope)
+        for array in mapping:
+            array.setflags(write=False)
+        self._scoping_mappings[key] = mapping
+        if len(self._scoping_mappings) > _SCOPING_MAPPINGS_MAX_SIZE:
+            self._scoping_mappings.popitem(last=False)
+        return mapping
+
     @property
     def grid(self):
         """
@@ -531,6 +616,7 @@ class MeshedRegion:
         shell_layers=None,
         deform_by=None,
         scale_factor=1.0,
+        lod=None,
         **kwargs,
     ):
         """
@@ -547,6 +633,12 @@ class MeshedRegion:
             Defaults to None.
         scale_factor : float, optional
             Scaling factor to apply when warping the mesh. Defaults to 1.0.
+        lod : bool, int, LevelOfDetail, optional
+            Plot a reduced mesh instead of the full-resolution mesh. ``True`` plots
+            the skin of the mesh, an integer the skin decimated to about this number
+            of cells, and a :class:`ansys.dpf.core.level_of_detail.LevelOfDetail`
+            its reduced mesh. The fields are mapped on the reduced mesh. Defaults
+            to None.
         **kwargs : optional
             Additional keyword arguments for the plotter. For additional keyword
             arguments, see ``help(pyvista.plot)``.
@@ -563,11 +655,21 @@ class MeshedRegion:
         >>> model.metadata.meshed_region.plot(field)
 
         """
+        from ansys.dpf.core.level_of_detail import _as_level_of_detail
+
+        lod = _as_level_of_detail(self, lod)
         if field_or_fields_container is not None:
-            pl = Plotter(self, **kwargs)
+            mesh = self
+            if lod is not None:
+                mesh = lod.reduced_mesh
+                field_or_fields_container = lod.map_field(field_or_fields_container)
+                if deform_by:
+                    deform_by = lod.map_field(deform_by)
+            pl = Plotter(mesh, **kwargs)
             return pl.plot_contour(
                 field_or_fields_container,
                 shell_layers,
+                meshed_region=mesh,
                 show_axes=kwargs.pop("show_axes", True),
                 deform_by=deform_by,
                 scale_factor=scale_factor,
@@ -580,6 +682,7 @@ class MeshedRegion:
             self,
             deform_by=deform_by,
             scale_factor=scale_factor,
+            lod=lod,
             show_axes=kwargs.pop("show_axes", True),
             **kwargs,
         )
@@ -16,7 +16,11 @@ from ansys.dpf.core.results import Results, CommonResults
 from ansys.dpf.core.server_types import LOG
 from ansys.dpf.core import misc
 from ansys.dpf.core.errors import protect_source_op_not_found
-from ansys.dpf.core._model_helpers import DataSourcesOrStreamsConnector
+from ansys.dpf.core._model_helpers import (
+    DataSourcesOrStreamsConnector,
+    _data_sources_content_key,
+    _get_metadata_cache_entry,
+)
 from ansys.dpf.core.check_version import version_requires
 
 
@@ -255,6 +259,12 @@ class Model:
 class Metadata:
     """Contains the metadata of a data source.
 
+    The result information, mesh information, time frequency support and
+    available named selections read from result files are shared by all the
+    ``Metadata`` instances of a server which open the same files, as long as
+    these files are not modified. Files are identified by their path, size and
+    modification time, so this only applies to files accessible from the client.
+
     Parameters
     ----------
     data_sources : DataSources
@@ -277,15 +287,35 @@ class Metadata:
         self._mesh_provider_cached_instance = None
         self._cache_streams_provider()
 
+    def _shared_cache(self):
+        """Dictionary of the metadata shared with the other instances opening the same files."""
+        if self._shared_cache_entry is None:
+            key = _data_sources_content_key(self._data_sources)
+            if key is None:
+                self._shared_cache_entry = {}
+            else:
+                self._shared_cache_entry = _get_metadata_cache_entry(self._server, key)
+        return self._shared_cache_entry
+
+    def _load_shared(self, name, loader):
+        """Retrieve a metadata from the shared cache or load and store it."""
+        shared_cache = self._shared_cache()
+        value = shared_cache.get(name)
+        if value is None:
+            value = loader()
+            if value is not None:
+                shared_cache[name] = value
+        return value
+
     def _cache_result_info(self):
         """Store result information."""
         if not self._result_info:
-            self._result_info = self._load_result_info()
+            self._result_info = self._load_shared("result_info", self._load_result_info)
 
     def _cache_mesh_info(self):
         """Store mesh information."""
         if not self._mesh_info:
-            self._mesh_info = self._load_mesh_info()
+            self._mesh_info = self._load_shared("mesh_info", self._load_mesh_info)
 
     def _cache_streams_provider(self):
         """Create a stream provider and cache it."""
@@ -345,14 +375,20 @@ class Metadata:
 
         """
         if self._time_freq_support is None:
-            timeProvider = Operator("TimeFreqSupportProvider", server=self._server)
-            if self._stream_provider:
-                timeProvider.inputs.connect(self._stream_provider.outputs)
-            else:
-                timeProvider.inputs.connect(self.data_sources)
-            self._time_freq_support = timeProvider.get_output(0, types.time_freq_support)
+            self._time_freq_support = self._load_shared(
+                "time_freq_support", self._load_time_freq_support
+            )
         return self._time_freq_support
 
+    def _load_time_freq_support(self):
+        """Returns a time frequency support object"""
+        timeProvider = Operator("TimeFreqSupportProvider", server=self._server)
+        if self._stream_provider:
+            timeProvider.inputs.connect(self._stream_provider.outputs)
+        else:
+            timeProvider.inputs.connect(self.data_sources)
+        return timeProvider.get_output(0, types.time_freq_support)
+
     @property
     def data_sources(self):
         """Data sources instance.
@@ -414,6 +450,7 @@ class Metadata:
             self._data_sources = DataSources(var_inp, server=self._server)
         else:
             self._data_sources = DataSources(server=self._server)
+        self._shared_cache_entry = None
         self._cache_streams_provider()
 
     def _load_result_info(self):
@@ -568,7 +605,13 @@ class Metadata:
         -------
         named_selections : list str
         """
-        return self.meshed_region.available_named_selections
+        if self._meshed_region is not None:
+            return self._meshed_region.available_named_selections
+        named_selections = self._load_shared(
+            "available_named_selections",
+            lambda: self.meshed_region.available_named_selections,
+        )
+        return list(named_selections)
 
     def named_selection(self, named_selection):
         """Scoping containing the list of nodes or elements in the named selection.
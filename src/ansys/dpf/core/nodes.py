@@ -5,9 +5,9 @@ Nodes
 =====
 """
 import numpy as np
+from ansys.dpf.core._id_index import IdToIndexMap
 from ansys.dpf.core.common import nodal_properties, locations
 from ansys.dpf.core.check_version import version_requires
-from ansys.dpf.core.check_version import version_requires
 
 
 class Node:
@@ -25,8 +25,9 @@ class Node:
         ID of the node.
     index : int
         Index of the node.
-    coordinates : list
-        List of ``[x, y, z]`` coordinates for the node.
+    coordinates : list, numpy.ndarray
+        List of ``[x, y, z]`` coordinates for the node, or a row of the
+        coordinates array of the mesh.
 
     Examples
     --------
@@ -76,6 +77,8 @@ class Node:
         [0.015, 0.045, 0.015]
 
         """
+        if isinstance(self._coordinates, np.ndarray):
+            return self._coordinates.tolist()
         return self._coordinates
 
     @property
@@ -121,6 +124,8 @@ class Nodes:
         self._mesh = mesh
         self._server = mesh._server
         self._mapping_id_to_index = None
+        self._ids_cache = None
+        self._coordinates_cache = None
 
     def __str__(self):
         return f"DPF Node collection with {len(self)} nodes\n"
@@ -133,8 +138,9 @@ class Nodes:
         return self.n_nodes
 
     def __iter__(self):
-        for i in range(len(self)):
-            yield self[i]
+        ids, coordinates = self._prefetch()
+        for index in range(len(ids)):
+            yield Node(self._mesh, int(ids[index]), index, coordinates[index])
 
     def node_by_id(self, id):
         """Array of node coordinates ordered by ID."""
@@ -160,6 +166,12 @@ class Nodes:
         node : ansys.dpf.core.meshed_region.Node
             Requested node
         """
+        if self._ids_cache is not None:
+            if nodeindex is None:
+                nodeindex = self.mapping_id_to_index[nodeid]
+            else:
+                nodeid = int(self._ids_cache[nodeindex])
+            return Node(self._mesh, nodeid, nodeindex, self._coordinates_cache[nodeindex])
         if nodeindex is None:
             nodeindex = self._mesh._api.meshed_region_get_node_index(self._mesh, nodeid)
         elif nodeid is None:
@@ -241,6 +253,7 @@ class Nodes:
             Field that contains coordinates
         """
         self._mesh.set_coordinates_field(property_field)
+        self._clear_prefetch()
 
     @property
     def nodal_connectivity_field(self):
@@ -273,12 +286,116 @@ class Nodes:
         """Retrieve the coordinates field."""
         return self._mesh.field_of_properties(nodal_properties.coordinates)
 
+    def _prefetch(self):
+        """Retrieve the IDs and the coordinates of all the nodes in one request each.
+
+        The arrays are cached on this collection so that the nodes built from them
+        do not require any additional request to the server.
+
+        Returns
+        -------
+        ids : numpy.ndarray
+            IDs of the nodes ordered by index.
+        coordinates : numpy.ndarray
+            Coordinates of the nodes ordered by index, of shape ``(n_nodes, 3)``.
+        """
+        if self._ids_cache is None:
+            node_scoping = self.scoping
+            if node_scoping is None:
+                ids = np.empty(0, dtype=np.int32)
+                coordinates = np.empty((0, 3), dtype=np.float64)
+            else:
+                ids = np.asarray(node_scoping.ids)
+                coordinates = np.asarray(self._get_coordinates_field().data)
+                coordinates = coordinates.reshape(len(ids), 3)
+            self._ids_cache = ids
+            self._coordinates_cache = coordinates
+        return self._ids_cache, self._coordinates_cache
+
+    def _clear_prefetch(self):
+        """Clear the cached IDs and coordinates after a modification of the mesh."""
+        self._ids_cache = None
+        self._coordinates_cache = None
+        self._mapping_id_to_index = None
+
+    def take(self, indices):
+        """
+        Retrieve the coordinates of the nodes at the given indices.
+
+        The coordinates of all the nodes are retrieved from the server once
+        and cached on this collection.
+
+        Parameters
+        ----------
+        indices : list[int], numpy.ndarray
+            Zero-based indices of the nodes.
+
+        Returns
+        -------
+        coordinates : numpy.ndarray
+            Coordinates of the requested nodes, of shape ``(len(indices), 3)``.
+
+        Examples
+        --------
+        >>> import ansys.dpf.core as dpf
+        >>> from ansys.dpf.core import examples
+        >>> model = dpf.Model(examples.find_static_rst())
+        >>> nodes = model.metadata.meshed_region.nodes
+        >>> nodes.take([0, 2])
+        array([[0.015, 0.045, 0.015],
+               [0.015, 0.045, 0.03 ]])
+
+        """
+        _, coordinates = self._prefetch()
+        return np.take(coordinates, np.asarray(indices, dtype=np.int64), axis=0)
+
+    def coordinates_by_ids(self, ids):
+        """
+        Retrieve the coordinates of the nodes with the given IDs.
+
+        The IDs and coordinates of all the nodes are retrieved from the server once
+        and cached on this collection.
+
+        Parameters
+        ----------
+        ids : list[int], numpy.ndarray
+            IDs of the nodes.
+
+        Returns
+        -------
+        coordinates : numpy.ndarray
+            Coordinates of the requested nodes, of shape ``(len(ids), 3)``.
+
+        Examples
+        --------
+        >>> import ansys.dpf.core as dpf
+        >>> from ansys.dpf.core import examples
+        >>> model = dpf.Model(examples.find_static_rst())
+        >>> nodes = model.metadata.meshed_region.nodes
+        >>> nodes.coordinates_by_ids([1, 3])
+        array([[0.015, 0.045, 0.015],
+               [0.015, 0.045, 0.03 ]])
+
+        """
+        self._prefetch()
+        ids = np.asarray(ids)
+        indices, mask = self.mapping_id_to_index.lookup(ids)
+        if not mask.all():
+            raise ValueError(f"The node IDs {ids[~mask].tolist()} do not exist in the mesh.")
+        return self.take(indices)
+
     def _build_mapping_id_to_index(self):
         """Retrieve a mapping between IDs and indices of the entity."""
-        return {eid: i for i, eid in enumerate(self.scoping.ids)}
+        ids = self._ids_cache if self._ids_cache is not None else self.scoping.ids
+        return IdToIndexMap(ids)
 
     @property
-    def mapping_id_to_index(self):
+    def mapping_id_to_index(self) -> IdToIndexMap:
+        """
+        Mapping between the IDs and indices of the nodes.
+
+        The mapping is backed by NumPy arrays and behaves as a read-only dictionary.
+        """
         if self._mapping_id_to_index is None:
             self._mapping_id_to_index = self._build_mapping_id_to_index()
         return self._mapping_id_to_index
@@ -322,10 +439,7 @@ class Nodes:
         """
         if external_scope.location in ["Elemental", "NodalElemental"]:
             raise ValueError('Input scope location must be "Nodal"')
-        arr = np.array(list(map(self.mapping_id_to_index.get, external_scope.ids)))
-        mask = arr != None
-        ind = arr[mask].astype(np.int32)
-        return ind, mask
+        return self.mapping_id_to_index.lookup(external_scope.ids)
 
     def add_node(self, id, coordinates):
         """
@@ -340,6 +454,7 @@ class Nodes:
             List of ``[x, y, z]`` coordinates for the node.
         """
         self._mesh._api.meshed_region_add_node(self._mesh, coordinates, id)
+        self._clear_prefetch()
 
     def add_nodes(self, num):
         """
@@ -370,6 +485,7 @@ class Nodes:
             add = NodeAdder()
             yield add
             self._mesh._api.meshed_region_add_node(self._mesh, add.coordinates, add.id)
+        self._clear_prefetch()
 
 
 class NodeAdder:
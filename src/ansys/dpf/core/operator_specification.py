@@ -8,7 +8,10 @@ The OperatorSpecification Provides a documentation for each Operator
 
 from __future__ import annotations
 import abc
+import json
+import os
 from typing import Union
+from ansys.dpf.core import errors
 from ansys.dpf.core import server as server_module
 from ansys.dpf.gate import (
     operator_specification_capi,
@@ -246,17 +249,25 @@ class Specification(SpecificationBase):
         # step3: init environment
         self._api.init_operator_specification_environment(self)  # creates stub when gRPC
 
+        self.operator_name = operator_name
+        self._map_output_pin_spec = None
+        self._map_input_pin_spec = None
+        self._properties = None
+        self._config_specification = None
+        self._internal_obj = None
+        self._cache_entry = None
+
         # step4: if object exists: take instance, else create it (specification)
         if specification is not None:
-            self.internal_obj = specification
+            self._internal_obj = specification
         else:
             if operator_name:
-                if self._server.has_client():
-                    self._internal_obj = self._api.operator_specification_new_on_client(
-                        self._server.client, operator_name
-                    )
-                else:
-                    self._internal_obj = self._api.operator_specification_new(operator_name)
+                self._cache_entry = _get_specification_cache(self._server).entry(operator_name)
+                if self._cache_entry:
+                    # the specification is known, it is only requested for what is not cached
+                    self._fill_from_cache()
+                    return
+                self._create_internal_obj()
             else:
                 if self._server.has_client():
                     raise NotImplementedError(
@@ -264,11 +275,37 @@ class Specification(SpecificationBase):
                     )
                 self._internal_obj = self._api.operator_empty_specification_new()
 
-        self.operator_name = operator_name
-        self._map_output_pin_spec = None
-        self._map_input_pin_spec = None
-        self._properties = None
-        self._config_specification = None
+    def _create_internal_obj(self):
+        """Request the specification of the operator from the server."""
+        if self._server.has_client():
+            self._internal_obj = self._api.operator_specification_new_on_client(
+                self._server.client, self.operator_name
+            )
+        else:
+            self._internal_obj = self._api.operator_specification_new(self.operator_name)
+
+    def _get_internal_obj(self):
+        """Retrieve the specification from the server if it was filled from the cache."""
+        if self._internal_obj is None and self._cache_entry is not None:
+            self._create_internal_obj()
+        return self._internal_obj
+
+    def _fill_from_cache(self):
+        """Fill the specification with the parts already cached for this operator."""
+        entry = self._cache_entry
+        if "properties" in entry:
+            self._properties = dict(entry["properties"])
+        if "inputs" in entry:
+            self._map_input_pin_spec = dict(entry["inputs"])
+        if "outputs" in entry:
+            self._map_output_pin_spec = dict(entry["outputs"])
+        if "config_specification" in entry:
+            self._config_specification = ConfigSpecification(entry["config_specification"])
+
+    def _store_in_cache(self, key, value):
+        """Store a part of the specification in the cache of the server."""
+        if self._cache_entry is not None:
+            self._cache_entry[key] = value
 
     def __str__(self):
         return "Description:\n" + str(self.description) + "\nProperties:\n" + str(self.properties)
@@ -287,7 +324,7 @@ class Specification(SpecificationBase):
         """
         if self._properties is None:
             temp_properties = dict()
-            if self._internal_obj is not None:
+            if self._get_internal_obj() is not None:
                 num_properties = self._api.operator_specification_get_num_properties(self)
                 for i_property in range(num_properties):
                     property_key = self._api.operator_specification_get_property_key(
@@ -299,6 +336,7 @@ class Specification(SpecificationBase):
             self._properties = dict()
             for key in sorted(temp_properties.keys()):
                 self._properties[key] = temp_properties[key]
+            self._store_in_cache("properties", dict(self._properties))
         return self._properties
 
     @property
@@ -316,8 +354,12 @@ class Specification(SpecificationBase):
         >>> operator.specification.description
         "Scales a field (in 0) by a scalar field (in 1). If one field's ..."
         """
-        if self._internal_obj is not None:
-            return self._api.operator_specification_get_description(self)
+        if self._cache_entry is not None and "description" in self._cache_entry:
+            return self._cache_entry["description"]
+        if self._get_internal_obj() is not None:
+            description = self._api.operator_specification_get_description(self)
+            self._store_in_cache("description", description)
+            return description
         return ""
 
     @property
@@ -341,6 +383,7 @@ class Specification(SpecificationBase):
         if self._map_input_pin_spec is None:
             self._map_input_pin_spec = {}
             self._fill_pins(True, self._map_input_pin_spec)
+            self._store_in_cache("inputs", dict(self._map_input_pin_spec))
         return self._map_input_pin_spec
 
     @property
@@ -362,10 +405,11 @@ class Specification(SpecificationBase):
         if self._map_output_pin_spec is None:
             self._map_output_pin_spec = {}
             self._fill_pins(False, self._map_output_pin_spec)
+            self._store_in_cache("outputs", dict(self._map_output_pin_spec))
         return self._map_output_pin_spec
 
     def _fill_pins(self, binput, to_fill):
-        if self._internal_obj is not None:
+        if self._get_internal_obj() is not None:
             num_pins = self._api.operator_specification_get_num_pins(self, binput)
 
             pins = integral_types.MutableListInt32(size=num_pins)
@@ -414,6 +458,7 @@ class Specification(SpecificationBase):
         """
         if self._config_specification is None:
             self._config_specification = ConfigSpecification()
+            self._get_internal_obj()
             num_options = self._api.operator_specification_get_num_config_options(self)
             for i in range(num_options):
                 option_name = self._api.operator_specification_get_config_name(self, i)
@@ -432,6 +477,7 @@ class Specification(SpecificationBase):
                     default_value_str=option_default_value,
                     document=option_doc,
                 )
+            self._store_in_cache("config_specification", dict(self._config_specification))
         return self._config_specification
 
 
@@ -743,3 +789,196 @@ class CustomSpecification(Specification):
         for key, value in val.items():
             if value is not None:
                 self._api.operator_specification_set_property(self, key, value)
+
+
+class _SpecificationCache:
+    """Specifications of the operators of a server, shared by its ``Specification`` instances.
+
+    The parts of each specification (description, properties, pins and configuration
+    options) are stored as they are requested from the server. The cache lives as
+    long as the server and is keyed by the server version for persistence.
+    """
+
+    def __init__(self, version):
+        self.version = version
+        self._entries = {}
+
+    def entry(self, operator_name):
+        """Retrieve the dictionary of cached parts of an operator's specification."""
+        return self._entries.setdefault(operator_name, {})
+
+    def to_dict(self):
+        """Convert the cached specifications to JSON-serializable data."""
+
+        def pins_to_dict(pins):
+            return {
+                str(pin): [
+                    spec.name,
+                    spec.type_names,
+                    spec.document,
+                    spec.optional,
+                    spec.ellipsis,
+                    spec.name_derived_class,
+                ]
+                for pin, spec in pins.items()
+            }
+
+        operators = {}
+        for operator_name, entry in self._entries.items():
+            data = {}
+            if "description" in entry:
+                data["description"] = entry["description"]
+            if "properties" in entry:
+                data["properties"] = entry["properties"]
+            if "inputs" in entry:
+                data["inputs"] = pins_to_dict(entry["inputs"])
+            if "outputs" in entry:
+                data["outputs"] = pins_to_dict(entry["outputs"])
+            if "config_specification" in entry:
+                data["config_specification"] = {
+                    name: [option.type_names, option.default_value_str, option.document]
+                    for name, option in entry["config_specification"].items()
+                }
+            if data:
+                operators[operator_name] = data
+        return {"version": self.version, "operators": operators}
+
+    def update_from_dict(self, data):
+        """Add specifications converted with ``to_dict`` for the same server version.
+
+        Returns
+        -------
+        bool
+            ``False`` if the data was saved for another server version and was ignored.
+        """
+        if data.get("version") != self.version:
+            return False
+
+        def pins_from_dict(pins):
+            return {int(pin): PinSpecification(*values) for pin, values in pins.items()}
+
+        for operator_name, data_entry in data.get("operators", {}).items():
+            entry = self.entry(operator_name)
+            if "description" in data_entry:
+                entry.setdefault("description", data_entry["description"])
+            if "properties" in data_entry:
+                entry.setdefault("properties", data_entry["properties"])
+            if "inputs" in data_entry:
+                entry.setdefault("inputs", pins_from_dict(data_entry["inputs"]))
+            if "outputs" in data_entry:
+                entry.setdefault("outputs", pins_from_dict(data_entry["outputs"]))
+            if "config_specification" in data_entry:
+                entry.setdefault(
+                    "config_specification",
+                    {
+                        name: ConfigOptionSpec(name, *values)
+                        for name, values in data_entry["config_specification"].items()
+                    },
+                )
+        return True
+
+
+def _get_specification_cache(server):
+    """Retrieve the specification cache of a server, creating it if needed."""
+    if server._specification_cache is None:
+        server._specification_cache = _SpecificationCache(server.version)
+    return server._specification_cache
+
+
+def load_specifications(file_path, server=None):
+    """Load operator specifications saved with :func:`save_specifications` into the cache.
+
+    Operators created afterwards on this server read their specification from the
+    cache instead of requesting it, which lets short-lived processes connecting to
+    the same server build workflows without specification requests.
+
+    Parameters
+    ----------
+    file_path : str or os.PathLike
+        Path of the JSON file to read.
+    server : server.DPFServer, optional
+        Server with channel connected to the remote or local instance. When
+        ``None``, attempts to use the global server.
+
+    Returns
+    -------
+    bool
+        ``False`` if the file was saved for another server version and was ignored.
+
+    Examples
+    --------
+    >>> from ansys.dpf import core as dpf
+    >>> from ansys.dpf.core import operator_specification
+    >>> import os, tempfile
+    >>> file_path = os.path.join(tempfile.mkdtemp(), "specifications.json")
+    >>> operator_specification.prewarm_specifications(["U", "S"], file_path=file_path)
+    >>> operator_specification.load_specifications(file_path)
+    True
+
+    """
+    server = server_module.get_or_create_server(server)
+    with open(file_path, "r", encoding="utf-8") as file:
+        data = json.load(file)
+    return _get_specification_cache(server).update_from_dict(data)
+
+
+def save_specifications(file_path, server=None):
+    """Save the operator specifications cached for a server to a JSON file.
+
+    Parameters
+    ----------
+    file_path : str or os.PathLike
+        Path of the JSON file to write.
+    server : server.DPFServer, optional
+        Server with channel connected to the remote or local instance. When
+        ``None``, attempts to use the global server.
+    """
+    server = server_module.get_or_create_server(server)
+    data = _get_specification_cache(server).to_dict()
+    with open(file_path, "w", encoding="utf-8") as file:
+        json.dump(data, file)
+
+
+def prewarm_specifications(operator_names=None, server=None, file_path=None):
+    """Request and cache the full specification of several operators.
+
+    Parameters
+    ----------
+    operator_names : list[str], optional
+        Names of the operators. The default is ``None``, in which case all the
+        operators available on the server are used.
+    server : server.DPFServer, optional
+        Server with channel connected to the remote or local instance. When
+        ``None``, attempts to use the global server.
+    file_path : str or os.PathLike, optional
+        JSON file used to persist the specifications. When it exists, it is loaded
+        first so that only the missing specifications are requested, and it is
+        then updated.
+
+    Examples
+    --------
+    >>> from ansys.dpf import core as dpf
+    >>> from ansys.dpf.core import operator_specification
+    >>> operator_specification.prewarm_specifications(["U", "S"])
+    >>> op = dpf.Operator("U")
+
+    """
+    server = server_module.get_or_create_server(server)
+    if file_path is not None and os.path.exists(file_path):
+        load_specifications(file_path, server)
+    if operator_names is None:
+        from ansys.dpf.core.dpf_operator import available_operator_names
+
+        operator_names = available_operator_names(server)
+    for operator_name in operator_names:
+        try:
+            spec = Specification(operator_name=operator_name, server=server)
+            spec.description
+            spec.properties
+            spec.inputs
+            spec.outputs
+            spec.config_specification
+        except errors.DPFServerException:
+            continue
+    if file_path is not None:
+        save_specifications(file_path, server)
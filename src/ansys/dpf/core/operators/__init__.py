@@ -1,14 +1,22 @@
-from . import averaging
-from . import filter
-from . import geo
-from . import invariant
-from . import logic
-from . import mapping
-from . import math
-from . import mesh
-from . import metadata
-from . import min_max
-from . import result
-from . import scoping
-from . import serialization
-from . import utility
+from ansys.dpf.core.operators._lazy import install_lazy_loader
+
+_SUBPACKAGES = (
+    "averaging",
+    "filter",
+    "geo",
+    "invariant",
+    "logic",
+    "mapping",
+    "math",
+    "mesh",
+    "metadata",
+    "min_max",
+    "result",
+    "scoping",
+    "serialization",
+    "utility",
+)
+
+_OPERATORS = {}
+
+install_lazy_loader(__name__, _OPERATORS, _SUBPACKAGES)
@@ -0,0 +1,64 @@
+"""
+Lazy loading of the generated operators.
+
+The ``__init__`` files of the operators package and of its categories only hold
+an index of the operators and subpackages that they expose. The corresponding
+modules are imported the first time their attribute is accessed (PEP 562), so
+that importing ``ansys.dpf.core`` does not import every generated operator.
+"""
+import importlib
+import sys
+import types
+
+
+class _LazyOperatorsModule(types.ModuleType):
+    """Module type of a lazily loaded operators package.
+
+    When an operator module is imported directly, for example with
+    ``import ansys.dpf.core.operators.result.stress``, the import system binds
+    the module to the package attribute. This type binds the operator class of
+    the module instead, as the eager ``from .stress import stress`` did.
+    """
+
+    def __setattr__(self, name, value):
+        operators = self.__dict__.get("_OPERATORS", {})
+        if isinstance(value, types.ModuleType) and name in operators:
+            value = getattr(value, name, value)
+        super().__setattr__(name, value)
+
+
+def install_lazy_loader(module_name, operators, subpackages=()):
+    """Make the attributes of an operators package load on first access.
+
+    Parameters
+    ----------
+    module_name : str
+        Name of the package, usually ``__name__``.
+    operators : dict
+        Map of the operator names to the names of the modules, relative to the
+        package, that define them.
+    subpackages : tuple[str], optional
+        Names of the subpackages exposed by the package.
+    """
+    module = sys.modules[module_name]
+    namespace = module.__dict__
+    subpackages = tuple(subpackages)
+
+    def __getattr__(name):
+        if name in subpackages:
+            return importlib.import_module(f"{module_name}.{name}")
+        if name in operators:
+            operator_module = importlib.import_module(f"{module_name}.{operators[name]}")
+            value = getattr(operator_module, name)
+            namespace[name] = value
+            return value
+        raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+
+    def __dir__():
+        return sorted(set(namespace) | set(operators) | set(subpackages))
+
+    namespace["_OPERATORS"] = operators
+    namespace["__getattr__"] = __getattr__
+    namespace["__dir__"] = __dir__
+    namespace["__all__"] = list(subpackages) + list(operators)
+    module.__class__ = _LazyOperatorsModule
@@ -171,6 +171,45 @@ def build_operator(
         raise e
 
 
+def build_lazy_init(init_file_path):
+    """Rewrite an ``__init__.py`` file of imports into a lazily loaded index.
+
+    The ``from . import <subpackage>`` and ``from .<module> import <operator>``
+    lines written by the code generator are replaced by an index of the
+    subpackages and operators which are imported on first access.
+    """
+    subpackages = []
+    operators = {}
+    with open(init_file_path, "r") as init_file:
+        for line in init_file:
+            words = line.split()
+            if len(words) != 4 or words[0] != "from" or words[2] != "import":
+                continue
+            if words[1] == ".":
+                subpackages.append(words[3])
+            else:
+                operators[words[3]] = words[1].lstrip(".")
+    lines = ["from ansys.dpf.core.operators._lazy import install_lazy_loader\n", "\n"]
+    if subpackages:
+        lines.append("_SUBPACKAGES = (\n")
+        lines.extend(f'    "{name}",\n' for name in sorted(subpackages))
+        lines.append(")\n")
+        lines.append("\n")
+    if operators:
+        lines.append("_OPERATORS = {\n")
+        lines.extend(f'    "{name}": "{operators[name]}",\n' for name in sorted(operators))
+        lines.append("}\n")
+    else:
+        lines.append("_OPERATORS = {}\n")
+    lines.append("\n")
+    if subpackages:
+        lines.append("install_lazy_loader(__name__, _OPERATORS, _SUBPACKAGES)\n")
+    else:
+        lines.append("install_lazy_loader(__name__, _OPERATORS)\n")
+    with open(init_file_path, "w") as init_file:
+        init_file.writelines(lines)
+
+
 def build_operators():
     print(f"Generating operators for server {dpf.SERVER.version}")
 
@@ -1,15 +1,21 @@
-from .convertnum_bcs_to_nod import convertnum_bcs_to_nod 
-from .convertnum_nod_to_bcs import convertnum_nod_to_bcs 
-from .convertnum_op import convertnum_op 
-from .eigen_values import eigen_values 
-from .eigen_values_fc import eigen_values_fc 
-from .eigen_vectors import eigen_vectors 
-from .eigen_vectors_fc import eigen_vectors_fc 
-from .invariants import invariants 
-from .invariants_fc import invariants_fc 
-from .principal_invariants import principal_invariants 
-from .principal_invariants_fc import principal_invariants_fc 
-from .segalman_von_mises_eqv import segalman_von_mises_eqv 
-from .segalman_von_mises_eqv_fc import segalman_von_mises_eqv_fc 
-from .von_mises_eqv import von_mises_eqv 
-from .von_mises_eqv_fc import von_mises_eqv_fc 
+from ansys.dpf.core.operators._lazy import install_lazy_loader
+
+_OPERATORS = {
+    "convertnum_bcs_to_nod": "convertnum_bcs_to_nod",
+    "convertnum_nod_to_bcs": "convertnum_nod_to_bcs",
+    "convertnum_op": "convertnum_op",
+    "eigen_values": "eigen_values",
+    "eigen_values_fc": "eigen_values_fc",
+    "eigen_vectors": "eigen_vectors",
+    "eigen_vectors_fc": "eigen_vectors_fc",
+    "invariants": "invariants",
+    "invariants_fc": "invariants_fc",
+    "principal_invariants": "principal_invariants",
+    "principal_invariants_fc": "principal_invariants_fc",
+    "segalman_von_mises_eqv": "segalman_von_mises_eqv",
+    "segalman_von_mises_eqv_fc": "segalman_von_mises_eqv_fc",
+    "von_mises_eqv": "von_mises_eqv",
+    "von_mises_eqv_fc": "von_mises_eqv_fc",
+}
+
+install_lazy_loader(__name__, _OPERATORS)
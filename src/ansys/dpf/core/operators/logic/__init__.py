@@ -1,18 +1,24 @@
-from .ascending_sort import ascending_sort 
-from .ascending_sort_fc import ascending_sort_fc 
-from .component_selector import component_selector 
-from .component_selector_fc import component_selector_fc 
-from .component_transformer import component_transformer 
-from .component_transformer_fc import component_transformer_fc 
-from .descending_sort import descending_sort 
-from .descending_sort_fc import descending_sort_fc 
-from .elementary_data_selector import elementary_data_selector 
-from .elementary_data_selector_fc import elementary_data_selector_fc 
-from .enrich_materials import enrich_materials 
-from .identical_fc import identical_fc 
-from .identical_fields import identical_fields 
-from .identical_meshes import identical_meshes 
-from .identical_property_fields import identical_property_fields 
-from .identical_string_fields import identical_string_fields 
-from .included_fields import included_fields 
-from .solid_shell_fields import solid_shell_fields 
+from ansys.dpf.core.operators._lazy import install_lazy_loader
+
+_OPERATORS = {
+    "ascending_sort": "ascending_sort",
+    "ascending_sort_fc": "ascending_sort_fc",
+    "component_selector": "component_selector",
+    "component_selector_fc": "component_selector_fc",
+    "component_transformer": "component_transformer",
+    "component_transformer_fc": "component_transformer_fc",
+    "descending_sort": "descending_sort",
+    "descending_sort_fc": "descending_sort_fc",
+    "elementary_data_selector": "elementary_data_selector",
+    "elementary_data_selector_fc": "elementary_data_selector_fc",
+    "enrich_materials": "enrich_materials",
+    "identical_fc": "identical_fc",
+    "identical_fields": "identical_fields",
+    "identical_meshes": "identical_meshes",
+    "identical_property_fields": "identical_property_fields",
+    "identical_string_fields": "identical_string_fields",
+    "included_fields": "included_fields",
+    "solid_shell_fields": "solid_shell_fields",
+}
+
+install_lazy_loader(__name__, _OPERATORS)
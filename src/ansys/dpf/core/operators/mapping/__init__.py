@@ -1,9 +1,15 @@
-from .fft import fft 
-from .find_reduced_coordinates import find_reduced_coordinates 
-from .on_coordinates import on_coordinates 
-from .on_reduced_coordinates import on_reduced_coordinates 
-from .prep_sampling_fft import prep_sampling_fft 
-from .prepare_mapping_workflow import prepare_mapping_workflow 
-from .scoping_on_coordinates import scoping_on_coordinates 
-from .solid_to_skin import solid_to_skin 
-from .solid_to_skin_fc import solid_to_skin_fc 
+from ansys.dpf.core.operators._lazy import install_lazy_loader
+
+_OPERATORS = {
+    "fft": "fft",
+    "find_reduced_coordinates": "find_reduced_coordinates",
+    "on_coordinates": "on_coordinates",
+    "on_reduced_coordinates": "on_reduced_coordinates",
+    "prep_sampling_fft": "prep_sampling_fft",
+    "prepare_mapping_workflow": "prepare_mapping_workflow",
+    "scoping_on_coordinates": "scoping_on_coordinates",
+    "solid_to_skin": "solid_to_skin",
+    "solid_to_skin_fc": "solid_to_skin_fc",
+}
+
+install_lazy_loader(__name__, _OPERATORS)
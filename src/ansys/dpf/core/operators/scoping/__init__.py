@@ -1,18 +1,24 @@
-from .change_fc import change_fc 
-from .compute_element_centroids import compute_element_centroids 
-from .connectivity_ids import connectivity_ids 
-from .elemental_from_mesh import elemental_from_mesh 
-from .from_mesh import from_mesh 
-from .intersect import intersect 
-from .nodal_from_mesh import nodal_from_mesh 
-from .on_mesh_property import on_mesh_property 
-from .on_named_selection import on_named_selection 
-from .on_property import on_property 
-from .reduce_sampling import reduce_sampling 
-from .rescope import rescope 
-from .rescope_custom_type_field import rescope_custom_type_field 
-from .rescope_fc import rescope_fc 
-from .rescope_property_field import rescope_property_field 
-from .scoping_get_attribute import scoping_get_attribute 
-from .split_on_property_type import split_on_property_type 
-from .transpose import transpose 
+from ansys.dpf.core.operators._lazy import install_lazy_loader
+
+_OPERATORS = {
+    "change_fc": "change_fc",
+    "compute_element_centroids": "compute_element_centroids",
+    "connectivity_ids": "connectivity_ids",
+    "elemental_from_mesh": "elemental_from_mesh",
+    "from_mesh": "from_mesh",
+    "intersect": "intersect",
+    "nodal_from_mesh": "nodal_from_mesh",
+    "on_mesh_property": "on_mesh_property",
+    "on_named_selection": "on_named_selection",
+    "on_property": "on_property",
+    "reduce_sampling": "reduce_sampling",
+    "rescope": "rescope",
+    "rescope_custom_type_field": "rescope_custom_type_field",
+    "rescope_fc": "rescope_fc",
+    "rescope_property_field": "rescope_property_field",
+    "scoping_get_attribute": "scoping_get_attribute",
+    "split_on_property_type": "split_on_property_type",
+    "transpose": "transpose",
+}
+
+install_lazy_loader(__name__, _OPERATORS)
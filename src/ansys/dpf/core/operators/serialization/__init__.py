@@ -1,23 +1,29 @@
-from .csv_to_field import csv_to_field 
-from .data_tree_to_json import data_tree_to_json 
-from .data_tree_to_txt import data_tree_to_txt 
-from .deserializer import deserializer 
-from .export_symbolic_workflow import export_symbolic_workflow 
-from .field_to_csv import field_to_csv 
-from .hdf5dpf_custom_read import hdf5dpf_custom_read 
-from .hdf5dpf_generate_result_file import hdf5dpf_generate_result_file 
-from .import_symbolic_workflow import import_symbolic_workflow 
-from .json_to_data_tree import json_to_data_tree 
-from .mechanical_csv_to_field import mechanical_csv_to_field 
-from .migrate_file_to_vtk import migrate_file_to_vtk 
-from .migrate_to_vtu import migrate_to_vtu 
-from .serialize_to_hdf5 import serialize_to_hdf5 
-from .serializer import serializer 
-from .serializer_to_string import serializer_to_string 
-from .string_deserializer import string_deserializer 
-from .txt_to_data_tree import txt_to_data_tree 
-from .vtk_export import vtk_export 
-from .vtk_to_fields import vtk_to_fields 
-from .vtu_export import vtu_export 
-from .workflow_export_json import workflow_export_json 
-from .workflow_import_json import workflow_import_json 
+from ansys.dpf.core.operators._lazy import install_lazy_loader
+
+_OPERATORS = {
+    "csv_to_field": "csv_to_field",
+    "data_tree_to_json": "data_tree_to_json",
+    "data_tree_to_txt": "data_tree_to_txt",
+    "deserializer": "deserializer",
+    "export_symbolic_workflow": "export_symbolic_workflow",
+    "field_to_csv": "field_to_csv",
+    "hdf5dpf_custom_read": "hdf5dpf_custom_read",
+    "hdf5dpf_generate_result_file": "hdf5dpf_generate_result_file",
+    "import_symbolic_workflow": "import_symbolic_workflow",
+    "json_to_data_tree": "json_to_data_tree",
+    "mechanical_csv_to_field": "mechanical_csv_to_field",
+    "migrate_file_to_vtk": "migrate_file_to_vtk",
+    "migrate_to_vtu": "migrate_to_vtu",
+    "serialize_to_hdf5": "serialize_to_hdf5",
+    "serializer": "serializer",
+    "serializer_to_string": "serializer_to_string",
+    "string_deserializer": "string_deserializer",
+    "txt_to_data_tree": "txt_to_data_tree",
+    "vtk_export": "vtk_export",
+    "vtk_to_fields": "vtk_to_fields",
+    "vtu_export": "vtu_export",
+    "workflow_export_json": "workflow_export_json",
+    "workflow_import_json": "workflow_import_json",
+}
+
+install_lazy_loader(__name__, _OPERATORS)
@@ -1,77 +1,83 @@
-from .assemble_scalars_to_matrices import assemble_scalars_to_matrices 
-from .assemble_scalars_to_matrices_fc import assemble_scalars_to_matrices_fc 
-from .assemble_scalars_to_vectors import assemble_scalars_to_vectors 
-from .assemble_scalars_to_vectors_fc import assemble_scalars_to_vectors_fc 
-from .bind_support import bind_support 
-from .bind_support_fc import bind_support_fc 
-from .change_location import change_location 
-from .change_shell_layers import change_shell_layers 
-from .compute_time_scoping import compute_time_scoping 
-from .default_value import default_value 
-from .delegate_to_operator import delegate_to_operator 
-from .ds_get_attribute import ds_get_attribute 
-from .extract_field import extract_field 
-from .extract_scoping import extract_scoping 
-from .extract_sub_fc import extract_sub_fc 
-from .extract_sub_mc import extract_sub_mc 
-from .extract_sub_sc import extract_sub_sc 
-from .extract_time_freq import extract_time_freq 
-from .fc_get_attribute import fc_get_attribute 
-from .field import field 
-from .field_get_attribute import field_get_attribute 
-from .field_to_fc import field_to_fc 
-from .fields_container import fields_container 
-from .fields_container_matrices_label import fields_container_matrices_label 
-from .for_each import for_each 
-from .forward import forward 
-from .forward_field import forward_field 
-from .forward_fields_container import forward_fields_container 
-from .forward_meshes_container import forward_meshes_container 
-from .hdf5dpf_workglow_provider import hdf5dpf_workglow_provider 
-from .html_doc import html_doc 
-from .incremental_concatenate_as_fc import incremental_concatenate_as_fc 
-from .ints_to_scoping import ints_to_scoping 
-from .make_for_each_range import make_for_each_range 
-from .make_label_space import make_label_space 
-from .make_overall import make_overall 
-from .make_producer_consumer_for_each_iterator import make_producer_consumer_for_each_iterator 
-from .merge_any import merge_any 
-from .merge_data_tree import merge_data_tree 
-from .merge_fields import merge_fields 
-from .merge_fields_by_label import merge_fields_by_label 
-from .merge_fields_containers import merge_fields_containers 
-from .merge_generic_data_container import merge_generic_data_container 
-from .merge_materials import merge_materials 
-from .merge_meshes import merge_meshes 
-from .merge_meshes_containers import merge_meshes_containers 
-from .merge_property_fields import merge_property_fields 
-from .merge_result_infos import merge_result_infos 
-from .merge_scopings import merge_scopings 
-from .merge_scopings_containers import merge_scopings_containers 
-from .merge_string_fields import merge_string_fields 
-from .merge_supports import merge_supports 
-from .merge_time_freq_supports import merge_time_freq_supports 
-from .merge_to_field_matrix import merge_to_field_matrix 
-from .merge_weighted_fields import merge_weighted_fields 
-from .merge_weighted_fields_containers import merge_weighted_fields_containers 
-from .mesh import mesh 
-from .mesh_to_mc import mesh_to_mc 
-from .meshes_container import meshes_container 
-from .overlap_fields import overlap_fields 
-from .producer_consumer_for_each import producer_consumer_for_each 
-from .property_field import property_field 
-from .python_generator import python_generator 
-from .python_script_exec import python_script_exec 
-from .remote_operator_instantiate import remote_operator_instantiate 
-from .remote_workflow_instantiate import remote_workflow_instantiate 
-from .remove_unnecessary_labels import remove_unnecessary_labels 
-from .scalars_to_field import scalars_to_field 
-from .server_path import server_path 
-from .set_attribute import set_attribute 
-from .set_property import set_property 
-from .split_in_for_each_range import split_in_for_each_range 
-from .strain_from_voigt import strain_from_voigt 
-from .strain_from_voigt_fc import strain_from_voigt_fc 
-from .txt_file_to_dpf import txt_file_to_dpf 
-from .unitary_field import unitary_field 
-from .weighted_merge_fields_by_label import weighted_merge_fields_by_label 
+from ansys.dpf.core.operators._lazy import install_lazy_loader
+
+_OPERATORS = {
+    "assemble_scalars_to_matrices": "assemble_scalars_to_matrices",
+    "assemble_scalars_to_matrices_fc": "assemble_scalars_to_matrices_fc",
+    "assemble_scalars_to_vectors": "assemble_scalars_to_vectors",
+    "assemble_scalars_to_vectors_fc": "assemble_scalars_to_vectors_fc",
+    "bind_support": "bind_support",
+    "bind_support_fc": "bind_support_fc",
+    "change_location": "change_location",
+    "change_shell_layers": "change_shell_layers",
+    "compute_time_scoping": "compute_time_scoping",
+    "default_value": "default_value",
+    "delegate_to_operator": "delegate_to_operator",
+    "ds_get_attribute": "ds_get_attribute",
+    "extract_field": "extract_field",
+    "extract_scoping": "extract_scoping",
+    "extract_sub_fc": "extract_sub_fc",
+    "extract_sub_mc": "extract_sub_mc",
+    "extract_sub_sc": "extract_sub_sc",
+    "extract_time_freq": "extract_time_freq",
+    "fc_get_attribute": "fc_get_attribute",
+    "field": "field",
+    "field_get_attribute": "field_get_attribute",
+    "field_to_fc": "field_to_fc",
+    "fields_container": "fields_container",
+    "fields_container_matrices_label": "fields_container_matrices_label",
+    "for_each": "for_each",
+    "forward": "forward",
+    "forward_field": "forward_field",
+    "forward_fields_container": "forward_fields_container",
+    "forward_meshes_container": "forward_meshes_container",
+    "hdf5dpf_workglow_provider": "hdf5dpf_workglow_provider",
+    "html_doc": "html_doc",
+    "incremental_concatenate_as_fc": "incremental_concatenate_as_fc",
+    "ints_to_scoping": "ints_to_scoping",
+    "make_for_each_range": "make_for_each_range",
+    "make_label_space": "make_label_space",
+    "make_overall": "make_overall",
+    "make_producer_consumer_for_each_iterator": "make_producer_consumer_for_each_iterator",
+    "merge_any": "merge_any",
+    "merge_data_tree": "merge_data_tree",
+    "merge_fields": "merge_fields",
+    "merge_fields_by_label": "merge_fields_by_label",
+    "merge_fields_containers": "merge_fields_containers",
+    "merge_generic_data_container": "merge_generic_data_container",
+    "merge_materials": "merge_materials",
+    "merge_meshes": "merge_meshes",
+    "merge_meshes_containers": "merge_meshes_containers",
+    "merge_property_fields": "merge_property_fields",
+    "merge_result_infos": "merge_result_infos",
+    "merge_scopings": "merge_scopings",
+    "merge_scopings_containers": "merge_scopings_containers",
+    "merge_string_fields": "merge_string_fields",
+    "merge_supports": "merge_supports",
+    "merge_time_freq_supports": "merge_time_freq_supports",
+    "merge_to_field_matrix": "merge_to_field_matrix",
+    "merge_weighted_fields": "merge_weighted_fields",
+    "merge_weighted_fields_containers": "merge_weighted_fields_containers",
+    "mesh": "mesh",
+    "mesh_to_mc": "mesh_to_mc",
+    "meshes_container": "meshes_container",
+    "overlap_fields": "overlap_fields",
+    "producer_consumer_for_each": "producer_consumer_for_each",
+    "property_field": "property_field",
+    "python_generator": "python_generator",
+    "python_script_exec": "python_script_exec",
+    "remote_operator_instantiate": "remote_operator_instantiate",
+    "remote_workflow_instantiate": "remote_workflow_instantiate",
+    "remove_unnecessary_labels": "remove_unnecessary_labels",
+    "scalars_to_field": "scalars_to_field",
+    "server_path": "server_path",
+    "set_attribute": "set_attribute",
+    "set_property": "set_property",
+    "split_in_for_each_range": "split_in_for_each_range",
+    "strain_from_voigt": "strain_from_voigt",
+    "strain_from_voigt_fc": "strain_from_voigt_fc",
+    "txt_file_to_dpf": "txt_file_to_dpf",
+    "unitary_field": "unitary_field",
+    "weighted_merge_fields_by_label": "weighted_merge_fields_by_label",
+}
+
+install_lazy_loader(__name__, _OPERATORS)
@@ -0,0 +1,519 @@
+"""
+.. _ref_output_cache:
+
+OutputCache
+===========
+Memoize the outputs of operators and workflows, so that repeated evaluations
+with identical inputs are not sent to the server again.
+"""
+import enum
+import functools
+import hashlib
+import os
+import pickle
+import uuid
+import weakref
+from collections import OrderedDict
+
+import numpy as np
+
+from ansys.dpf.core.cache import CacheStatistics
+
+
+class _UnfingerprintableInputError(TypeError):
+    """Raised when an input cannot be identified by its content."""
+
+
+def _digest(*parts):
+    """Hash the bytes or the representation of each part with SHA-256."""
+    sha = hashlib.sha256()
+    for part in parts:
+        if isinstance(part, np.ndarray):
+            part = np.ascontiguousarray(part)
+            sha.update(f"{part.dtype.str}{part.shape}".encode())
+            part = part.tobytes()
+        elif not isinstance(part, bytes):
+            part = repr(part).encode()
+        sha.update(part)
+    return sha.hexdigest()
+
+
+_UNKNOWN_INPUT = object()
+
+
+def _record_input(value, keep):
+    """Reference an input recorded to fingerprint an operator or a workflow.
+
+    The inputs are only kept alive when ``keep`` is set, when the operator or the
+    workflow has an output cache. Otherwise, numbers and strings are kept, the other
+    inputs are referenced weakly, and the inputs which cannot be referenced weakly,
+    such as lists, are replaced by a marker of unknown input.
+    """
+    if isinstance(value, os.PathLike):
+        return os.fspath(value)
+    if keep or value is None or isinstance(value, (bool, int, float, str, bytes, enum.Enum)):
+        return value
+    try:
+        return weakref.ref(value)
+    except TypeError:
+        return _UNKNOWN_INPUT
+
+
+def _recorded_value(recorded):
+    """Retrieve an input recorded with :func:`_record_input`.
+
+    Raises
+    ------
+    _UnfingerprintableInputError
+        If the input was not kept or was deleted.
+    """
+    if recorded is _UNKNOWN_INPUT:
+        raise _UnfingerprintableInputError("The input was connected without output cache.")
+    if isinstance(recorded, weakref.ref):
+        recorded = recorded()
+        if recorded is None:
+            raise _UnfingerprintableInputError("The input was deleted.")
+    return recorded
+
+
+_CONTENT_HASH_MAX_SIZE = 100000
+"""Number of values up to which a field is identified by its content."""
+
+
+def _instance_token(value):
+    """Identify an object by its instance with a token unique across processes.
+
+    The token is dropped with :func:`_reset_instance_token` when the object is
+    modified in place, so that it is then identified by a new token.
+    """
+    token = getattr(value, "_output_cache_token", None)
+    if token is None:
+        token = value._output_cache_token = uuid.uuid4().hex
+    return token
+
+
+def _reset_instance_token(value):
+    """Drop the token of an object modified in place."""
+    vars(value).pop("_output_cache_token", None)
+
+
+def _modifies_instance(func):
+    """Drop the token of the instance when a method modifying it in place is called.
+
+    .. note::
+       The method must be used as a decorator.
+    """
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        _reset_instance_token(self)
+        return func(self, *args, **kwargs)
+
+    return wrapper
+
+
+def _reset_token_on_write_back(vec, value):
+    """Drop the token of an object when the data of one of its vectors is written back."""
+    owner = weakref.ref(value)
+
+    def on_change():
+        obj = owner()
+        if obj is not None:
+            _reset_instance_token(obj)
+
+    vec.on_change = on_change
+
+
+def _field_fingerprint(value, seen):
+    """Identify a field by its content, downloading its data."""
+    data = value.data
+    if not isinstance(data, np.ndarray):
+        data = np.asarray(data, dtype=object).astype(str)
+    return (
+        type(value).__name__,
+        value.location,
+        getattr(value, "unit", None),
+        _fingerprint(value.scoping, seen),
+        _digest(data, np.asarray(value._data_pointer)),
+    )
+
+
+def _member_fingerprint(value, owner, seen):
+    """Identify an entity held by another one, such as a field of a collection.
+
+    Scopings and fields of up to ``_CONTENT_HASH_MAX_SIZE`` values are identified
+    by their content. The other members are retrieved as new instances each time,
+    so they are identified by the instance of their owner.
+    """
+    from ansys.dpf.core import field_base, scoping
+
+    if isinstance(value, scoping.Scoping):
+        return _fingerprint(value, seen)
+    if isinstance(value, field_base._FieldBase) and value.size <= _CONTENT_HASH_MAX_SIZE:
+        return _field_fingerprint(value, seen)
+    return ("member", _instance_token(owner))
+
+
+def _fingerprint(value, seen=None, workflow_token=None):
+    """Build a hashable identifier of an input.
+
+    Values held by the client, scopings and fields of up to
+    ``_CONTENT_HASH_MAX_SIZE`` values are identified by their content. Larger
+    fields, the collections and meshes holding them and the time frequency
+    supports are identified by their instance, so that their data is not
+    downloaded.
+
+    Parameters
+    ----------
+    value : Any
+        Input connected to an operator or a workflow.
+    seen : set, optional
+        Identifiers of the operators being fingerprinted, used to detect cycles.
+    workflow_token : str, optional
+        Token of the workflow being fingerprinted, whose named input pins are
+        fingerprinted by the workflow itself.
+
+    Raises
+    ------
+    _UnfingerprintableInputError
+        If the input cannot be identified.
+    """
+    from ansys.dpf.core import (
+        collection_base,
+        data_sources,
+        dpf_operator,
+        field_base,
+        meshed_region,
+        model,
+        outputs,
+        scoping,
+        time_freq_support,
+        unit_system,
+    )
+    from ansys.dpf.core._model_helpers import _data_sources_content_key, _data_sources_path_key
+
+    if seen is None:
+        seen = set()
+    if value is None or isinstance(value, (bool, int, float, str, bytes)):
+        return (type(value).__name__, value)
+    if isinstance(value, enum.Enum):
+        return (type(value).__name__, value.value)
+    if isinstance(value, os.PathLike):
+        return ("path", os.fspath(value))
+    if isinstance(value, (list, tuple)):
+        return ("list",) + tuple(_fingerprint(item, seen, workflow_token) for item in value)
+    if isinstance(value, dict):
+        return ("dict",) + tuple(
+            sorted(
+                (repr(key), _fingerprint(item, seen, workflow_token))
+                for key, item in value.items()
+            )
+        )
+    if isinstance(value, np.ndarray):
+        return ("ndarray", _digest(value))
+    if isinstance(value, unit_system.UnitSystem):
+        return ("unit_system", value.ID, value.unit_names)
+    if isinstance(value, data_sources.DataSources):
+        if value._server.local_server:
+            key = _data_sources_content_key(value)
+        else:
+            key = _data_sources_path_key(value)
+        if key is None:
+            raise _UnfingerprintableInputError("The files of the data sources cannot be listed.")
+        return ("data_sources",) + key
+    if isinstance(value, model.Model):
+        return ("model", _fingerprint(value.metadata.data_sources, seen, workflow_token))
+    if isinstance(value, scoping.Scoping):
+        return ("scoping", value.location, _digest(np.asarray(value.ids)))
+    if isinstance(value, field_base._FieldBase):
+        if value.size <= _CONTENT_HASH_MAX_SIZE:
+            return _field_fingerprint(value, seen)
+        return (type(value).__name__, _instance_token(value))
+    if isinstance(value, collection_base.CollectionBase):
+        entries = tuple(
+            (
+                repr(sorted(value.get_label_space(index).items())),
+                _member_fingerprint(entry, value, seen),
+            )
+            for index, entry in enumerate(value)
+        )
+        return (type(value).__name__, tuple(value.labels), entries)
+    if isinstance(value, meshed_region.MeshedRegion):
+        return (
+            "mesh",
+            value.unit,
+            _member_fingerprint(value.nodes.coordinates_field, value, seen),
+            _member_fingerprint(value.elements.connectivities_field, value, seen),
+            _member_fingerprint(value.elements.element_types_field, value, seen),
+        )
+    if isinstance(value, time_freq_support.TimeFreqSupport):
+        return (type(value).__name__, _instance_token(value))
+    if isinstance(value, outputs.Output):
+        return ("output", _fingerprint(value._operator, seen, workflow_token), value._pin)
+    if isinstance(value, dpf_operator.Operator):
+        return _operator_fingerprint(value, seen, workflow_token)
+    raise _UnfingerprintableInputError(
+        f"Inputs of type {type(value).__name__} cannot be fingerprinted."
+    )
+
+
+def _operator_fingerprint(operator, seen, workflow_token=None):
+    """Identify an operator by its name, configuration and recorded inputs.
+
+    The inputs of the pins named as inputs of workflows can be connected through
+    them, so the operator can only be fingerprinted by the workflow naming them.
+    """
+    if id(operator) in seen:
+        raise _UnfingerprintableInputError("The operators are connected in a cycle.")
+    for pin, workflow_tokens in operator._workflow_input_pins.items():
+        if workflow_tokens - {workflow_token}:
+            raise _UnfingerprintableInputError(
+                f"The pin {pin} of the operator {operator.name} is connected through a workflow."
+            )
+    seen = seen | {id(operator)}
+    connected = []
+    for pin, (recorded, pin_out) in sorted(operator._recorded_inputs.items()):
+        inpt = _recorded_value(recorded)
+        if pin_out is None:
+            connected.append(
+                (pin, "operator_as_input", _operator_fingerprint(inpt, seen, workflow_token))
+            )
+        else:
+            connected.append((pin, _fingerprint(inpt, seen, workflow_token), pin_out))
+    return (
+        "operator",
+        operator.name,
+        _fingerprint(operator._recorded_config, seen),
+        tuple(connected),
+    )
+
+
+class OutputCache:
+    """Bounded store of the outputs of operators and workflows.
+
+    When an output cache is set on an operator or a workflow, its connected
+    inputs are fingerprinted when an output is requested: scalars, strings, lists
+    and arrays by value, data sources by the paths, sizes and modification times
+    of their files, or only by their paths and the server address for remote
+    servers, and upstream operators by their name, configuration and own inputs.
+    Scopings and fields of up to 100000 values are identified by their content.
+    Larger fields are identified by their instance, so that their data is not
+    downloaded, and get a new identity when they are modified through their
+    setters or their data arrays. Collections and meshes are identified by the
+    content of their small fields, and by their own instance for the larger ones,
+    and time frequency supports by their instance. An output already computed for
+    the same fingerprint is returned without requesting the server.
+
+    Outputs whose inputs cannot be fingerprinted are always computed. This is the
+    case for data sources with upstream data sources or streams, for pins connected
+    through a workflow, and for inputs which are not kept by the operator or the
+    workflow: the inputs are only kept alive when they are connected after the
+    output cache is set, and are otherwise only usable while they are alive.
+
+    A cache hit returns the instance stored in the cache, which is shared by all
+    the requests of the same output: it must not be modified in place, and must be
+    copied, for example with ``deep_copy``, before being modified. The arrays
+    returned from the cache are read-only. The large fields held by a connected
+    collection or mesh are retrieved as new instances, so their modifications in
+    place are not detected: the outputs must then be invalidated with
+    :func:`OutputCache.invalidate`.
+
+    Parameters
+    ----------
+    max_size : int, optional
+        Maximum number of outputs kept in memory, the least recently used ones
+        being dropped first. The default is ``128``.
+    directory : str or os.PathLike, optional
+        Directory in which the outputs are also stored, so that they can be
+        reused after being dropped from memory or by another process. The DPF
+        entities are written with the ``serializer`` operator, so the directory
+        must be accessible by the server, and are only stored for local servers.
+        Other outputs are pickled. The default is ``None``, in which case the
+        outputs are only kept in memory.
+    max_disk_size : int, optional
+        Maximum number of outputs kept in ``directory``, the least recently used
+        ones being removed first. The default is ``1024``.
+
+    Examples
+    --------
+    >>> from ansys.dpf import core as dpf
+    >>> from ansys.dpf.core import examples
+    >>> from ansys.dpf.core.output_cache import OutputCache
+    >>> data_src = dpf.DataSources(examples.find_simple_bar())
+    >>> disp_op = dpf.operators.result.displacement(data_sources=data_src)
+    >>> disp_op.output_cache = OutputCache(max_size=16)
+    >>> disp = disp_op.outputs.fields_container()
+    >>> disp = disp_op.outputs.fields_container()
+    >>> disp_op.output_cache.statistics.hits
+    1
+
+    """
+
+    def __init__(self, max_size=128, directory=None, max_disk_size=1024):
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1.")
+        self._max_size = max_size
+        self._directory = None
+        if directory is not None:
+            self._directory = os.path.abspath(os.fspath(directory))
+            os.makedirs(self._directory, exist_ok=True)
+        self._max_disk_size = max_disk_size
+        self._entries = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def directory(self):
+        """Directory in which the outputs are also stored, if any.
+
+        Returns
+        -------
+        str
+        """
+        return self._directory
+
+    @property
+    def statistics(self):
+        """Number of cache hits, misses and evictions, and current and maximum sizes.
+
+        Only the outputs kept in memory are counted in the size.
+
+        Returns
+        -------
+        CacheStatistics
+        """
+        return CacheStatistics(
+            self._hits, self._misses, self._evictions, len(self._entries), self._max_size
+        )
+
+    def __len__(self):
+        return len(self._entries)
+
+    def clear(self):
+        """Drop all the cached outputs, from memory and from the directory."""
+        self._entries.clear()
+        if self._directory is not None:
+            for path in self._disk_paths():
+                _remove(path)
+
+    def invalidate(self, obj):
+        """Drop the cached outputs of an operator or a workflow for its current inputs.
+
+        Parameters
+        ----------
+        obj : Operator, Workflow
+            Operator or workflow whose outputs must be computed again.
+        """
+        try:
+            source = obj._output_cache_source()
+        except _UnfingerprintableInputError:
+            return
+        for key in [key for key, entry in self._entries.items() if entry[0] == source]:
+            del self._entries[key]
+        if self._directory is not None:
+            for path in self._disk_paths():
+                if os.path.basename(path).startswith(source):
+                    _remove(path)
+
+    def _get_or_compute(self, obj, compute, pin, output_type):
+        """Return the cached output of an object, or compute and store it.
+
+        Parameters
+        ----------
+        obj : Operator, Workflow
+            Operator or workflow whose output is requested.
+        compute : callable
+            Function computing the output without the cache.
+        pin : int, str
+            Pin of the output.
+        output_type : type
+            Requested type of the output.
+        """
+        try:
+            source = obj._output_cache_source()
+        except _UnfingerprintableInputError:
+            self._misses += 1
+            return compute()
+        key = f"{source}-{_digest(pin, output_type.__module__, output_type.__qualname__)}"
+        if key in self._entries:
+            self._hits += 1
+            self._entries.move_to_end(key)
+            return self._entries[key][1]
+        value = self._load(key, output_type, obj._server)
+        if value is not None:
+            self._hits += 1
+        else:
+            self._misses += 1
+            value = compute()
+            if value is None:
+                return value
+            self._dump(key, value, obj._server)
+        if isinstance(value, np.ndarray):
+            value.flags.writeable = False
+        self._entries[key] = (source, value)
+        if len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+        return value
+
+    def _disk_paths(self):
+        return [
+            os.path.join(self._directory, name)
+            for name in os.listdir(self._directory)
+            if name.endswith((".dpf", ".pkl"))
+        ]
+
+    def _load(self, key, output_type, server):
+        if self._directory is None:
+            return None
+        path = os.path.join(self._directory, key)
+        try:
+            if os.path.exists(path + ".pkl"):
+                with open(path + ".pkl", "rb") as file:
+                    value = pickle.load(file)
+                os.utime(path + ".pkl")
+                return value
+            if os.path.exists(path + ".dpf") and server.local_server:
+                from ansys.dpf.core.operators.serialization import deserializer
+
+                value = deserializer(file_path=path + ".dpf", server=server).get_output(
+                    1, output_type
+                )
+                os.utime(path + ".dpf")
+                return value
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return None
+        return None
+
+    def _dump(self, key, value, server):
+        if self._directory is None:
+            return
+        path = os.path.join(self._directory, key)
+        if hasattr(value, "_internal_obj"):
+            if not server.local_server:
+                return
+            from ansys.dpf.core.operators.serialization import serializer
+
+            op = serializer(file_path=path + ".dpf", server=server)
+            op.connect(1, value)
+            op.run()
+        else:
+            try:
+                with open(path + ".pkl", "wb") as file:
+                    pickle.dump(value, file)
+            except (OSError, pickle.PicklingError, TypeError, AttributeError):
+                _remove(path + ".pkl")
+                return
+        paths = self._disk_paths()
+        if len(paths) > self._max_disk_size:
+            paths.sort(key=lambda p: os.stat(p).st_mtime_ns)
+            for old_path in paths[: len(paths) - self._max_disk_size]:
+                _remove(old_path)
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
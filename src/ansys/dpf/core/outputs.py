@@ -38,6 +38,10 @@ class Output:
 
     def get_data(self):
         """Retrieves the output of the operator."""
+        return self._get_data(self._operator.progress_bar)
+
+    def _get_data(self, progress_bar):
+        """Retrieves the output of the operator, with or without progress bar."""
         type_output = self._spec.type_names[0]
 
         if type_output == "abstract_meshed_region":
@@ -67,9 +71,11 @@ class Output:
                 for type_tuple in self._operator._type_to_output_method
                 if type_output_derive_class in type_tuple
             ]
-            return out_type[0][0](self._operator.get_output(self._pin, type_output))
+            return out_type[0][0](
+                self._operator._get_cached_output(self._pin, type_output, progress_bar)
+            )
         else:
-            return self._operator.get_output(self._pin, type_output)
+            return self._operator._get_cached_output(self._pin, type_output, progress_bar)
 
     def __call__(self):
         return self.get_data()
@@ -128,7 +128,7 @@ class _PyVistaPlotter:
             else:
                 grid = meshed_region.grid
         else:
-            grid = meshed_region._as_vtk(
+            grid = meshed_region._as_vtk_deformed(
                 meshed_region.deform_by(deform_by, scale_factor), as_linear=as_linear
             )
 
@@ -213,6 +213,7 @@ class _PyVistaPlotter:
         scale_factor=1.0,
         scale_factor_legend=None,
         as_linear=True,
+        data_buffer=None,
         **kwargs,
     ):
         # Get the field name
@@ -257,11 +258,20 @@ class _PyVistaPlotter:
             raise ValueError("Only elemental, nodal or faces location are supported for plotting.")
         component_count = field.component_count
         if component_count > 1:
-            overall_data = np.full((len(mesh_location), component_count), np.nan)
+            shape = (len(mesh_location), component_count)
         else:
-            overall_data = np.full(len(mesh_location), np.nan)
+            shape = (len(mesh_location),)
+        if data_buffer is None:
+            overall_data = np.full(shape, np.nan)
+        else:
+            if data_buffer.shape != shape:
+                raise ValueError(
+                    f"The shape of data_buffer must be {shape}, not {data_buffer.shape}."
+                )
+            overall_data = data_buffer
+            overall_data.fill(np.nan)
         if location != locations.overall:
-            ind, mask = mesh_location.map_scoping(field.scoping)
+            ind, mask = meshed_region._map_scoping(mesh_location, field.scoping)
             overall_data[ind] = field.data[mask]
         else:
             overall_data[:] = field.data[0]
@@ -273,7 +283,7 @@ class _PyVistaPlotter:
         if not deform_by:
             grid = meshed_region.grid
         else:
-            grid = meshed_region._as_vtk(
+            grid = meshed_region._as_vtk_deformed(
                 meshed_region.deform_by(deform_by, scale_factor), as_linear
             )
         grid.set_active_scalars(None)
@@ -461,7 +471,7 @@ class DpfPlotter:
     def add_plane(self, plane, field=None, **kwargs):
         self._internal_plotter.add_plane(plane, field, **kwargs)
 
-    def add_mesh(self, meshed_region, deform_by=None, scale_factor=1.0, **kwargs):
+    def add_mesh(self, meshed_region, deform_by=None, scale_factor=1.0, lod=None, **kwargs):
         """Add a mesh to plot.
 
         Parameters
@@ -473,6 +483,13 @@ class DpfPlotter:
             Defaults to None.
         scale_factor : float, optional
             Scaling factor to apply when warping the mesh. Defaults to 1.0.
+        lod : bool, int, LevelOfDetail, optional
+            Plot a reduced mesh instead of the full-resolution mesh, to render large
+            meshes interactively. ``True`` plots the skin of the mesh, an integer the
+            skin decimated to about this number of cells, and a
+            :class:`ansys.dpf.core.level_of_detail.LevelOfDetail` its reduced mesh.
+            The reduced meshes built from ``True`` or an integer are cached on the mesh.
+            Defaults to None.
         **kwargs : optional
             Additional keyword arguments for the plotter. More information
             are available at :func:`pyvista.plot`.
@@ -488,6 +505,14 @@ class DpfPlotter:
         >>> pl.add_mesh(mesh)
 
         """
+        if lod is not None:
+            from ansys.dpf.core.level_of_detail import _as_level_of_detail
+
+            lod = _as_level_of_detail(meshed_region, lod)
+        if lod is not None:
+            meshed_region = lod.reduced_mesh
+            if deform_by:
+                deform_by = lod.map_field(deform_by)
         if meshed_region.grid is not None:
             meshed_region.grid.clear_data()
         self._internal_plotter.add_mesh(
@@ -582,6 +607,8 @@ class DpfPlotter:
         label_point_size=20,
         deform_by=None,
         scale_factor=1.0,
+        data_buffer=None,
+        lod=None,
         **kwargs,
     ):
         """Add a field containing data to the plotter.
@@ -606,10 +633,31 @@ class DpfPlotter:
             Defaults to None.
         scale_factor : float, optional
             Scaling factor to apply when warping the mesh. Defaults to 1.0.
+        data_buffer : numpy.ndarray, optional
+            Preallocated float array receiving the data of the field mapped on the
+            entities of the mesh, of shape ``(n_entities,)`` for scalar fields or
+            ``(n_entities, component_count)`` otherwise. The plotted mesh references
+            this array, so it must only be reused once the plotter is cleared, for
+            example between the frames of an animation. Defaults to None, in which
+            case a new array is allocated.
+        lod : bool, int, LevelOfDetail, optional
+            Plot the field on a reduced mesh instead of the full-resolution mesh, to
+            render large meshes interactively. ``True`` plots the skin of the mesh, an
+            integer the skin decimated to about this number of cells, and a
+            :class:`ansys.dpf.core.level_of_detail.LevelOfDetail` its reduced mesh.
+            The field and the deformation are mapped on the reduced mesh. The reduced
+            meshes built from ``True`` or an integer are cached on the mesh.
+            Defaults to None.
         **kwargs : optional
             Additional keyword arguments for the plotter. More information
             are available at :func:`pyvista.plot`.
 
+        Notes
+        -----
+        The mapping between the scoping of the field and the entities of the mesh
+        is cached on the mesh, so that adding several fields with the same scoping,
+        such as the time steps of a result, only maps the IDs once.
+
         Examples
         --------
         >>> from ansys.dpf import core as dpf
@@ -622,6 +670,17 @@ class DpfPlotter:
         >>> pl.add_field(field, mesh)
 
         """
+        if lod is not None:
+            from ansys.dpf.core.level_of_detail import _as_level_of_detail
+
+            if meshed_region is None:
+                meshed_region = field.meshed_region
+            lod = _as_level_of_detail(meshed_region, lod)
+        if lod is not None:
+            meshed_region = lod.reduced_mesh
+            field = lod.map_field(field)
+            if deform_by:
+                deform_by = lod.map_field(deform_by)
         self._internal_plotter.add_field(
             field=field,
             meshed_region=meshed_region,
@@ -632,6 +691,7 @@ class DpfPlotter:
             deform_by=deform_by,
             scale_factor=scale_factor,
             as_linear=True,
+            data_buffer=data_buffer,
             **kwargs,
         )
 
@@ -922,7 +982,7 @@ class Plotter:
             overall_data = np.full(len(mesh_location), np.nan)
 
         for field in fields_container:
-            ind, mask = mesh_location.map_scoping(field.scoping)
+            ind, mask = mesh._map_scoping(mesh_location, field.scoping)
             overall_data[ind] = field.data[mask]
 
         # create the plotter and add the meshes
@@ -952,7 +1012,9 @@ class Plotter:
         )
         as_linear = True
         if deform_by:
-            grid = mesh._as_vtk(mesh.deform_by(deform_by, scale_factor), as_linear=as_linear)
+            grid = mesh._as_vtk_deformed(
+                mesh.deform_by(deform_by, scale_factor), as_linear=as_linear
+            )
             self._internal_plotter.add_scale_factor_legend(scale_factor, **kwargs)
         else:
             if as_linear != mesh.as_linear:
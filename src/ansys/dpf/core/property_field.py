@@ -8,6 +8,7 @@ from ansys.dpf.core.check_version import version_requires
 from ansys.dpf.core.common import natures, locations, _get_size_of_list
 from ansys.dpf.core import scoping, dimensionality
 from ansys.dpf.core.field_base import _FieldBase, _LocalFieldBase
+from ansys.dpf.core.output_cache import _modifies_instance
 from ansys.dpf.core.check_version import meets_version
 from ansys.dpf.core.field_definition import FieldDefinition
 from ansys.dpf.gate import (
@@ -148,6 +149,7 @@ class PropertyField(_FieldBase):
             return None
 
     @location.setter
+    @_modifies_instance
     def location(self, value):
         """Change the property field location.
 
@@ -201,7 +203,7 @@ class PropertyField(_FieldBase):
             self._api.csproperty_field_get_entity_data_for_dpf_vector(
                 self, vec, vec.internal_data, vec.internal_size, index
             )
-            data = dpf_array.DPFArray(vec)
+            data = self._as_dpf_array(vec)
 
         except NotImplementedError:
             data = self._api.csproperty_field_get_entity_data(self, index)
@@ -216,7 +218,7 @@ class PropertyField(_FieldBase):
             self._api.csproperty_field_get_entity_data_by_id_for_dpf_vector(
                 self, vec, vec.internal_data, vec.internal_size, id
             )
-            data = dpf_array.DPFArray(vec)
+            data = self._as_dpf_array(vec)
         except NotImplementedError:
             index = self.scoping.index(id)
             if index < 0:
@@ -227,6 +229,7 @@ class PropertyField(_FieldBase):
             data.shape = (data.size // n_comp, n_comp)
         return data
 
+    @_modifies_instance
     def append(self, data, scopingid):
         self._api.csproperty_field_push_back(self, scopingid, _get_size_of_list(data), data)
 
@@ -236,7 +239,7 @@ class PropertyField(_FieldBase):
             self._api.csproperty_field_get_data_pointer_for_dpf_vector(
                 self, vec, vec.internal_data, vec.internal_size
             )
-            return dpf_array.DPFArray(vec)
+            return self._as_dpf_array(vec)
 
         except NotImplementedError:
             return self._api.csproperty_field_get_data_pointer(self, True)
@@ -250,7 +253,7 @@ class PropertyField(_FieldBase):
             self._api.csproperty_field_get_data_for_dpf_vector(
                 self, vec, vec.internal_data, vec.internal_size
             )
-            data = dpf_array.DPFArray(vec) if np_array else dpf_array.DPFArray(vec).tolist()
+            data = self._as_dpf_array(vec) if np_array else dpf_array.DPFArray(vec).tolist()
         except NotImplementedError:
             data = self._api.csproperty_field_get_data(self, np_array)
         n_comp = self.component_count
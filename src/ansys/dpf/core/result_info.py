@@ -28,6 +28,7 @@ from ansys.dpf.core.check_version import version_requires
 from ansys.dpf.core.dimensionality import natures
 from ansys.dpf.core.common import locations
 from ansys.dpf.core.available_result import Homogeneity
+from ansys.dpf.core.cache import class_handling_cache
 
 
 @unique
@@ -60,6 +61,7 @@ class analysis_types(Enum):
     unknown_analysis = 9
 
 
+@class_handling_cache
 class ResultInfo:
     """Represents the result information.
 
@@ -248,6 +250,15 @@ class ResultInfo:
         >>> result_info.analysis_type
         'static'
 
+        """
+        return self._get_analysis_type()
+
+    def _get_analysis_type(self):
+        """
+        Returns
+        -------
+        analysis_type : str
+            Type of the analysis, such as static or transient.
         """
         return self._api.result_info_get_analysis_type_name(self)
 
@@ -287,6 +298,9 @@ class ResultInfo:
     @property
     def unit_system(self):
         """Unit system of the result."""
+        return self._get_unit_system()
+
+    def _get_unit_system(self):
         return self._api.result_info_get_unit_system_name(self)
 
     @property
@@ -339,7 +353,7 @@ class ResultInfo:
     @property
     def unit_system_name(self):
         """Name of the unit system."""
-        return self._api.result_info_get_unit_system_name(self)
+        return self._get_unit_system()
 
     @property
     def solver_version(self):
@@ -505,6 +519,12 @@ class ResultInfo:
         )
         return available_result.AvailableResult(availableresult)
 
+    _to_cache = {
+        _get_analysis_type: None,
+        _get_physics_type: None,
+        _get_unit_system: None,
+    }
+
     @property
     @version_requires("5.0")
     def available_qualifier_labels(self):
@@ -7,8 +7,15 @@ This module contains the Results and Result classes that are created by the mode
 to easily access results in result files."""
 import functools
 
+import numpy as np
+
 from ansys.dpf.core import Operator
 from ansys.dpf.core import errors
+from ansys.dpf.core.common import locations
+from ansys.dpf.core.dpf_operator import (
+    _cached_available_operator_names,
+    _cached_operator_description,
+)
 from ansys.dpf.core.scoping import Scoping
 from ansys.dpf.core.custom_fields_container import (
     ElShapeFieldsContainer,
@@ -16,6 +23,25 @@ from ansys.dpf.core.custom_fields_container import (
 )
 
 
+class _ResultProperty(property):
+    # Property of a result whose docstring, the description of the result operator,
+    # is only requested from the server when it is accessed, for example by ``help()``.
+
+    def __init__(self, fget, operator_name, server):
+        super().__init__(fget)
+        self._operator_name = operator_name
+        self._server = server
+
+    @property
+    def __doc__(self):
+        return _cached_operator_description(self._operator_name, server=self._server)
+
+    @__doc__.setter
+    def __doc__(self, value):
+        # the docstring is always read from the operator description
+        pass
+
+
 class Results:
     """Organizes the results from DPF into accessible methods.
 
@@ -126,12 +152,21 @@ class Results:
             return
         # dynamically add function based on input type
         self._op_map_rev = {}
+        available_operators = _cached_available_operator_names(self._server)
         for result_type in result_info:
             try:
-                doc = Operator(result_type.operator_name, server=self._server).__str__()
+                if available_operators is None:
+                    # the server cannot list its operators, check that this one exists
+                    Operator(result_type.operator_name, server=self._server)
+                elif result_type.operator_name not in available_operators:
+                    continue
                 bound_method = self.__result__
                 method2 = functools.partial(bound_method, result_type)
-                setattr(self.__class__, result_type.name, property(method2, doc=doc))
+                setattr(
+                    self.__class__,
+                    result_type.name,
+                    _ResultProperty(method2, result_type.operator_name, self._server),
+                )
 
                 self._op_map_rev[result_type.name] = result_type.name
             except errors.DPFServerException:
@@ -206,20 +241,14 @@ class Result:
         else:
             self._result_info = result_info
         self._specific_fc_type = None
-        from ansys.dpf.core import operators
 
         try:
-            # create the operator to read its documentation
+            # read the documentation of the operator, cached per server
             # if the operator doesn't exist, the method will not be added
-            doc = Operator(self._result_info.operator_name, server=self._server).__str__()
-            self.__doc__ = doc
-            if hasattr(operators, "result") and hasattr(operators.result, self._result_info.name):
-                self._operator = getattr(operators.result, self._result_info.name)(
-                    server=self._server
-                )
-            else:
-                self._operator = Operator(self._result_info.operator_name, server=self._server)
-            self._connector.__connect_op__(self._operator, self._mesh_by_default)
+            self.__doc__ = _cached_operator_description(
+                self._result_info.operator_name, server=self._server
+            )
+            self._operator = self._create_operator()
             self._operator._add_sub_res_operators(self._result_info.sub_results)
         except errors.DPFServerException:
             pass
@@ -227,6 +256,17 @@ class Result:
             print(self._result_info.name)
             raise e
 
+    def _create_operator(self):
+        """Create a result operator connected to the data sources or streams of the model."""
+        from ansys.dpf.core import operators
+
+        if hasattr(operators, "result") and hasattr(operators.result, self._result_info.name):
+            op = getattr(operators.result, self._result_info.name)(server=self._server)
+        else:
+            op = Operator(self._result_info.operator_name, server=self._server)
+        self._connector.__connect_op__(op, self._mesh_by_default)
+        return op
+
     def __call__(self, time_scoping=None, mesh_scoping=None):
         op = self._operator
         if time_scoping:
@@ -263,7 +303,10 @@ class Result:
         >>> fc = disp.on_all_time_freqs.eval()
 
         """
-        outputs = self.__call__().outputs
+        return self._evaluate(self.__call__())
+
+    def _evaluate(self, op):
+        outputs = op.outputs
         if hasattr(outputs, "fields_container"):
             fc = outputs.fields_container()
         else:
@@ -275,6 +318,106 @@ class Result:
             fc = BodyFieldsContainer(fields_container=fc._get_ownership(), server=fc._server)
         return fc
 
+    def iter_time_sets(self, chunk=1, prefetch=True):
+        """Evaluate the result provider by chunks of time sets.
+
+        Each chunk of cumulative time sets is evaluated by its own result operator,
+        which is released with its output before the evaluation of the next chunks,
+        so that the time steps of a large transient result never have to fit in
+        memory at once. The time sets are the ones previously selected, for example
+        with :func:`Result.on_time_scoping`, or all the time sets of the time
+        frequency support by default.
+
+        Parameters
+        ----------
+        chunk : int, optional
+            Number of time sets evaluated together. The default is ``1``.
+        prefetch : bool, optional
+            Whether to evaluate the next chunk in the background while the current one
+            is processed. At most two chunks are then held at the same time. The default
+            is ``True``.
+
+        Yields
+        ------
+        fields_container : FieldsContainer, ElShapeFieldsContainer, BodyFieldsContainer
+            Result on a chunk of time sets.
+
+        Examples
+        --------
+        Compute the maximum displacement norm over the time sets without evaluating
+        all of them at once.
+
+        >>> from ansys.dpf import core as dpf
+        >>> from ansys.dpf.core import examples
+        >>> model = dpf.Model(examples.find_msup_transient())
+        >>> disp = model.results.displacement
+        >>> max_norm = 0.0
+        >>> for fc in disp.iter_time_sets(chunk=5):
+        ...     norm = dpf.operators.math.norm_fc(fc).eval()
+        ...     max_norm = max(max_norm, max(field.data.max() for field in norm))
+
+        """
+        from ansys.dpf.core import time_freq_scoping_factory
+        from ansys.dpf.core._futures import _submit
+
+        if chunk < 1:
+            raise ValueError("chunk must be at least 1.")
+        time_sets = self._time_sets()
+        chunks = [time_sets[i : i + chunk] for i in range(0, len(time_sets), chunk)]
+
+        def evaluate_chunk(sets):
+            op = self._create_operator()
+            op.inputs.time_scoping(
+                time_freq_scoping_factory.scoping_by_sets(sets, server=self._server)
+            )
+            if self._mesh_scoping:
+                op.inputs.mesh_scoping(self._mesh_scoping)
+            if self._location:
+                op.inputs.requested_location(self._location)
+            return self._evaluate(op)
+
+        if not prefetch:
+            for sets in chunks:
+                yield evaluate_chunk(sets)
+            return
+        future = _submit(self._server, evaluate_chunk, chunks[0]) if chunks else None
+        try:
+            for i_chunk in range(len(chunks)):
+                fc = future.result()
+                future = None
+                if i_chunk + 1 < len(chunks):
+                    future = _submit(self._server, evaluate_chunk, chunks[i_chunk + 1])
+                yield fc
+                # release the chunk before evaluating the next ones
+                del fc
+        finally:
+            # the consumer stopped early: the prefetched chunk is not evaluated if it
+            # has not started yet
+            if future is not None:
+                future.cancel()
+
+    def _time_sets(self):
+        """Cumulative indices of the time sets selected, all the time sets by default."""
+        time_scoping = self._time_scoping
+        if time_scoping is None:
+            return list(range(1, self._connector.time_freq_support.n_sets + 1))
+        if isinstance(time_scoping, Scoping):
+            if time_scoping.location != locations.time_freq:
+                raise ValueError(
+                    "Only time scopings on cumulative time sets can be iterated, not on "
+                    f"the '{time_scoping.location}' location."
+                )
+            time_scoping = time_scoping.ids
+        if isinstance(time_scoping, int):
+            time_scoping = [time_scoping]
+        time_sets = list(time_scoping)
+        if not all(isinstance(time_set, (int, np.integer)) for time_set in time_sets):
+            raise ValueError(
+                "Only time scopings on cumulative time sets can be iterated, not on "
+                "time or frequency values."
+            )
+        return [int(time_set) for time_set in time_sets]
+
     @property
     def on_all_time_freqs(self):
         """Sets the time scoping to all the time frequencies of the time frequency support.
@@ -52,6 +52,7 @@ class RuntimeClientConfig(_RuntimeConfig):
     >>> client_config.stream_floats_instead_of_doubles = stream_floats_instead_of_doubles
     ... # or True/False
     >>> client_config.streaming_buffer_size = streaming_buffer_size # or 10000, 2000 ...
+    >>> client_config.modification_tracking = "write" # or "copy", "hash"
     """
 
     def __init__(self, data_tree, server=None):
@@ -134,6 +135,43 @@ class RuntimeClientConfig(_RuntimeConfig):
     def return_arrays(self, value):
         self._data_tree.add(return_arrays=int(value))
 
+    @property
+    def modification_tracking(self):
+        """How modifications of the arrays returned by the gRPC client
+        (for example :func:`ansys.dpf.core.Field.data`) are detected
+        to update the data on the server. Default is ``"copy"``.
+
+        - ``"copy"``: the data is copied when the array is created and compared
+          to the copy when the array is deleted.
+        - ``"hash"``: the data is hashed when the array is created and when it is deleted.
+          No copy is made.
+        - ``"write"``: only writes through the array (item assignment or in-place operations
+          such as ``+=``) mark it as modified. No copy nor comparison is made, but writes
+          through other means (for example, :func:`numpy.copyto`) are not detected.
+
+        Returns
+        -------
+        str
+
+        Notes
+        -----
+        This option is stored client side in Python.
+
+        """
+        from ansys.dpf.gate import misc as gate_misc
+
+        return gate_misc.client_config()["modification_tracking"]
+
+    @modification_tracking.setter
+    def modification_tracking(self, value):
+        from ansys.dpf.gate import misc as gate_misc
+
+        if value not in ("copy", "hash", "write"):
+            raise ValueError(
+                f"modification_tracking must be 'copy', 'hash' or 'write', got '{value}'."
+            )
+        gate_misc.client_config()["modification_tracking"] = value
+
     def copy_config(self, config):
         config._data_tree.add(self._data_tree.to_dict())
 
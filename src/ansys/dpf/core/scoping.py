@@ -411,12 +411,56 @@ class _LocalScoping(Scoping):
         self.__cache_data__(scoping)
 
     def __cache_data__(self, owner_scoping):
-        self._scoping_ids_copy = owner_scoping._get_ids(False)
         self._location = owner_scoping.location
-        self.__init_map__()
+        self._store_ids(owner_scoping._get_ids(True))
+
+    def _store_ids(self, ids):
+        """Copy the IDs in the growable buffer and drop the ID to index map."""
+        ids = np.asarray(ids, dtype=np.int32).reshape(-1)
+        self._ids_buffer = np.array(ids, dtype=np.int32)
+        self._n_ids = ids.size
+        self._mapper = None
+        self._n_mapped = 0
+        self._appended = {}
+
+    def _reserve(self, size):
+        """Grow the IDs buffer geometrically so that it can hold ``size`` IDs."""
+        if size > self._ids_buffer.size:
+            buffer = np.empty(max(size, 2 * self._ids_buffer.size, 16), dtype=np.int32)
+            buffer[: self._n_ids] = self._ids_buffer[: self._n_ids]
+            self._ids_buffer = buffer
 
-    def __init_map__(self):
-        self._mapper = dict(zip(self._scoping_ids_copy, np.arange(self._count())))
+    @property
+    def _scoping_ids_copy(self):
+        return self._ids_buffer[: self._n_ids]
+
+    def _get_mapper(self):
+        """ID to index map, built on first use and then maintained incrementally.
+
+        The IDs indexed by the map are followed by the IDs appended since it was built,
+        whose first indices are stored in the ``_appended`` dictionary. The map is
+        rebuilt once this dictionary grows larger than the map, so that appending and
+        looking up IDs in a loop stays linear overall.
+        """
+        if self._mapper is None or len(self._appended) > max(1024, self._n_mapped):
+            from ansys.dpf.core._id_index import IdToIndexMap
+
+            self._mapper = IdToIndexMap(self._scoping_ids_copy)
+            self._n_mapped = self._n_ids
+            self._appended = {}
+        return self._mapper
+
+    def _index_appended(self, start):
+        """Add the IDs from index ``start`` to the dictionary of appended IDs."""
+        if self._mapper is None:
+            return
+        if self._n_ids - start > max(1024, self._n_mapped):
+            # rebuilding the whole map on the next lookup is faster
+            self._mapper = None
+            return
+        appended = self._appended
+        for index, id in enumerate(self._ids_buffer[start : self._n_ids].tolist(), start):
+            appended.setdefault(id, index)
 
     def _count(self):
         """
@@ -425,7 +469,7 @@ class _LocalScoping(Scoping):
         count : int
             Number of scoping IDs.
         """
-        return len(self._scoping_ids_copy)
+        return self._n_ids
 
     def _get_location(self):
         """Retrieve the location of the IDs.
@@ -461,14 +505,9 @@ class _LocalScoping(Scoping):
         -----
         Print a progress bar.
         """
-        # must convert to a list for gRPC
         if isinstance(ids, range):
-            ids = list(ids)
-        elif isinstance(ids, (np.ndarray, np.generic)):
-            ids = ids.tolist()
-
-        self._scoping_ids_copy = ids
-        self.__init_map__()
+            ids = np.arange(ids.start, ids.stop, ids.step, dtype=np.int32)
+        self._store_ids(ids)
 
     def _get_ids(self, np_array=False):
         """
@@ -482,9 +521,9 @@ class _LocalScoping(Scoping):
         Print a progress bar.
         """
         if np_array:
-            return np.ndarray(self._scoping_ids_copy, dtype=np.int32)
+            return self._scoping_ids_copy.copy()
         else:
-            return self._scoping_ids_copy
+            return self._scoping_ids_copy.tolist()
 
     @_setter
     def set_id(self, index, scopingid):
@@ -499,15 +538,62 @@ class _LocalScoping(Scoping):
         """
         init_size = self._count()
         if init_size <= index:
-            for i in range(init_size, index + 1):
-                self._scoping_ids_copy.append(-1)
-        self._scoping_ids_copy[index] = scopingid
-        self._mapper[scopingid] = index
+            self._reserve(index + 1)
+            self._ids_buffer[init_size : index + 1] = -1
+            self._n_ids = index + 1
+            self._ids_buffer[index] = scopingid
+            self._index_appended(init_size)
+            return
+        if self._mapper is not None and (
+            index < self._n_mapped
+            or self._appended.get(int(self._ids_buffer[index])) == index
+        ):
+            # an indexed ID is replaced
+            self._mapper = None
+        self._ids_buffer[index] = scopingid
+        if self._mapper is not None and self._appended.get(scopingid, index) >= index:
+            self._appended[scopingid] = index
 
     @_setter
     def append(self, id):
-        self._scoping_ids_copy.append(id)
-        self._mapper[id] = len(self) - 1
+        """Add an ID at the end of the scoping.
+
+        Parameters
+        ----------
+        id : int
+            ID to add.
+        """
+        self._reserve(self._n_ids + 1)
+        self._ids_buffer[self._n_ids] = id
+        self._n_ids += 1
+        if self._mapper is not None:
+            self._appended.setdefault(int(id), self._n_ids - 1)
+
+    @_setter
+    def append_many(self, ids):
+        """Add IDs at the end of the scoping.
+
+        Parameters
+        ----------
+        ids : list[int], numpy.ndarray
+            IDs to add.
+
+        Examples
+        --------
+        >>> from ansys.dpf import core as dpf
+        >>> import numpy as np
+        >>> scoping = dpf.Scoping()
+        >>> with scoping.as_local_scoping() as local_scoping:
+        ...     local_scoping.append_many(np.arange(1, 101))
+        >>> scoping.size
+        100
+
+        """
+        ids = np.asarray(ids, dtype=np.int32).reshape(-1)
+        self._reserve(self._n_ids + ids.size)
+        self._ids_buffer[self._n_ids : self._n_ids + ids.size] = ids
+        self._n_ids += ids.size
+        self._index_appended(self._n_ids - ids.size)
 
     def _get_id(self, index):
         """Retrieve the index that the scoping ID is located on.
@@ -522,7 +608,7 @@ class _LocalScoping(Scoping):
         id : int
             ID of the scoping's index.
         """
-        return self._scoping_ids_copy[index]
+        return int(self._scoping_ids_copy[index])
 
     def _get_index(self, scopingid):
         """Retrieve an ID corresponding to an ID in the scoping.
@@ -535,9 +621,12 @@ class _LocalScoping(Scoping):
         Returns
         -------
         index : int
-            Index of the ID.
+            Index of the ID, ``-1`` if the ID is not in the scoping.
         """
-        return self._mapper[scopingid]
+        index = self._get_mapper().get(scopingid)
+        if index is None:
+            index = self._appended.get(scopingid, -1)
+        return index
 
     def release_data(self):
         """Release the data."""
@@ -0,0 +1,266 @@
+"""
+.. _ref_server_pool:
+
+ServerPool
+==========
+Evaluate independent tasks, such as the post-processing of many result files,
+in parallel on several local DPF servers.
+"""
+import queue
+import time
+import traceback
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, NamedTuple
+
+from ansys.dpf import core
+from ansys.dpf.core import server as server_module
+
+
+class TaskResult(NamedTuple):
+    """Output of a task evaluated by a :class:`ServerPool`, with its timing."""
+
+    task: Any
+    """Task given to the pool."""
+    output: Any
+    """Output of the task, copied on the gather server when requested."""
+    server_index: int
+    """Index of the server of the pool which evaluated the task."""
+    elapsed_time: float
+    """Time spent evaluating the task on its server, in seconds."""
+    gather_time: float
+    """Time spent copying the output on the gather server, in seconds."""
+
+
+class ServerPool:
+    """Pool of local DPF gRPC servers evaluating independent tasks in parallel.
+
+    Each task is sent to the next available server of the pool, so that long
+    and short tasks are balanced across the servers. The outputs are copied
+    back to a gather server, by default the global server, with their
+    ``deep_copy`` method.
+
+    Parameters
+    ----------
+    n_servers : int, optional
+        Number of servers to start. The default is ``2``.
+    config : ServerConfig, optional
+        Type of the servers to start. The default is
+        :class:`ansys.dpf.core.AvailableServerConfigs.GrpcServer`.
+    ansys_path : str or os.PathLike, optional
+        Root path for the Ansys installation directory. The default is the
+        latest Ansys installation.
+    context : ServerContext, optional
+        Settings used to load the DPF plugins of the servers. The default is
+        ``server_context.SERVER_CONTEXT``.
+    timeout : float, optional
+        Maximum number of seconds for the start of each server. The default is ``20``.
+    gather_server : server.DPFServer, optional
+        Server on which the outputs are copied. The default is ``None``, in which
+        case the global server is used.
+
+    Examples
+    --------
+    Compute the stress of several result files on two servers.
+
+    >>> from ansys.dpf import core as dpf
+    >>> from ansys.dpf.core import examples
+    >>> from ansys.dpf.core.server_pool import ServerPool
+    >>> paths = [examples.find_simple_bar(), examples.find_static_rst()]
+    >>> with ServerPool(n_servers=2) as pool:
+    ...     results = pool.evaluate_models(paths, lambda model: model.results.stress().eval())
+    >>> stress = results[0].output
+    >>> elapsed_time = results[0].elapsed_time
+
+    """
+
+    def __init__(
+        self,
+        n_servers=2,
+        config=None,
+        ansys_path=None,
+        context=None,
+        timeout=20.0,
+        gather_server=None,
+    ):
+        if n_servers < 1:
+            raise ValueError("A server pool requires at least one server.")
+        if config is None:
+            config = core.AvailableServerConfigs.GrpcServer
+        self._servers = []
+        try:
+            for _ in range(n_servers):
+                self._servers.append(
+                    server_module.start_local_server(
+                        ansys_path=ansys_path,
+                        as_global=False,
+                        config=config,
+                        context=context,
+                        timeout=timeout,
+                    )
+                )
+        except:
+            self.shutdown()
+            raise
+        self._gather_server = gather_server
+        self._available_servers = queue.Queue()
+        for index in range(n_servers):
+            self._available_servers.put(index)
+        self._executor = ThreadPoolExecutor(
+            max_workers=n_servers, thread_name_prefix="dpf_server_pool"
+        )
+
+    @property
+    def servers(self):
+        """Servers of the pool.
+
+        Returns
+        -------
+        list[server.DPFServer]
+        """
+        return list(self._servers)
+
+    def __len__(self):
+        return len(self._servers)
+
+    def submit(self, function, task, gather=True):
+        """Evaluate a task on the next available server of the pool.
+
+        Parameters
+        ----------
+        function : callable
+            Function called with a server of the pool and the task, as
+            ``function(server, task)``, which returns the output of the task.
+        task : Any
+            Task to evaluate, for example the path of a result file.
+        gather : bool, optional
+            Whether to copy the output on the gather server. The default is ``True``.
+
+        Returns
+        -------
+        concurrent.futures.Future
+            Future holding the :class:`TaskResult` of the task.
+        """
+        return self._executor.submit(self._run_task, function, task, gather)
+
+    def map(self, function, tasks, gather=True):
+        """Evaluate tasks on the servers of the pool and wait for their outputs.
+
+        Parameters
+        ----------
+        function : callable
+            Function called with a server of the pool and a task, as
+            ``function(server, task)``, which returns the output of the task.
+        tasks : iterable
+            Tasks to evaluate.
+        gather : bool, optional
+            Whether to copy the outputs on the gather server. The default is ``True``.
+
+        Returns
+        -------
+        list[TaskResult]
+            Results of the tasks, in the order of the tasks.
+        """
+        futures = [self.submit(function, task, gather) for task in tasks]
+        return [future.result() for future in futures]
+
+    def evaluate_models(self, paths, function, gather=True):
+        """Evaluate a function on the models of result files.
+
+        Parameters
+        ----------
+        paths : iterable of str or os.PathLike
+            Paths of the result files, which must be accessible by the servers.
+        function : callable
+            Function called with a :class:`ansys.dpf.core.Model` of each result file,
+            which returns the output of the task.
+        gather : bool, optional
+            Whether to copy the outputs on the gather server. The default is ``True``.
+
+        Returns
+        -------
+        list[TaskResult]
+            Results of the tasks, whose ``task`` is the path of the result file.
+        """
+
+        def evaluate_model(server, path):
+            return function(core.Model(path, server=server))
+
+        return self.map(evaluate_model, paths, gather)
+
+    def evaluate_workflow(self, workflow, output_name, output_type, inputs, gather=True):
+        """Evaluate a workflow on the servers of the pool for several sets of inputs.
+
+        The workflow is copied on the server evaluating each set of inputs.
+
+        Parameters
+        ----------
+        workflow : Workflow
+            Workflow to evaluate.
+        output_name : str
+            Name of the output of the workflow to retrieve.
+        output_type : core.type enum
+            Type of the output.
+        inputs : iterable of dict
+            Sets of inputs, each one mapping the input names of the workflow to the
+            values to connect. These values must not be DPF entities held by another
+            server, use numbers, strings or lists instead.
+        gather : bool, optional
+            Whether to copy the outputs on the gather server. The default is ``True``.
+
+        Returns
+        -------
+        list[TaskResult]
+            Results of the tasks, whose ``task`` is the set of inputs.
+        """
+
+        def evaluate(server, workflow_inputs):
+            server_workflow = workflow.create_on_other_server(server=server)
+            server_workflow.progress_bar = False
+            for name, value in workflow_inputs.items():
+                server_workflow.connect(name, value)
+            return server_workflow.get_output(output_name, output_type)
+
+        return self.map(evaluate, inputs, gather)
+
+    def _run_task(self, function, task, gather):
+        index = self._available_servers.get()
+        try:
+            start = time.perf_counter()
+            output = function(self._servers[index], task)
+            elapsed_time = time.perf_counter() - start
+        finally:
+            self._available_servers.put(index)
+        gather_time = 0.0
+        if gather:
+            start = time.perf_counter()
+            output = self._gather(output)
+            gather_time = time.perf_counter() - start
+        return TaskResult(task, output, index, elapsed_time, gather_time)
+
+    def _gather(self, output):
+        """Copy an output, or a list or tuple of outputs, on the gather server."""
+        if isinstance(output, (list, tuple)):
+            return type(output)(self._gather(item) for item in output)
+        if hasattr(output, "deep_copy") and hasattr(output, "_server"):
+            gather_server = server_module.get_or_create_server(self._gather_server)
+            if output._server is not gather_server:
+                return output.deep_copy(server=gather_server)
+        return output
+
+    def shutdown(self):
+        """Wait for the tasks submitted to the pool and shut down its servers."""
+        if hasattr(self, "_executor"):
+            self._executor.shutdown(wait=True)
+        for server in self._servers:
+            try:
+                server.shutdown()
+            except:
+                warnings.warn(traceback.format_exc())
+        self._servers = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self.shutdown()
@@ -12,8 +12,10 @@ import subprocess
 import time
 import warnings
 import traceback
+import weakref
 from threading import Thread, Lock
 from abc import ABC
+from concurrent.futures import ThreadPoolExecutor
 from ctypes import *
 
 import psutil
@@ -343,6 +345,107 @@ def check_ansys_grpc_dpf_version(server, timeout):
         )
 
 
+class _SharedConnection:
+    """Connection to a gRPC server shared by the server instances with the same address.
+
+    It also holds the information retrieved once from the server, so that the
+    instances sharing the connection do not request it again.
+    """
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.version = None
+        self.os = None
+        self.info = None
+        self._thread_pool = None
+        self._lock = Lock()
+
+    def get_thread_pool(self, max_workers):
+        with self._lock:
+            if self._thread_pool is None:
+                self._thread_pool = ThreadPoolExecutor(
+                    max_workers=max_workers, thread_name_prefix="dpf_async"
+                )
+            return self._thread_pool
+
+    def __del__(self):
+        try:
+            if self._thread_pool is not None:
+                self._thread_pool.shutdown(wait=False)
+        except:
+            warnings.warn(traceback.format_exc())
+
+
+class ConnectionPool:
+    """Process-wide pool of the connections to the gRPC servers, keyed by address.
+
+    The servers connected to an address with
+    :func:`ansys.dpf.core.server.connect_to_server` share the same gRPC
+    connection, the server information and version retrieved at connection time,
+    and the thread pool running their asynchronous requests. A connection is
+    closed once no server uses it anymore. Servers launched by the client keep
+    their own connection.
+
+    Parameters
+    ----------
+    max_concurrent_streams : int, optional
+        Maximum number of asynchronous requests sent at the same time through a
+        connection. The default is ``None``, in which case the default number of
+        workers of a :class:`concurrent.futures.ThreadPoolExecutor` is used.
+
+    Examples
+    --------
+    >>> from ansys.dpf.core import server_types
+    >>> server_types.CONNECTION_POOL.max_concurrent_streams = 8
+
+    """
+
+    def __init__(self, max_concurrent_streams=None):
+        self.max_concurrent_streams = max_concurrent_streams
+        self.enabled = True
+        self._connections = weakref.WeakValueDictionary()
+        self._lock = Lock()
+
+    def _get_connection(self, kind, address, create_connection):
+        """Retrieve the shared connection to an address or create it.
+
+        Parameters
+        ----------
+        kind : str
+            Kind of connection, connections of different kinds are not shared.
+        address : str
+            Address of the server.
+        create_connection : callable
+            Function creating the connection.
+
+        Returns
+        -------
+        connection : _SharedConnection
+        reused : bool
+            Whether the connection already existed.
+        """
+        with self._lock:
+            if not self.enabled:
+                return _SharedConnection(create_connection()), False
+            connection = self._connections.get((kind, address))
+            if connection is not None:
+                return connection, True
+            connection = _SharedConnection(create_connection())
+            self._connections[(kind, address)] = connection
+            return connection, False
+
+    def clear(self):
+        """Stop sharing the existing connections with the servers created afterwards."""
+        with self._lock:
+            self._connections.clear()
+
+    def __len__(self):
+        return len(self._connections)
+
+
+CONNECTION_POOL = ConnectionPool()
+
+
 class GhostServer:
     ip: str
     _port: int
@@ -383,6 +486,44 @@ class BaseServer(abc.ABC):
         self._context = None
         self._info_instance = None
         self._docker_config = server_factory.RunningDockerConfig()
+        self._operator_names_cache = None
+        self._operator_descriptions_cache = {}
+        self._specification_cache = None
+        self._metadata_cache = None
+        self._thread_pool_instance = None
+        self._thread_pool_lock = Lock()
+        self._connection = None
+
+    @property
+    def _thread_pool(self):
+        """Pool of threads running the asynchronous requests sent to this server.
+
+        Requests sent to a gRPC server overlap, up to
+        ``CONNECTION_POOL.max_concurrent_streams`` at a time. Requests sent to an
+        in-process server are run one at a time, but without blocking the calling thread.
+        """
+        if self._connection is not None:
+            return self._connection.get_thread_pool(CONNECTION_POOL.max_concurrent_streams)
+        with self._thread_pool_lock:
+            if self._thread_pool_instance is None:
+                if isinstance(self, InProcessServer):
+                    max_workers = 1
+                else:
+                    max_workers = CONNECTION_POOL.max_concurrent_streams
+                self._thread_pool_instance = ThreadPoolExecutor(
+                    max_workers=max_workers, thread_name_prefix="dpf_async"
+                )
+            return self._thread_pool_instance
+
+    def _clear_operator_caches(self):
+        """Clear the operator information cached for this server.
+
+        This must be called when the available operators change, for example when a
+        library of operators is loaded.
+        """
+        self._operator_names_cache = None
+        self._operator_descriptions_cache = {}
+        self._specification_cache = None
 
     def set_as_global(self, as_global=True):
         """Set the current server as global if necessary.
@@ -432,10 +573,19 @@ class BaseServer(abc.ABC):
             and ``"path"`` keys.
         """
         if not self._info_instance:
-            self._info_instance = self._base_service.server_info
+            self._info_instance = self._load_info()
             self._info_instance["path"] = self.ansys_path
         return self._info_instance
 
+    def _load_info(self):
+        """Retrieve the server information, once per shared connection."""
+        if self._connection is not None and self._connection.info is not None:
+            return dict(self._connection.info)
+        info = self._base_service.server_info
+        if self._connection is not None:
+            self._connection.info = dict(info)
+        return info
+
     def _del_session(self):
         if self._session_instance:
             self._session_instance.delete()
@@ -595,6 +745,12 @@ class BaseServer(abc.ABC):
         return not self.__eq__(other_server)
 
     def __del__(self):
+        try:
+            if getattr(self, "_thread_pool_instance", None) is not None:
+                self._thread_pool_instance.shutdown(wait=False)
+        except:
+            warnings.warn(traceback.format_exc())
+
         try:
             if hasattr(core, "SERVER") and id(core.SERVER) == id(self):
                 core.SERVER = None
@@ -690,7 +846,8 @@ class GrpcServer(CServer):
         # Load Ans.Dpf.GrpcClient
         self._grpc_client_path = load_api.load_grpc_client(ansys_path=ansys_path)
 
-        self._client = GrpcClient()
+        # the client of a server which is not launched may be shared, see ConnectionPool
+        self._client = GrpcClient() if launch_server else None
         self._own_process = launch_server
         self._local_server = False
         self._os = None
@@ -725,7 +882,19 @@ class GrpcServer(CServer):
                 self._local_server = True
 
         # store port and ip for later reference
-        self._client.set_address(address, self)
+        if launch_server:
+            self._client.set_address(address, self)
+        else:
+
+            def create_client():
+                self._client = GrpcClient()
+                self._client.set_address(address, self)
+                return self._client
+
+            self._connection, _ = CONNECTION_POOL._get_connection(
+                "grpc", address, create_client
+            )
+            self._client = self._connection.connection
         self._address = address
         self._input_ip = ip
         self._input_port = port
@@ -752,6 +921,8 @@ class GrpcServer(CServer):
 
     @property
     def version(self):
+        if not self._version and self._connection is not None:
+            self._version = self._connection.version
         if not self._version:
             from ansys.dpf.gate import data_processing_capi, integral_types
 
@@ -760,15 +931,21 @@ class GrpcServer(CServer):
             minor = integral_types.MutableInt32()
             api.data_processing_get_server_version_on_client(self.client, major, minor)
             self._version = str(int(major)) + "." + str(int(minor))
+            if self._connection is not None:
+                self._connection.version = self._version
         return self._version
 
     @property
     def os(self):
+        if not self._os and self._connection is not None:
+            self._os = self._connection.os
         if not self._os:
             from ansys.dpf.gate import data_processing_capi
 
             api = data_processing_capi.DataProcessingCAPI
             self._os = api.data_processing_get_os_on_client(self.client)
+            if self._connection is not None:
+                self._connection.os = self._os
         return self._os
 
     def _create_shutdown_funcs(self):
@@ -1075,7 +1252,14 @@ class LegacyGrpcServer(BaseServer):
         if misc.RUNTIME_CLIENT_CONFIG is not None:
             self_config = settings.get_runtime_client_config(server=self)
             misc.RUNTIME_CLIENT_CONFIG.copy_config(self_config)
-        self.channel = grpc.insecure_channel(address)
+        reused_connection = False
+        if launch_server:
+            self.channel = grpc.insecure_channel(address)
+        else:
+            self._connection, reused_connection = CONNECTION_POOL._get_connection(
+                "legacy_grpc", address, lambda: grpc.insecure_channel(address)
+            )
+            self.channel = self._connection.connection
 
         # store the address for later reference
         self._address = address
@@ -1086,7 +1270,9 @@ class LegacyGrpcServer(BaseServer):
 
         self._create_shutdown_funcs()
 
-        check_ansys_grpc_dpf_version(self, timeout)
+        # a shared connection has already been checked
+        if not (reused_connection and self._connection.info is not None):
+            check_ansys_grpc_dpf_version(self, timeout)
         try:
             self._base_service.initialize_with_context(context)
             self._context = context
@@ -1196,7 +1382,7 @@ class LegacyGrpcServer(BaseServer):
     @property
     def info(self):
         if not self._info_instance:
-            self._info_instance = self._base_service.server_info
+            self._info_instance = self._load_info()
         return self._info_instance
 
     @property
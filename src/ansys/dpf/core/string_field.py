@@ -9,6 +9,7 @@ from ansys.dpf.core import scoping
 from ansys.dpf.core import server as server_module
 from ansys.dpf.core import errors
 from ansys.dpf.core.field_base import _FieldBase
+from ansys.dpf.core.output_cache import _modifies_instance
 from ansys.dpf.gate import (
     string_field_abstract_api,
     string_field_capi,
@@ -128,6 +129,7 @@ class StringField(_FieldBase):
             return None
 
     @location.setter
+    @_modifies_instance
     def location(self, value):
         """Change the property field location.
 
@@ -199,6 +201,7 @@ class StringField(_FieldBase):
             data = self.get_entity_data(index)
             return data
 
+    @_modifies_instance
     def append(self, data: List[str], scopingid: int):
         string_list = integral_types.MutableListString(data)
         self._api.csstring_field_push_back(self, scopingid, _get_size_of_list(data), string_list)
@@ -9,6 +9,7 @@ from ansys.dpf.gate import time_freq_support_capi, time_freq_support_grpcapi
 from ansys import dpf
 from ansys.dpf import core
 from ansys.dpf.core import errors as dpf_errors
+from ansys.dpf.core.output_cache import _modifies_instance
 from ansys.dpf.core.support import Support
 
 
@@ -102,6 +103,7 @@ class TimeFreqSupport(Support):
         """
         return self._get_frequencies()
 
+    @_modifies_instance
     def _set_time_frequencies(self, frequencies):
         """Set the time frequencies of the time_freq_support.
         Frequencies field can have one value by set.
@@ -142,6 +144,7 @@ class TimeFreqSupport(Support):
         """
         return self._get_frequencies(cplx=True)
 
+    @_modifies_instance
     def _set_complex_frequencies(self, complex_frequencies):
         """Set the frequencies of the time_freq_support.
         Complex frequencies field can have one value by set.
@@ -174,6 +177,7 @@ class TimeFreqSupport(Support):
         """
         return self._get_rpms()
 
+    @_modifies_instance
     def _set_rpms(self, rpms):
         """Set the RPMs values of the time_freq_support.
         RPMs field has one value by load step.
@@ -213,6 +217,7 @@ class TimeFreqSupport(Support):
         """
         return self._get_harmonic_indices(stage_num)
 
+    @_modifies_instance
     def set_harmonic_indices(self, harmonic_indices, stage_num=0):
         """Set the harmonic indices values of the time frequency support.
 
@@ -397,6 +402,7 @@ class TimeFreqSupport(Support):
         if harmonic_indices is not None:
             return dpf.core.Field(server=self._server, field=harmonic_indices)
 
+    @_modifies_instance
     def append_step(
         self,
         step_id,
@@ -523,6 +529,7 @@ class TimeFreqSupport(Support):
                 break
         return tf
 
+    @_modifies_instance
     def _set_harmonic_indices_at_stage(self, stage_num, step_harmonic_indices, step_id):
         """Set values for harmonic indices for a specific stage number.
 
@@ -194,59 +194,34 @@ def dpf_mesh_to_vtk_py(mesh, nodes, as_linear):
         coordinates_field = nodes
         node_coordinates = nodes.data
 
-    elem_size = np.ediff1d(np.append(connectivity._data_pointer, connectivity.shape))
-
-    faces_nodes_connectivity = mesh.property_field("faces_nodes_connectivity")
-    faces_nodes_connectivity_dp = np.append(
-        faces_nodes_connectivity._data_pointer, len(faces_nodes_connectivity)
-    )
-    elements_faces_connectivity = mesh.property_field("elements_faces_connectivity")
-    elements_faces_connectivity_dp = np.append(
-        elements_faces_connectivity._data_pointer, len(elements_faces_connectivity)
-    )
-
-    insert_ind = np.cumsum(elem_size)
-    insert_ind = np.hstack(([0], insert_ind))[:-1]
-
-    # partition cells in vtk format
-    cells = np.insert(connectivity.data, insert_ind, elem_size)
+    connectivity_dp = connectivity._data_pointer
+    elem_size = np.ediff1d(np.append(connectivity_dp, connectivity.shape))
 
     # Check if polyhedrons are present
     if element_types.Polyhedron.value in etypes:
-        cells = np.array(cells)
-        nodes = np.array(node_coordinates)
-        insert_ind = insert_ind + np.asarray(list(range(len(insert_ind))))
-        # Replace in cells values for polyhedron format
-        # [NValuesToFollow,
-        # NFaces, Face1NPoints, Face1Point1, Face1Point2..., Face1PointN, FaceNNPoints,...]]
-        for i, ind in reversed(list(enumerate(insert_ind))):
-            # Check if this is a polyhedron
-            if etypes[i] == element_types.Polyhedron.value:
-                # Construct the connectivity for the poly element
-                poly_connectivity = []
-                faces = elements_faces_connectivity.data[
-                    elements_faces_connectivity_dp[i] : elements_faces_connectivity_dp[i + 1]
-                ]
-                for face in faces:
-                    face_connectivity = faces_nodes_connectivity.data[
-                        faces_nodes_connectivity_dp[face] : faces_nodes_connectivity_dp[face + 1]
-                    ]
-                    face_fmt = [len(face_connectivity)] + list(face_connectivity)
-                    poly_connectivity += face_fmt
-                polyhedron = [len(faces)] + poly_connectivity
-                polyhedron = [len(polyhedron)] + polyhedron
-                # Replace the whole sequence between this index and the next
-                r = list(range(ind, ind + elem_size[i] + 1))
-                cells = np.delete(cells, r)
-                cells = np.insert(cells, ind, polyhedron)
-
-    def compute_offset():
-        """Return the starting point of a cell in the cells array"""
-        return insert_ind + np.arange(insert_ind.size)
-
-    cells_insert_ind = compute_offset()
+        # Each property field's data and data pointer are fetched once
+        faces_nodes_connectivity = mesh.property_field("faces_nodes_connectivity")
+        elements_faces_connectivity = mesh.property_field("elements_faces_connectivity")
+        cells, cells_insert_ind, cell_sizes = _cells_with_polyhedrons(
+            etypes,
+            np.asarray(connectivity.data),
+            connectivity_dp,
+            np.asarray(elements_faces_connectivity.data),
+            elements_faces_connectivity._data_pointer,
+            np.asarray(faces_nodes_connectivity.data),
+            faces_nodes_connectivity._data_pointer,
+        )
+    else:
+        insert_ind = np.cumsum(elem_size)
+        insert_ind = np.hstack(([0], insert_ind))[:-1]
+
+        # partition cells in vtk format
+        cells = np.insert(connectivity.data, insert_ind, elem_size)
+        # starting point of each cell in the cells array
+        cells_insert_ind = insert_ind + np.arange(insert_ind.size)
+        cell_sizes = elem_size + 1
+
     # convert kAns to VTK cell type
-    offset = None
     if as_linear:
         # Map the vtk_cell_type to linear versions of the initial elements types
         vtk_cell_type = VTK_LINEAR_MAPPING[etypes]
@@ -283,11 +258,10 @@ def dpf_mesh_to_vtk_py(mesh, nodes, as_linear):
         # Handle semi-parabolic elements
         semi_mask = cells == -1
         if semi_mask.any():
-            cells_insert_ind = compute_offset()
             # Create a global mask of connectivity values to take
             mask = np.full(cells.shape, True)
             # Build a map of size cells with repeated element beginning index
-            repeated_insert_ind = cells_insert_ind.repeat(repeats=elem_size + 1)
+            repeated_insert_ind = cells_insert_ind.repeat(repeats=cell_sizes)
             # Apply the semi-mask to get a unique set of indices of semi-parabolic elements in cells
             semi_indices_in_cells = np.array(list(set(repeated_insert_ind[semi_mask])))
             semi_sizes = cells[semi_indices_in_cells]
@@ -326,11 +300,98 @@ def dpf_mesh_to_vtk_py(mesh, nodes, as_linear):
 
         return grid
 
-    # might be computed when checking for VTK quadratic bug
-    if offset is None:
-        offset = compute_offset()
+    return pv.UnstructuredGrid(cells_insert_ind, cells, vtk_cell_type, node_coordinates)
+
+
+def _concatenated_ranges(starts, lengths):
+    """Return the concatenation of ``range(start, start + length)`` for each start and length."""
+    lengths = np.asarray(lengths, dtype=np.int64)
+    total = int(lengths.sum())
+    if total == 0:
+        return np.empty(0, dtype=np.int64)
+    range_starts = np.cumsum(lengths) - lengths
+    return np.repeat(np.asarray(starts, dtype=np.int64) - range_starts, lengths) + np.arange(total)
+
+
+def _cells_with_polyhedrons(
+    etypes,
+    connectivity,
+    connectivity_dp,
+    elements_faces,
+    elements_faces_dp,
+    faces_nodes,
+    faces_nodes_dp,
+):
+    """Build the VTK cells array of a mesh holding polyhedrons with array operations.
 
-    return pv.UnstructuredGrid(offset, cells, vtk_cell_type, node_coordinates)
+    Polyhedrons are written in the VTK format
+    ``[NValuesToFollow, NFaces, Face1NPoints, Face1Point1, ..., FaceNNPoints, ...]``
+    and the other elements as ``[NPoints, Point1, ..., PointN]``.
+
+    Parameters
+    ----------
+    etypes : numpy.ndarray
+        DPF element type of each element.
+    connectivity, connectivity_dp : numpy.ndarray
+        Data and data pointer of the connectivity of the elements.
+    elements_faces, elements_faces_dp : numpy.ndarray
+        Data and data pointer of the faces of each element.
+    faces_nodes, faces_nodes_dp : numpy.ndarray
+        Data and data pointer of the nodes of each face.
+
+    Returns
+    -------
+    cells : numpy.ndarray
+        Cells array in VTK format.
+    cells_insert_ind : numpy.ndarray
+        Starting point of each cell in the cells array.
+    cell_sizes : numpy.ndarray
+        Number of values of each cell in the cells array.
+    """
+    etypes = np.asarray(etypes)
+    n_elements = etypes.size
+    elem_size = np.diff(np.append(connectivity_dp, connectivity.size)).astype(np.int64)
+    faces_per_element = np.diff(np.append(elements_faces_dp, elements_faces.size))
+    nodes_per_face = np.diff(np.append(faces_nodes_dp, faces_nodes.size))
+
+    poly = etypes == element_types.Polyhedron.value
+    poly_ind = np.flatnonzero(poly)
+    other_ind = np.flatnonzero(~poly)
+
+    # faces of the polyhedrons, grouped by polyhedron, and their number of nodes
+    n_faces = faces_per_element[poly_ind].astype(np.int64)
+    poly_faces = elements_faces[_concatenated_ranges(elements_faces_dp[poly_ind], n_faces)]
+    face_len = nodes_per_face[poly_faces].astype(np.int64)
+    # offset of each face in the face stream of all polyhedrons
+    face_offsets = np.concatenate(([0], np.cumsum(face_len + 1)))
+    first_face = np.concatenate(([0], np.cumsum(n_faces)))
+    faces_stream_size = face_offsets[first_face[1:]] - face_offsets[first_face[:-1]]
+
+    cell_sizes = elem_size + 1
+    cell_sizes[poly_ind] = 2 + faces_stream_size
+    cells_insert_ind = np.cumsum(cell_sizes) - cell_sizes
+    cells = np.empty(int(cell_sizes.sum()), dtype=connectivity.dtype)
+
+    # standard elements
+    other_starts = cells_insert_ind[other_ind]
+    cells[other_starts] = elem_size[other_ind]
+    cells[_concatenated_ranges(other_starts + 1, elem_size[other_ind])] = connectivity[
+        _concatenated_ranges(connectivity_dp[other_ind], elem_size[other_ind])
+    ]
+
+    # polyhedrons
+    poly_starts = cells_insert_ind[poly_ind]
+    cells[poly_starts] = cell_sizes[poly_ind] - 1
+    cells[poly_starts + 1] = n_faces
+    face_starts = (
+        np.repeat(poly_starts + 2 - face_offsets[first_face[:-1]], n_faces)
+        + face_offsets[:-1]
+    )
+    cells[face_starts] = face_len
+    cells[_concatenated_ranges(face_starts + 1, face_len)] = faces_nodes[
+        _concatenated_ranges(faces_nodes_dp[poly_faces], face_len)
+    ]
+    return cells, cells_insert_ind, cell_sizes
 
 
 def dpf_mesh_to_vtk(mesh, nodes=None, as_linear=True):
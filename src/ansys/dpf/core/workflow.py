@@ -6,6 +6,7 @@ Workflow
 """
 import logging
 import os
+import time
 import traceback
 import warnings
 
@@ -78,6 +79,13 @@ class Workflow:
         # step3: init environment
         self._api.init_workflow_environment(self)  # creates stub when gRPC
 
+        # record the workflow structure and inputs to fingerprint it for its output cache
+        self._recorded_inputs = {}
+        self._recorded_structure = []
+        self._output_cache = None
+        # the operators and the inputs of an existing workflow are unknown
+        self._known_structure = workflow is None
+
         # step4: if object exists, take the instance, else create it
         if workflow is not None:
             self._internal_obj = workflow
@@ -183,6 +191,70 @@ class Workflow:
         >>> max = workflow.get_output("max", dpf.types.field) # doctest: +SKIP
 
         """
+        return self._connect(pin_name, inpt, pin_out)
+
+    def connect_many(self, inputs, timings=None):
+        """Connect several inputs on the workflow using their pin names.
+
+        The DPF APIs connect one pin per request, so the inputs are connected one
+        after the other, but the conversion tables are only built once for all of them.
+
+        Parameters
+        ----------
+        inputs : dict
+            Map of the names of the pins to connect, exposed before with
+            wf.set_input_name, to the objects to connect. An object can also be a
+            ``(operator, pin_out)`` tuple to connect the output of an operator.
+        timings : dict, optional
+            When given, it is filled with the time spent connecting each pin, in
+            seconds, and the total time with the ``"total"`` key.
+
+        Examples
+        --------
+        >>> from ansys.dpf import core as dpf
+        >>> from ansys.dpf.core import examples
+        >>> disp_op = dpf.operators.result.displacement()
+        >>> max_fc_op = dpf.operators.min_max.min_max_fc(disp_op)
+        >>> workflow = dpf.Workflow()
+        >>> workflow.add_operators([disp_op,max_fc_op])
+        >>> workflow.set_input_name("data_sources", disp_op.inputs.data_sources)
+        >>> workflow.set_input_name("time_scoping", disp_op.inputs.time_scoping)
+        >>> workflow.set_output_name("min", max_fc_op.outputs.field_min)
+        >>> workflow.set_output_name("max", max_fc_op.outputs.field_max)
+        >>> data_src = dpf.DataSources(examples.find_multishells_rst())
+        >>> timings = {}
+        >>> workflow.connect_many({"data_sources": data_src, "time_scoping": [1]}, timings)
+        >>> outputs = workflow.get_outputs({"min": dpf.types.field, "max": dpf.types.field})
+
+        """
+        type_to_input_method = self._type_to_input_method
+        start = time.perf_counter()
+        for pin_name, inpt in inputs.items():
+            pin_start = time.perf_counter()
+            pin_out = 0
+            if (
+                isinstance(inpt, tuple)
+                and len(inpt) == 2
+                and isinstance(inpt[0], (dpf_operator.Operator, Workflow))
+                and isinstance(inpt[1], int)
+            ):
+                inpt, pin_out = inpt
+            self._connect(pin_name, inpt, pin_out, type_to_input_method)
+            if timings is not None:
+                timings[pin_name] = time.perf_counter() - pin_start
+        if timings is not None:
+            timings["total"] = time.perf_counter() - start
+
+    def _connect(self, pin_name, inpt, pin_out=0, type_to_input_method=None):
+        from ansys.dpf.core.output_cache import _record_input
+
+        self._connect_input(pin_name, inpt, pin_out, type_to_input_method)
+        self._recorded_inputs[pin_name] = (
+            _record_input(inpt, self._output_cache is not None),
+            pin_out,
+        )
+
+    def _connect_input(self, pin_name, inpt, pin_out, type_to_input_method):
         if inpt is self:
             raise ValueError("Cannot connect to itself.")
         elif isinstance(inpt, dpf_operator.Operator):
@@ -208,7 +280,9 @@ class Workflow:
             )
             self._api.work_flow_connect_label_space(self, pin_name, label_space_to_con)
         else:
-            for type_tuple in self._type_to_input_method:
+            if type_to_input_method is None:
+                type_to_input_method = self._type_to_input_method
+            for type_tuple in type_to_input_method:
                 if isinstance(inpt, type_tuple[0]):
                     if len(type_tuple) == 3:
                         inpt = type_tuple[2](inpt)
@@ -409,13 +483,218 @@ class Workflow:
         output_type : core.type enum
             Type of the requested output.
         """
-        if server_meet_version("3.0", self._server) and self.progress_bar:
+        return self._get_cached_output(pin_name, output_type, self.progress_bar)
+
+    def get_output_async(self, pin_name, output_type):
+        """Retrieve the output of the workflow on the pin name without waiting for it.
+
+        The workflow is evaluated in the thread pool of its server, so that several
+        independent requests overlap on a gRPC server. No progress bar is displayed.
+
+        Parameters
+        ----------
+        pin_name : str
+            Name of the pin to retrieve. This name should be
+            exposed before with wf.set_output_name
+        output_type : core.type enum
+            Type of the requested output.
+
+        Returns
+        -------
+        concurrent.futures.Future
+            Future holding the output of the workflow. It can also be awaited in a
+            coroutine.
+
+        Examples
+        --------
+        >>> from ansys.dpf import core as dpf
+        >>> from ansys.dpf.core import examples
+        >>> data_src = dpf.DataSources(examples.find_multishells_rst())
+        >>> workflow = dpf.Workflow()
+        >>> disp_op = dpf.operators.result.displacement(data_sources=data_src)
+        >>> workflow.add_operator(disp_op)
+        >>> workflow.set_output_name("displacement", disp_op.outputs.fields_container)
+        >>> future = workflow.get_output_async("displacement", dpf.types.fields_container)
+        >>> disp = future.result()
+
+        """
+        from ansys.dpf.core._futures import _submit
+
+        return _submit(self._server, self._get_cached_output, pin_name, output_type, False)
+
+    def get_outputs(self, output_types, timings=None):
+        """Retrieve several outputs of the workflow using their pin names.
+
+        The workflow is evaluated once and its outputs are retrieved one after the
+        other, as the DPF APIs return one pin per request, but the conversion tables
+        are only built once for all of them. A progress bar following the workflow
+        state is printed.
+
+        Parameters
+        ----------
+        output_types : dict
+            Map of the names of the pins to retrieve, exposed before with
+            wf.set_output_name, to the types of the requested outputs.
+        timings : dict, optional
+            When given, it is filled with the time spent retrieving each output, in
+            seconds, and the total time with the ``"total"`` key.
+
+        Returns
+        -------
+        dict
+            Map of the names of the pins to their outputs.
+
+        Examples
+        --------
+        >>> from ansys.dpf import core as dpf
+        >>> from ansys.dpf.core import examples
+        >>> data_src = dpf.DataSources(examples.find_multishells_rst())
+        >>> disp_op = dpf.operators.result.displacement(data_sources=data_src)
+        >>> max_fc_op = dpf.operators.min_max.min_max_fc(disp_op)
+        >>> workflow = dpf.Workflow()
+        >>> workflow.add_operators([disp_op,max_fc_op])
+        >>> workflow.set_output_name("min", max_fc_op.outputs.field_min)
+        >>> workflow.set_output_name("max", max_fc_op.outputs.field_max)
+        >>> timings = {}
+        >>> output_types = {"min": dpf.types.field, "max": dpf.types.field}
+        >>> outputs = workflow.get_outputs(output_types, timings)
+        >>> min_field = outputs["min"]
+
+        """
+        type_to_output_method = self._type_to_output_method
+        progress_bar = self.progress_bar
+        out = {}
+        start = time.perf_counter()
+        for pin_name, output_type in output_types.items():
+            pin_start = time.perf_counter()
+            out[pin_name] = self._get_cached_output(
+                pin_name, output_type, progress_bar, type_to_output_method
+            )
+            # the progress of the evaluation is only followed for the first output
+            progress_bar = False
+            if timings is not None:
+                timings[pin_name] = time.perf_counter() - pin_start
+        if timings is not None:
+            timings["total"] = time.perf_counter() - start
+        return out
+
+    @property
+    def output_cache(self):
+        """Cache of the outputs of the workflow, if any.
+
+        When a :class:`ansys.dpf.core.output_cache.OutputCache` is set, the outputs
+        are memoized on the fingerprints of the operators added to the workflow, of
+        its named pins and of its connected inputs, so that requesting them again
+        with identical inputs does not evaluate the workflow. The outputs of a
+        workflow created from an existing one, for example with
+        :func:`Workflow.get_recorded_workflow`, are never cached, as its operators
+        are unknown.
+
+        The operators added and the inputs connected before the cache is set are not
+        kept alive by the workflow, so the cache is bypassed once one of them is
+        deleted.
+
+        The outputs returned from the cache are shared by the requests with identical
+        inputs, so they must be copied before being modified in place.
+
+        Returns
+        -------
+        :class:`ansys.dpf.core.output_cache.OutputCache`, None
+            Cache of the outputs, ``None`` by default.
+
+        Examples
+        --------
+        >>> from ansys.dpf import core as dpf
+        >>> from ansys.dpf.core import examples
+        >>> from ansys.dpf.core.output_cache import OutputCache
+        >>> data_src = dpf.DataSources(examples.find_simple_bar())
+        >>> disp_op = dpf.operators.result.displacement(data_sources=data_src)
+        >>> workflow = dpf.Workflow()
+        >>> workflow.add_operator(disp_op)
+        >>> workflow.set_output_name("displacement", disp_op.outputs.fields_container)
+        >>> workflow.output_cache = OutputCache()
+        >>> disp = workflow.get_output("displacement", dpf.types.fields_container)
+        >>> disp = workflow.get_output("displacement", dpf.types.fields_container)
+        >>> workflow.output_cache.statistics.hits
+        1
+
+        """
+        return self._output_cache
+
+    @output_cache.setter
+    def output_cache(self, value):
+        self._output_cache = value
+
+    def _record_step(self, *step):
+        """Record a step of the construction of the workflow to fingerprint it."""
+        from ansys.dpf.core.output_cache import _record_input
+
+        keep = self._output_cache is not None
+        self._recorded_structure.append(
+            tuple(
+                _record_input(item, keep)
+                if isinstance(item, (dpf_operator.Operator, Workflow))
+                else item
+                for item in step
+            )
+        )
+
+    def _output_cache_source(self):
+        from ansys.dpf.core.output_cache import (
+            _UnfingerprintableInputError,
+            _digest,
+            _fingerprint,
+            _instance_token,
+            _operator_fingerprint,
+            _recorded_value,
+        )
+
+        if not self._known_structure:
+            raise _UnfingerprintableInputError("The operators of the workflow are unknown.")
+        token = _instance_token(self)
+        operators = {}
+        structure = []
+        for step in self._recorded_structure:
+            fingerprinted = []
+            for item in step:
+                item = _recorded_value(item)
+                if isinstance(item, dpf_operator.Operator):
+                    if id(item) not in operators:
+                        operators[id(item)] = _operator_fingerprint(item, set(), token)
+                    item = operators[id(item)]
+                elif isinstance(item, Workflow):
+                    item = item._output_cache_source()
+                fingerprinted.append(item)
+            structure.append(tuple(fingerprinted))
+        connected = tuple(
+            (name, _fingerprint(_recorded_value(inpt), None, token), pin_out)
+            for name, (inpt, pin_out) in sorted(self._recorded_inputs.items())
+        )
+        return _digest("workflow", tuple(structure), connected)
+
+    def _get_cached_output(
+        self, pin_name, output_type, progress_bar, type_to_output_method=None
+    ):
+        if self._output_cache is None:
+            return self._get_output(pin_name, output_type, progress_bar, type_to_output_method)
+        output_type = dpf_operator._write_output_type_to_type(output_type)
+        return self._output_cache._get_or_compute(
+            self,
+            lambda: self._get_output(pin_name, output_type, progress_bar, type_to_output_method),
+            pin_name,
+            output_type,
+        )
+
+    def _get_output(self, pin_name, output_type, progress_bar, type_to_output_method=None):
+        if server_meet_version("3.0", self._server) and progress_bar:
             # handle progress bar
             self._server.session.add_workflow(self, "workflow")
             self._progress_thread = self._server.session.listen_to_progress()
         output_type = dpf_operator._write_output_type_to_type(output_type)
         out = None
-        for type_tuple in self._type_to_output_method:
+        if type_to_output_method is None:
+            type_to_output_method = self._type_to_output_method
+        for type_tuple in type_to_output_method:
             if issubclass(output_type, type_tuple[0]):
                 if len(type_tuple) >= 3:
                     if isinstance(type_tuple[2], str):
@@ -469,7 +748,13 @@ class Workflow:
                 operator = arg
             elif isinstance(arg, int):
                 pin = arg
-        return self._api.work_flow_set_name_input_pin(self, operator, pin, name)
+        from ansys.dpf.core.output_cache import _instance_token
+
+        out = self._api.work_flow_set_name_input_pin(self, operator, pin, name)
+        # the pin can now be connected through the workflow, unknown to the operator
+        operator._workflow_input_pins.setdefault(pin, set()).add(_instance_token(self))
+        self._record_step("input", name, operator, pin)
+        return out
 
     def set_output_name(self, name, *args):
         """Set the name of the output pin of the workflow to expose it for future connection.
@@ -504,7 +789,9 @@ class Workflow:
                 operator = arg
             elif isinstance(arg, int):
                 pin = arg
-        return self._api.work_flow_set_name_output_pin(self, operator, pin, name)
+        out = self._api.work_flow_set_name_output_pin(self, operator, pin, name)
+        self._record_step("output", name, operator, pin)
+        return out
 
     def add_operators(self, operators):
         """Add operators to the list of operators of the workflow.
@@ -553,6 +840,7 @@ class Workflow:
 
         """
         self._api.work_flow_add_operator(self, operator)
+        self._record_step("operator", operator)
 
     def record(self, identifier="", transfer_ownership=True):
         """Add the workflow to DPF's internal registry with an ID returned by this method.
@@ -778,6 +1066,7 @@ class Workflow:
             self._api.work_flow_connect_with_specified_names(self, left_workflow, map)
         else:
             self._api.work_flow_connect_with(self, left_workflow)
+        self._record_step("connect_with", left_workflow, repr(output_input_names))
 
     @version_requires("3.0")
     def create_on_other_server(self, *args, **kwargs):
@@ -838,15 +1127,7 @@ class Workflow:
         if "server" in kwargs:
             server = kwargs["server"]
         if server:
-            text_stream = self._api.work_flow_write_to_text(self)
-            wf = Workflow(workflow="None", server=server)
-            if wf._server.has_client():
-                wf._internal_obj = wf._api.work_flow_create_from_text_on_client(
-                    text_stream, wf._server.client
-                )
-            else:
-                wf._internal_obj = wf._api.work_flow_create_from_text(text_stream)
-            return wf
+            return Workflow._create_from_text(self._api.work_flow_write_to_text(self), server)
         elif address:
             internal_obj = self._api.work_flow_get_copy_on_other_client(self, address, "grpc")
             return Workflow(workflow=internal_obj, server=self._server)
@@ -856,6 +1137,18 @@ class Workflow:
                 "or both ip and port inputs) or a server is required"
             )
 
+    @staticmethod
+    def _create_from_text(text_stream, server):
+        """Create a workflow on a server from its text serialization."""
+        wf = Workflow(workflow="None", server=server)
+        if wf._server.has_client():
+            wf._internal_obj = wf._api.work_flow_create_from_text_on_client(
+                text_stream, wf._server.client
+            )
+        else:
+            wf._internal_obj = wf._api.work_flow_create_from_text(text_stream)
+        return wf
+
     def view(
             self,
             title: Union[None, str] = None,
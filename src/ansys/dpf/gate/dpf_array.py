@@ -36,7 +36,27 @@ class DPFArray(np.ndarray):
         if self.vec is not None:
             self.vec.commit()
 
-    # def __setitem__(self, key, value):
-    #     super().__setitem__(key, value)
-    #     if self.vec:
-    #         self.vec._modified = True
+    def _mark_modified(self):
+        if self.vec is not None:
+            self.vec._modified = True
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._mark_modified()
+
+    def __array_ufunc__(self, ufunc, method, *inputs, out=None, **kwargs):
+        """Marks the arrays used as ufunc outputs as modified (for example with ``+=``)."""
+        inputs = tuple(x.view(np.ndarray) if isinstance(x, DPFArray) else x for x in inputs)
+        if out is not None:
+            for x in out:
+                if isinstance(x, DPFArray):
+                    x._mark_modified()
+            kwargs["out"] = tuple(x.view(np.ndarray) if isinstance(x, DPFArray) else x for x in out)
+        results = getattr(ufunc, method)(*inputs, **kwargs)
+        if out is not None:
+            return out[0] if len(out) == 1 else out
+        if isinstance(results, tuple):
+            return tuple(r.view(DPFArray) if isinstance(r, np.ndarray) else r for r in results)
+        if isinstance(results, np.ndarray):
+            return results.view(DPFArray)
+        return results
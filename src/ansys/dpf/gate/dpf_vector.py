@@ -1,5 +1,6 @@
 import copy
 import ctypes
+import hashlib
 import numpy as np
 from ansys.dpf.gate.generated import dpf_vector_capi
 from ansys.dpf.gate.integral_types import MutableListInt32, MutableInt32, MutableListDouble, \
@@ -14,6 +15,10 @@ def get_size_of_list(list):
     return len(list)
 
 
+def _hash_array(array):
+    return hashlib.blake2b(np.ascontiguousarray(array).view(np.uint8), digest_size=16).digest()
+
+
 class DPFVectorBase:
     """
     Base class of DPF vector.
@@ -33,6 +38,7 @@ class DPFVectorBase:
         self.dpf_vector_api = api
         self._modified = False
         self._check_changes = True
+        self.on_change = None
         try:
             if not client:
                 self._internal_obj = self.dpf_vector_api.dpf_vector_new()
@@ -52,36 +58,6 @@ class DPFVectorBase:
         """
         return self._array.internal_size
 
-    def start_checking_modification(self) -> None:
-        """
-        Takes a deep copy of the current data as a numpy array
-        in self._initial_data, if self._check_changes is set to True.
-        In that case, at deletion, the current data is compared to the initial one
-        and the data is updated server side if it has changed.
-
-        Notes
-        -----
-        self._check_changes is set to True by default when a client is added at the class init
-
-        """
-        if self._check_changes:
-            self._initial_data = copy.deepcopy(self.np_array)
-
-    def has_changed(self):
-        """
-        If self._check_changes is set to True, compares the initial data computed in
-        ```start_checking_modification``` to the current one.
-
-        Notes
-        -----
-        self._check_changes is set to True by default when a client is added at the class init
-        """
-        if self._check_changes:
-            if self._modified or not np.allclose(self._initial_data, self.np_array):
-                self._modified = True
-        return self._modified
-
-
     @property
     def np_array(self) -> np.ndarray:
         """
@@ -105,10 +81,18 @@ class DPFVectorBase:
 
     def start_checking_modification(self) -> None:
         """
-        Takes a deep copy of the current data as a numpy array
-        in self._initial_data, if self._check_changes is set to True.
-        In that case, at deletion, the current data is compared to the initial one
-        and the data is updated server side if it has changed.
+        Starts tracking the modifications of the data, if self._check_changes is set to True.
+        In that case, at deletion, the data is updated server side if it has changed.
+
+        The tracking mode is read from the ``modification_tracking`` option
+        of the client configuration:
+
+        - ``"copy"`` (default): takes a deep copy of the current data in self._initial_data,
+          which is compared to the current data.
+        - ``"hash"``: takes a hash of the current data, which is compared to a hash of the
+          current data. The data is hashed twice instead of being copied.
+        - ``"write"``: no copy nor comparison, the data is considered as changed only when it
+          is written through the ``DPFArray`` (item assignment or ufunc with ``out``).
 
         Notes
         -----
@@ -116,20 +100,32 @@ class DPFVectorBase:
 
         """
         if self._check_changes:
-            self._initial_data = copy.deepcopy(self.np_array)
+            from ansys.dpf.gate import misc
+            self._tracking_mode = misc.client_config().get("modification_tracking", "copy")
+            if self._tracking_mode == "hash":
+                self._initial_data = _hash_array(self.np_array)
+            elif self._tracking_mode == "copy":
+                self._initial_data = copy.deepcopy(self.np_array)
 
     def has_changed(self):
         """
         If self._check_changes is set to True, compares the initial data computed in
         ```start_checking_modification``` to the current one.
 
+        When the data has changed, ``self.on_change`` is called if it is set, as the data
+        is then written back server side.
+
         Notes
         -----
         self._check_changes is set to True by default when a client is added at the class init
         """
-        if self._check_changes:
-            if self._modified or not np.allclose(self._initial_data, self.np_array):
-                self._modified = True
+        if self._check_changes and not self._modified and hasattr(self, "_tracking_mode"):
+            if self._tracking_mode == "hash":
+                self._modified = self._initial_data != _hash_array(self.np_array)
+            elif self._tracking_mode == "copy":
+                self._modified = not np.allclose(self._initial_data, self.np_array)
+        if self._modified and self.on_change is not None:
+            self.on_change()
         return self._modified
 
     def __del__(self):
@@ -165,7 +165,7 @@ class FieldGRPCAPI(field_abstract_api.FieldAbstractAPI):
             grpc_stream_helpers._data_chunk_yielder(request, data), metadata=metadata)
 
     @staticmethod
-    def csfield_get_data(field, np_array):
+    def csfield_get_data(field, np_array, out=None):
         from ansys.grpc.dpf import field_pb2
         request = field_pb2.ListRequest()
         request.field.CopyFrom(field._internal_obj)
@@ -179,7 +179,7 @@ class FieldGRPCAPI(field_abstract_api.FieldAbstractAPI):
             data_type = "double"
             dtype = np.float64
         service = _get_stub(field._server).List(request, metadata=[("float_or_double", data_type)])
-        return grpc_stream_helpers._data_get_chunk_(dtype, service, np_array)
+        return grpc_stream_helpers._data_get_chunk_(dtype, service, np_array, out=out)
 
     @staticmethod
     def csfield_raw_set_data(field, data, metadata):
@@ -1,13 +1,106 @@
-import sys
-import array
+import os
+import queue
+import threading
+import time
 import numpy as np
 from ansys.dpf.gate.dpf_vector import get_size_of_list
 
 
-def _to_bytes(array):
-    if isinstance(array, (np.generic, np.ndarray)):
-        return array.tobytes()
-    return array
+class StreamStatistics:
+    """Counters of the data streamed through the gRPC chunked calls of this process.
+
+    Examples
+    --------
+    >>> from ansys.dpf.gate import grpc_stream_helpers
+    >>> stats = grpc_stream_helpers.stream_statistics()
+    >>> stats.reset()
+    >>> stats.received_bytes
+    0
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.received_bytes = 0
+            self.received_chunks = 0
+            self.receive_time = 0.0
+            self.sent_bytes = 0
+            self.sent_chunks = 0
+            self.send_time = 0.0
+
+    def _add_received(self, n_bytes, n_chunks, duration):
+        with self._lock:
+            self.received_bytes += n_bytes
+            self.received_chunks += n_chunks
+            self.receive_time += duration
+
+    def _add_sent(self, n_bytes, n_chunks, duration):
+        with self._lock:
+            self.sent_bytes += n_bytes
+            self.sent_chunks += n_chunks
+            self.send_time += duration
+
+    @property
+    def receive_throughput(self):
+        """Average receive throughput in MB/s."""
+        if self.receive_time == 0.0:
+            return 0.0
+        return self.received_bytes / self.receive_time / 1e6
+
+    @property
+    def send_throughput(self):
+        """Average send throughput in MB/s."""
+        if self.send_time == 0.0:
+            return 0.0
+        return self.sent_bytes / self.send_time / 1e6
+
+    def __str__(self):
+        return (
+            f"Received {self.received_bytes / 1e6:.1f} MB in {self.received_chunks} chunks "
+            f"({self.receive_throughput:.1f} MB/s)\n"
+            f"Sent {self.sent_bytes / 1e6:.1f} MB in {self.sent_chunks} chunks "
+            f"({self.send_throughput:.1f} MB/s)"
+        )
+
+
+_STREAM_STATISTICS = StreamStatistics()
+
+
+def stream_statistics():
+    """Returns the :class:`StreamStatistics` of this process."""
+    return _STREAM_STATISTICS
+
+
+def _receive_buffer(out, length, dtype):
+    """Returns the flat array receiving ``length`` values.
+
+    ``out`` is either ``None``, in which case a new array is allocated, the path of a
+    file to memory-map with ``length`` values, or a writable C-contiguous array of at
+    least ``length`` values, which is returned whole so that streams whose size is not
+    given in the metadata can fill it.
+    """
+    if out is None:
+        return np.empty(length, dtype)
+    if isinstance(out, (str, os.PathLike)):
+        if length == 0:
+            return np.empty(0, dtype)
+        return np.memmap(out, dtype=dtype, mode="w+", shape=(length,))
+    if not isinstance(out, np.ndarray):
+        out = np.frombuffer(out, dtype)
+    if out.dtype != np.dtype(dtype) or not out.flags.c_contiguous or not out.flags.writeable:
+        raise ValueError(
+            f"Output buffer must be a writable C-contiguous array of {np.dtype(dtype)}."
+        )
+    if out.size < length:
+        raise ValueError(f"Output buffer of size {out.size} cannot hold {length} values.")
+    return out.reshape(-1)
+
+
+# Number of chunks serialized ahead of the one being sent
+_SEND_QUEUE_SIZE = 4
 
 
 def _set_array_to_request(request, bytes):
@@ -15,11 +108,65 @@ def _set_array_to_request(request, bytes):
 
 
 def _array_unit(data):
-    if isinstance(array, (np.generic, np.ndarray)):
+    if isinstance(data, (np.generic, np.ndarray)):
         return data.dtype.name
     return "byte"
 
 
+def _as_bytes_view(data):
+    """Returns a flat byte memoryview on the data and the size of its items.
+
+    Contiguous arrays and bytes-like objects are not copied.
+    """
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        return memoryview(data).cast("B"), 1
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+        return memoryview(data), 1
+    data = np.ascontiguousarray(data)
+    return memoryview(data.reshape(-1)).cast("B"), data.itemsize
+
+
+def _produce_chunks(view, chunk_bytes, chunks, stop):
+    for start in range(0, len(view), chunk_bytes):
+        chunk = view[start: start + chunk_bytes].tobytes()
+        while not stop.is_set():
+            try:
+                chunks.put(chunk, timeout=0.1)
+                break
+            except queue.Full:
+                pass
+        else:
+            return
+    chunks.put(None)
+
+
+def _iter_chunks(view, chunk_bytes):
+    """Yields the chunks of bytes to send.
+
+    When there are several chunks to send, they are serialized ahead by a
+    background thread while the previous ones are being transmitted.
+    """
+    if len(view) <= chunk_bytes * 2:
+        for start in range(0, len(view), chunk_bytes):
+            yield view[start: start + chunk_bytes].tobytes()
+        return
+    chunks = queue.Queue(maxsize=_SEND_QUEUE_SIZE)
+    stop = threading.Event()
+    producer = threading.Thread(
+        target=_produce_chunks, args=(view, chunk_bytes, chunks, stop), daemon=True
+    )
+    producer.start()
+    try:
+        while True:
+            chunk = chunks.get()
+            if chunk is None:
+                return
+            yield chunk
+    finally:
+        stop.set()
+
+
 def _data_chunk_yielder(request, data, chunk_size=None, set_array=_set_array_to_request):
     from ansys.dpf.gate import misc
     if not chunk_size:
@@ -32,25 +179,26 @@ def _data_chunk_yielder(request, data, chunk_size=None, set_array=_set_array_to_
             "Sending data...", unit=_array_unit(data), tot_size=length
         )
         bar.start()
-    sent_length = 0
     if length == 0:
         yield request
         return
-    unitary_size = int(chunk_size // sys.getsizeof(data[0]))
-    if length - sent_length < unitary_size:
-        unitary_size = length - sent_length
-    while sent_length < length:
-        currentcopy = data[sent_length: sent_length + unitary_size]
-        set_array(request, _to_bytes(currentcopy))
-        sent_length = sent_length + unitary_size
-        if length - sent_length < unitary_size:
-            unitary_size = length - sent_length
+    view, itemsize = _as_bytes_view(data)
+    # chunks hold a whole number of items
+    chunk_bytes = max(int(chunk_size // itemsize), 1) * itemsize
+    sent_bytes = 0
+    n_chunks = 0
+    start = time.perf_counter()
+    for chunk in _iter_chunks(view, chunk_bytes):
+        set_array(request, chunk)
         yield request
+        sent_bytes += len(chunk)
+        n_chunks += 1
         try:
             if need_progress_bar:
-                bar.update(sent_length)
+                bar.update(sent_bytes // itemsize)
         except:
             pass
+    _STREAM_STATISTICS._add_sent(sent_bytes, n_chunks, time.perf_counter() - start)
     try:
         if need_progress_bar:
             bar.finish()
@@ -67,7 +215,7 @@ def dtype_to_array_type(dtype):
         return "i"
 
 
-def _data_get_chunk_(dtype, service, np_array=True, get_array=lambda chunk: chunk.array):
+def _data_get_chunk_(dtype, service, np_array=True, get_array=lambda chunk: chunk.array, out=None):
     from ansys.dpf.gate import misc
     tupleMetaData = service.initial_metadata()
 
@@ -85,34 +233,50 @@ def _data_get_chunk_(dtype, service, np_array=True, get_array=lambda chunk: chun
         )
         bar.start()
 
-    if np_array:
-        arr = np.empty(size // itemsize, dtype)
-        i = 0
-        for chunk in service:
-            curr_size = len(get_array(chunk)) // itemsize
-            arr[i: i + curr_size] = np.frombuffer(get_array(chunk), dtype)
-            i += curr_size
-            try:
-                if need_progress_bar:
-                    bar.update(i)
-            except:
-                pass
-
-    else:
-        arr = []
-        atype = dtype_to_array_type(dtype)
-        for chunk in service:
-            arr.extend(array.array(atype, get_array(chunk)))
-            try:
-                if need_progress_bar:
-                    bar.update(len(arr))
-            except:
-                pass
+    arr = _receive_buffer(out, size // itemsize, dtype)
+    # chunks are copied once, from the gRPC message bytes into the array memory
+    destination = memoryview(arr).cast("B") if arr.size else None
+    capacity = arr.nbytes
+    received = 0
+    n_chunks = 0
+    overflow = []
+    start = time.perf_counter()
+    for chunk in service:
+        chunk_bytes = get_array(chunk)
+        n_bytes = len(chunk_bytes)
+        fitting = min(n_bytes, max(capacity - received, 0))
+        if fitting < n_bytes and out is not None:
+            raise ValueError(
+                f"The received data exceeds the {capacity // itemsize} values of the "
+                f"output buffer."
+            )
+        if fitting == n_bytes:
+            destination[received: received + n_bytes] = chunk_bytes
+        else:
+            # the total size was missing from the metadata or was exceeded: the buffer is
+            # filled up and the remainder of the chunk is kept aside
+            if fitting:
+                destination[received: capacity] = memoryview(chunk_bytes)[:fitting]
+            overflow.append(bytes(memoryview(chunk_bytes)[fitting:]))
+        received += n_bytes
+        n_chunks += 1
+        try:
+            if need_progress_bar:
+                bar.update(received // itemsize)
+        except:
+            pass
+    _STREAM_STATISTICS._add_received(received, n_chunks, time.perf_counter() - start)
+    if overflow:
+        arr = np.concatenate((arr, np.frombuffer(b"".join(overflow), dtype)))
+    elif arr.size > received // itemsize:
+        arr = arr[: received // itemsize]
     try:
         if need_progress_bar:
             bar.finish()
     except:
         pass
+    if not np_array:
+        return arr.tolist()
     return arr
 
 
@@ -27,4 +27,5 @@ def client_config():
         _CLIENT_CONFIG.streaming_buffer_size = DEFAULT_FILE_CHUNK_SIZE
         _CLIENT_CONFIG.stream_floats_instead_of_doubles = False
         _CLIENT_CONFIG.return_arrays = True
+        _CLIENT_CONFIG.modification_tracking = "copy"
     return _CLIENT_CONFIG
@@ -31,13 +31,11 @@ class ScopingGRPCAPI(scoping_abstract_api.ScopingAbstractAPI):
     @staticmethod
     def scoping_set_ids(scoping, ids, size):
         from ansys.grpc.dpf import scoping_pb2
-        # must convert to a list for gRPC
+        # must convert to a contiguous int32 array for gRPC
         if isinstance(ids, range):
-            ids = np.array(list(ids), dtype=np.int32)
-        elif not isinstance(ids, (np.ndarray, np.generic)):
-            ids = np.array(ids, dtype=np.int32)
+            ids = np.arange(ids.start, ids.stop, ids.step, dtype=np.int32)
         else:
-            ids = np.array(list(ids), dtype=np.int32)
+            ids = np.ascontiguousarray(ids, dtype=np.int32).reshape(-1)
         metadata = [("size_int", f"{len(ids)}")]
         request = scoping_pb2.UpdateIdsRequest()
         request.scoping.CopyFrom(scoping._internal_obj)
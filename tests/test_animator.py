@@ -1,5 +1,6 @@
 import os
 
+import numpy as np
 import pytest
 
 from ansys.dpf import core as dpf
@@ -78,6 +79,85 @@ def test_animator_animate(displacement_fields):
     an.animate(loop_over=loop_over_field)
 
 
+def test_animator_animate_pipeline(remove_gifs, displacement_fields):
+    frequencies = displacement_fields.time_freq_support.time_frequencies
+    loop_over = displacement_fields.get_time_scoping()
+    loop_over_field = dpf.fields_factory.field_from_array(frequencies.data[loop_over.ids - 1])
+    loop_over_field.scoping.ids = loop_over.ids
+    loop_over_field.unit = frequencies.unit
+
+    wf = Workflow()
+    wf.progress_bar = False
+    extract_field_op = dpf.operators.utility.extract_field(displacement_fields)
+    wf.set_input_name("loop_over", extract_field_op.inputs.indices)
+    wf.set_output_name("to_render", extract_field_op.outputs.field)
+
+    an = Animator(wf)
+    an.animate(loop_over=loop_over_field, save_as=gif_name, pipeline=True, off_screen=True)
+    assert os.path.isfile(gif_name)
+
+
+def test_animator_animate_n_processes(remove_gifs, displacement_fields, tmp_path):
+    from ansys.dpf.core.server_types import InProcessServer
+
+    if isinstance(displacement_fields._server, InProcessServer):
+        with pytest.raises(ValueError):
+            Animator(Workflow()).animate(
+                loop_over=dpf.fields_factory.field_from_array([1.0]),
+                save_as=gif_name,
+                n_processes=2,
+            )
+        return
+    frequencies = displacement_fields.time_freq_support.time_frequencies
+    loop_over = displacement_fields.get_time_scoping()
+    loop_over_field = dpf.fields_factory.field_from_array(frequencies.data[loop_over.ids - 1])
+    loop_over_field.scoping.ids = loop_over.ids
+    loop_over_field.unit = frequencies.unit
+
+    wf = Workflow()
+    wf.progress_bar = False
+    extract_field_op = dpf.operators.utility.extract_field(displacement_fields)
+    wf.set_input_name("loop_over", extract_field_op.inputs.indices)
+    wf.set_output_name("to_render", extract_field_op.outputs.field)
+
+    import imageio.v2 as imageio
+
+    mesh = displacement_fields[0].meshed_region
+    coordinates = mesh.nodes.coordinates_field.data
+    center = coordinates.mean(axis=0)
+    extent = np.ptp(coordinates, axis=0).max()
+    cpos = [tuple(center + 2.0 * extent), tuple(center), (0.0, 0.0, 1.0)]
+
+    an = Animator(wf, off_screen=True)
+    an.animate(
+        loop_over=loop_over_field, save_as=gif_name, n_processes=2, off_screen=True, cpos=cpos
+    )
+    assert os.path.isfile(gif_name)
+    frames = imageio.mimread(gif_name)
+    assert len(frames) == len(loop_over.ids)
+
+    # the frames are in the order of the frames rendered by this process
+    single_gif_name = str(tmp_path / "single.gif")
+    Animator(wf, off_screen=True).animate(
+        loop_over=loop_over_field, save_as=single_gif_name, off_screen=True, cpos=cpos
+    )
+    expected_frames = imageio.mimread(single_gif_name)
+    assert len(expected_frames) == len(frames)
+    for frame, expected_frame in enumerate(expected_frames):
+        differences = [
+            np.abs(np.asarray(other, dtype=float) - np.asarray(expected_frame, dtype=float)).mean()
+            for other in frames
+        ]
+        assert np.argmin(differences) == frame
+
+    with pytest.raises(ValueError):
+        an.animate(loop_over=loop_over_field, n_processes=2)
+    with pytest.raises(ValueError):
+        an.animate(
+            loop_over=loop_over_field, save_as=gif_name, n_processes=2, meshed_region=mesh
+        )
+
+
 def test_animator_animate_raise_wrong_scale_factor(remove_gifs, displacement_fields):
     frequencies = displacement_fields.time_freq_support.time_frequencies
     loop_over = displacement_fields.get_time_scoping()
@@ -1,5 +1,11 @@
 # from ansys.dpf import core as dpf
 # from ansys.dpf.core.check_version import server_meet_version
+import numpy as np
+import pytest
+
+from ansys.dpf import core as dpf
+from ansys.dpf.core.cache import CacheHandler, MethodIdentifier, _make_hashable
+from ansys.dpf.core.check_version import server_meet_version
 
 
 # def test_unit_mesh_cache(simple_bar):
@@ -60,3 +66,94 @@
 #         assert len(res_info._cache.cached) == 2
 #     else:
 #         assert len(res_info._cache.cached) == 1
+
+
+def test_physics_type_cache_statistics(simple_bar):
+    ds = dpf.DataSources(simple_bar)
+    provider = dpf.operators.metadata.result_info_provider(data_sources=ds)
+    res_info = provider.outputs.result_info()
+    assert len(res_info._cache.cached) == 0
+    res_info.unit_system
+    assert len(res_info._cache.cached) == 1
+    res_info.physics_type
+    if server_meet_version("3.0", ds._server):
+        assert len(res_info._cache.cached) == 2
+    hits = res_info._cache.statistics.hits
+    res_info.unit_system
+    assert res_info._cache.statistics.hits == hits + 1
+
+
+def test_modified_through_second_wrapper(server_type):
+    field = dpf.fields_factory.create_3d_vector_field(2, server=server_type)
+    field.scoping = dpf.Scoping(ids=[1, 2], location=dpf.locations.nodal, server=server_type)
+    tfq = dpf.TimeFreqSupport(server=server_type)
+    tfq.append_step(1, [0.1])
+    field.time_freq_support = tfq
+    fields_container = dpf.fields_container_factory.over_time_freq_fields_container(
+        [field], server=server_type
+    )
+    first, second = fields_container[0], fields_container[0]
+    assert first.unit == ""
+    second.unit = "mm"
+    assert first.unit == "mm"
+    assert first.field_definition.unit == "mm"
+    first_scoping, second_scoping = first.scoping, second.scoping
+    assert first_scoping.location == dpf.locations.nodal
+    assert first_scoping.size == 2
+    second_scoping.location = dpf.locations.elemental
+    second_scoping.ids = [3, 4, 5]
+    assert first_scoping.location == dpf.locations.elemental
+    assert first_scoping.size == 3
+    first_support = first.time_freq_support
+    assert first_support.n_sets == 1
+    second.time_freq_support.append_step(2, [0.2])
+    assert first_support.n_sets == 2
+    assert np.allclose(first_support.time_frequencies.data, [0.1, 0.2])
+
+
+def test_cache_handler_lru_eviction():
+    class Dummy:
+        def get(self, value):
+            return value * 2
+
+        def set(self, value):
+            pass
+
+    handler = CacheHandler(Dummy, {Dummy.get: [Dummy.set]}, max_size=2)
+    dummy = Dummy()
+    for value in [1, 2, 1, 3]:
+        handler.handle(dummy, Dummy.get, value)
+    statistics = handler.statistics
+    assert statistics.hits == 1
+    assert statistics.misses == 3
+    assert statistics.evictions == 1
+    assert statistics.size == 2
+    assert MethodIdentifier.create("get", (2,), {}) not in handler.cached
+    handler.handle(dummy, Dummy.set, 4)
+    assert handler.statistics.size == 0
+
+
+def test_cache_handler_unhashable_arguments():
+    class Dummy:
+        def get(self, values, **kwargs):
+            return list(values)
+
+    handler = CacheHandler(Dummy, {Dummy.get: None})
+    dummy = Dummy()
+    out = handler.handle(dummy, Dummy.get, [1, 2], option={"a": [1]})
+    out.append(3)
+    assert handler.handle(dummy, Dummy.get, [1, 2], option={"a": [1]}) == [1, 2]
+    assert handler.statistics.hits == 1
+    handler.handle(dummy, Dummy.get, [1, 2], option=bytearray(b"a"))
+    assert handler.statistics.size == 1
+    handler.invalidate("get")
+    assert handler.statistics.size == 0
+
+
+def test_make_hashable():
+    assert _make_hashable([1, 2]) == _make_hashable([1, 2])
+    assert _make_hashable([1, 2]) != _make_hashable((1, 2))
+    assert _make_hashable({"b": 1, "a": [2]}) == _make_hashable({"a": [2], "b": 1})
+    assert _make_hashable(np.array([1, 2])) != _make_hashable(np.array([1.0, 2.0]))
+    with pytest.raises(TypeError):
+        _make_hashable(bytearray(b"a"))
@@ -69,6 +69,28 @@ Location: [-0.022856459489947675, -0.08534214957826106, -0.013310679234564304]
     assert str(face.nodes[3]) == ref_node_str
 
 
+@pytest.mark.skipif(
+    not conftest.SERVERS_VERSION_GREATER_THAN_OR_EQUAL_TO_7_0,
+    reason="mesh faces were not supported before 7.0",
+)
+def test_faces_to_arrays(model_faces):
+    ids, types, offsets, connectivity = model_faces.to_arrays()
+    assert ids.size == 44242
+    assert types[789] == model_faces.faces_type_field.get_entity_data(789)[0]
+    assert list(connectivity[offsets[2000] : offsets[2001]]) == list(
+        model_faces.faces_nodes_connectivity_field.get_entity_data(2000)
+    )
+    n_faces = 0
+    for face in model_faces:
+        assert face.id == ids[face.index]
+        n_faces += 1
+    assert n_faces == 44242
+    face = model_faces.face_by_id(4500)
+    assert face.index == 3497
+    assert face.node_ids == [4688, 4679, 4663, 4677]
+    assert face.type == element_types.Quad4
+
+
 @pytest.mark.skipif(
     not conftest.SERVERS_VERSION_GREATER_THAN_OR_EQUAL_TO_7_0,
     reason="faces location was not supported before 7.0",
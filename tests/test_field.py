@@ -107,6 +107,58 @@ def test_set_get_data_array_field(server_type):
     assert np.allclose(field.data, data)
 
 
+def test_read_data_into_field(server_type, tmpdir):
+    field = dpf.core.fields_factory.field_from_array(
+        np.arange(60, dtype=float).reshape(20, 3), server=server_type
+    )
+    buffer = np.full(70, np.nan)
+    data = field.read_data_into(buffer)
+    assert data.shape == (20, 3)
+    assert np.shares_memory(data, buffer)
+    assert np.allclose(data, field.data)
+    assert np.isnan(buffer[60:]).all()
+    mapped = field.read_data_into(str(tmpdir.join("data.bin")))
+    assert np.allclose(mapped, field.data)
+    with pytest.raises(ValueError):
+        field.read_data_into(np.empty(10))
+
+
+def test_data_get_chunk_into_buffer():
+    from ansys.dpf.gate import grpc_stream_helpers
+
+    class Chunk:
+        def __init__(self, array):
+            self.array = array
+
+    class Service:
+        def __init__(self, values, size):
+            self._chunks = [Chunk(values[i : i + 4].tobytes()) for i in range(0, values.size, 4)]
+            self._size = size
+
+        def initial_metadata(self):
+            return [type("Metadata", (), {"key": "size_tot", "value": str(self._size)})]
+
+        def __iter__(self):
+            return iter(self._chunks)
+
+    values = np.arange(10, dtype=float)
+    buffer = np.zeros(12)
+    out = grpc_stream_helpers._data_get_chunk_(np.float64, Service(values, 80), out=buffer)
+    assert np.shares_memory(out, buffer)
+    assert np.array_equal(out, values)
+    # the total size is not given in the metadata
+    out = grpc_stream_helpers._data_get_chunk_(np.float64, Service(values, 0), out=buffer)
+    assert np.shares_memory(out, buffer)
+    assert np.array_equal(out, values)
+    out = grpc_stream_helpers._data_get_chunk_(np.float64, Service(values, 0))
+    assert np.array_equal(out, values)
+    # the data exceeds the total size given in the metadata within a chunk
+    out = grpc_stream_helpers._data_get_chunk_(np.float64, Service(values, 48))
+    assert np.array_equal(out, values)
+    with pytest.raises(ValueError):
+        grpc_stream_helpers._data_get_chunk_(np.float64, Service(values, 0), out=np.zeros(6))
+
+
 def test_append_data_field(server_type):
     field = dpf.core.Field(nentities=20, nature=dpf.core.natures.vector, server=server_type)
     for i in range(0, 20):
@@ -711,6 +763,68 @@ def test_auto_delete_field_local(server_type_remote_process):
         assert np.allclose(f.get_entity_data(0), [3.0, 4.0, 5.0])
 
 
+def test_get_entities_data(allkindofcomplexity, server_type):
+    model = dpf.core.Model(allkindofcomplexity, server=server_type)
+    stress = model.results.stress()
+    field = stress.outputs.fields_container()[0]
+    indices = [5, 0, 100]
+    data, offsets = field.get_entities_data(indices)
+    assert len(offsets) == len(indices) + 1
+    for i, index in enumerate(indices):
+        assert np.allclose(data[offsets[i] : offsets[i + 1]], field.get_entity_data(index))
+    ids = field.scoping.ids[indices]
+    data_by_ids, offsets_by_ids = field.get_entities_data_by_ids(ids)
+    assert np.allclose(data_by_ids, data)
+    assert np.allclose(offsets_by_ids, offsets)
+    with pytest.raises(ValueError):
+        field.get_entities_data_by_ids([-1])
+
+    disp = model.results.displacement()
+    field = disp.outputs.fields_container()[0]
+    data, offsets = field.get_entities_data([2, 1])
+    assert np.allclose(offsets, [0, 1, 2])
+    assert np.allclose(data, field.data[[2, 1]])
+
+
+def test_local_field_append_entities(server_type_remote_process):
+    num_entities = 100
+    field_to_local = dpf.core.fields_factory.create_3d_vector_field(
+        num_entities, location=dpf.core.locations.elemental_nodal, server=server_type_remote_process
+    )
+    ids = np.arange(1, num_entities + 1)
+    n_nodes = np.where(ids % 2 == 0, 2, 1)
+    data = np.repeat(ids, n_nodes * 3).reshape(-1, 3) * 0.1
+    with field_to_local.as_local_field() as f:
+        f.append_entities(ids, data, n_elementary_data=n_nodes)
+        assert f.size == data.size
+        assert np.allclose(f.get_entity_data(1), [[0.2, 0.2, 0.2], [0.2, 0.2, 0.2]])
+        assert np.allclose(f.get_entity_data_by_id(3), [[0.3, 0.3, 0.3]])
+        with pytest.raises(ValueError):
+            f.append_entities([101], np.ones(4))
+
+    assert np.allclose(field_to_local.data, data)
+    assert np.allclose(field_to_local.scoping.ids, ids)
+    assert np.allclose(field_to_local.get_entity_data_by_id(100), [[10.0, 10.0, 10.0]] * 2)
+
+
+def test_local_field_append_no_entities(server_type_remote_process):
+    field_to_local = dpf.core.fields_factory.create_3d_vector_field(
+        2, location=dpf.core.locations.elemental_nodal, server=server_type_remote_process
+    )
+    with field_to_local.as_local_field() as f:
+        f.append_entities([1], np.ones((2, 3)), n_elementary_data=[2])
+        f.append_entities([], np.empty((0, 3)), n_elementary_data=[])
+        f.append_entities([], [])
+        with pytest.raises(ValueError):
+            f.append_entities([], np.ones(3), n_elementary_data=[])
+        with pytest.raises(ValueError):
+            f.append_entities([], np.ones(3))
+        f.append_entities([2], np.zeros((1, 3)), n_elementary_data=[1])
+    assert np.allclose(field_to_local.scoping.ids, [1, 2])
+    assert np.allclose(field_to_local.get_entity_data_by_id(1), np.ones((2, 3)))
+    assert np.allclose(field_to_local.get_entity_data_by_id(2), np.zeros((1, 3)))
+
+
 def test_auto_delete_field_local2(server_type_remote_process):
     num_entities = 1
     field_to_local = dpf.core.fields_factory.create_3d_vector_field(
@@ -913,6 +1027,32 @@ def test_field_mutable_data(server_clayer, allkindofcomplexity):
     assert np.allclose(changed_data[0], data_copy[0] + 2.0)
 
 
+@pytest.mark.parametrize("modification_tracking", ["copy", "hash", "write"])
+@conftest.raises_for_servers_version_under("4.0")
+def test_field_mutable_data_modification_tracking(
+    server_clayer, allkindofcomplexity, modification_tracking
+):
+    client_config = dpf.core.settings.get_runtime_client_config(server=server_clayer)
+    modification_tracking_init = client_config.modification_tracking
+    client_config.modification_tracking = modification_tracking
+    assert client_config.modification_tracking == modification_tracking
+    try:
+        model = dpf.core.Model(allkindofcomplexity, server=server_clayer)
+        field = model.results.displacement().outputs.fields_container()[0]
+        data = field.data
+        assert not data.vec.has_changed()
+        data_copy = copy.deepcopy(data)
+        data[0] += 1.0
+        assert data.vec.has_changed()
+        data = None
+        changed_data = field.data
+        assert np.allclose(changed_data[0], data_copy[0] + 1.0)
+    finally:
+        client_config.modification_tracking = modification_tracking_init
+    with pytest.raises(ValueError):
+        client_config.modification_tracking = "unknown"
+
+
 @pytest.mark.skipif(
     not conftest.SERVERS_VERSION_GREATER_THAN_OR_EQUAL_TO_5_0,
     reason="change in memory ownership in server 5.0",
@@ -37,6 +37,22 @@ def test_vtk_grid_from_model(simple_bar_model):
     assert all(grid.celltypes == vtk.VTK_HEXAHEDRON)
 
 
+def test_vtk_grid_deformed_shares_topology(simple_bar_model):
+    mesh = simple_bar_model.metadata.meshed_region
+    disp = simple_bar_model.results.displacement().outputs.fields_container()[0]
+    deformed = mesh.deform_by(disp, 2.0)
+    other_deformed = mesh.deform_by(disp, 4.0)
+    grid = mesh._as_vtk_deformed(deformed)
+    other_grid = mesh._as_vtk_deformed(other_deformed)
+    assert np.shares_memory(grid.cells, other_grid.cells)
+    assert np.array_equal(grid.celltypes, mesh.grid.celltypes)
+    assert np.allclose(grid.points, deformed.data)
+    assert np.allclose(other_grid.points, other_deformed.data)
+    assert not np.allclose(grid.points, other_grid.points)
+    topology = mesh._vtk_topologies[True]
+    assert np.allclose(topology.points, mesh.nodes.coordinates_field.data)
+
+
 def test_meshed_region_available_property_fields(simple_bar_model):
     mesh = simple_bar_model.metadata.meshed_region
     properties = ["connectivity", "elprops", "eltype", "apdl_element_type", "mat"]
@@ -74,6 +90,59 @@ def test_get_node_meshedregion(simple_bar_model):
     assert np.allclose(mesh.grid.points[1], expected_coord)
 
 
+def test_iter_nodes_meshedregion(simple_bar_model):
+    mesh = simple_bar_model.metadata.meshed_region
+    nodes = mesh.nodes
+    ids = nodes.scoping.ids
+    coordinates = nodes.coordinates_field.data
+    n_nodes = 0
+    for node in nodes:
+        assert node.id == ids[node.index]
+        assert np.allclose(node.coordinates, coordinates[node.index])
+        n_nodes += 1
+    assert n_nodes == len(nodes)
+    assert nodes.node_by_index(1).coordinates == [0.1, 2.9, 0.2]
+    assert nodes.node_by_id(ids[1]).index == 1
+
+
+def test_bulk_nodes_coordinates_meshedregion(simple_bar_model):
+    mesh = simple_bar_model.metadata.meshed_region
+    nodes = mesh.nodes
+    ids = nodes.scoping.ids
+    coordinates = nodes.coordinates_field.data
+    indices = [0, 5, 1053]
+    assert np.allclose(nodes.take(indices), coordinates[indices])
+    assert np.allclose(nodes.coordinates_by_ids(ids[indices]), coordinates[indices])
+    with pytest.raises(ValueError):
+        nodes.coordinates_by_ids([-1])
+
+
+def test_elements_to_arrays_meshedregion(simple_bar_model):
+    mesh = simple_bar_model.metadata.meshed_region
+    elements = mesh.elements
+    ids, types, offsets, connectivity = elements.to_arrays()
+    assert np.allclose(ids, elements.scoping.ids)
+    assert np.allclose(types, elements.element_types_field.data)
+    assert offsets.size == ids.size + 1
+    assert np.allclose(connectivity, elements.connectivities_field.data)
+    n_elements = 0
+    for element in elements:
+        assert element.id == ids[element.index]
+        n_elements += 1
+    assert n_elements == len(elements)
+    for index in [0, 5, len(elements) - 1]:
+        expected = mesh.elements.element_by_index(index)
+        element = elements.element_by_index(index)
+        assert element.id == expected.id
+        assert element.type == expected.type
+        assert element.node_ids == expected.node_ids
+        assert element.connectivity == expected.connectivity
+        assert np.allclose(element.nodes[0].coordinates, expected.nodes[0].coordinates)
+    assert elements.element_by_id(ids[3]).index == 3
+    with pytest.raises(ValueError):
+        elements.element_by_id(int(ids.max()) + 1)
+
+
 def test_get_element_meshedregion(simple_bar_model):
     mesh = simple_bar_model.metadata.meshed_region
     el = mesh.elements.element_by_index(1)
@@ -309,6 +378,44 @@ def test_id_indeces_mapping_on_elements_2(allkindofcomplexity, server_type):
     assert mapping[4520] == 2011
 
 
+def test_map_scoping_on_nodes_and_elements(allkindofcomplexity, server_type):
+    model = dpf.core.Model(allkindofcomplexity, server=server_type)
+    mesh = model.metadata.meshed_region
+    nodes = mesh.nodes
+    node_ids = nodes.scoping.ids
+    scop = dpf.core.Scoping(
+        ids=[node_ids[12345], 10**8, node_ids[19]],
+        location=dpf.core.locations.nodal,
+        server=server_type,
+    )
+    ind, mask = nodes.map_scoping(scop)
+    assert ind.dtype == np.int32
+    assert np.array_equal(ind, [12345, 19])
+    assert np.array_equal(mask, [True, False, True])
+    elements = mesh.elements
+    scop = dpf.core.Scoping(
+        ids=[4520, 23], location=dpf.core.locations.elemental, server=server_type
+    )
+    ind, mask = elements.map_scoping(scop)
+    assert np.array_equal(ind, [2011, 24])
+    assert mask.all()
+    assert 4520 in elements.mapping_id_to_index
+    assert elements.mapping_id_to_index.get(10**8) is None
+
+
+def test_id_to_index_map_duplicated_ids():
+    from ansys.dpf.core._id_index import IdToIndexMap
+
+    # compact IDs use the dense table, sparse IDs the sorted search
+    for ids in ([5, 3, 5, 4, 3], [500, 3, 500, 40000, 3]):
+        mapping = IdToIndexMap(ids)
+        ind, mask = mapping.lookup([ids[0], 3, ids[3], 9])
+        assert np.array_equal(ind, [0, 1, 3])
+        assert np.array_equal(mask, [True, True, True, False])
+        assert mapping[ids[0]] == 0
+        assert mapping[3] == 1
+
+
 def test_named_selection_mesh(allkindofcomplexity, server_type):
     model = dpf.core.Model(allkindofcomplexity, server=server_type)
     mesh = model.metadata.meshed_region
@@ -1,4 +1,5 @@
 import functools
+import shutil
 
 import numpy as np
 import pytest
@@ -6,7 +7,7 @@ import pytest
 from ansys import dpf
 from ansys.dpf.core import examples, misc
 from ansys.dpf.core.errors import ServerTypeError
-from conftest import SERVERS_VERSION_GREATER_THAN_OR_EQUAL_TO_4_0
+from conftest import SERVERS_VERSION_GREATER_THAN_OR_EQUAL_TO_4_0, running_docker
 
 
 NO_PLOTTING = True
@@ -115,6 +116,45 @@ def test_iterate_results_model(allkindofcomplexity):
         key()
 
 
+def test_results_docstrings_cached_per_server(allkindofcomplexity):
+    model = dpf.core.Model(allkindofcomplexity)
+    res = model.results
+    server = model._server
+    doc = type(res).__dict__["displacement"].__doc__
+    assert doc == dpf.core.Operator("U", server=server).__str__()
+    assert server._operator_descriptions_cache["U"] == doc
+    assert res.displacement.__doc__ == doc
+    model2 = dpf.core.Model(allkindofcomplexity)
+    assert len(model2.results) == len(res)
+
+
+@pytest.mark.skipif(running_docker, reason="Result files are not accessible from the client.")
+def test_metadata_shared_across_models(allkindofcomplexity, tmp_path):
+    model = dpf.core.Model(allkindofcomplexity)
+    model2 = dpf.core.Model(allkindofcomplexity)
+    assert model2.metadata.result_info is model.metadata.result_info
+    assert model2.metadata.time_freq_support is model.metadata.time_freq_support
+    named_selections = model.metadata.available_named_selections
+    assert model2.metadata._meshed_region is None
+    assert model2.metadata.available_named_selections == named_selections
+    assert model2.metadata._meshed_region is None
+
+    copy = shutil.copy(allkindofcomplexity, tmp_path / "copy.rst")
+    model3 = dpf.core.Model(str(copy))
+    assert model3.metadata.result_info is not model.metadata.result_info
+
+
+def test_metadata_not_shared_for_remote_server(server_type_remote_process):
+    server_type_remote_process.local_server = False
+    path = examples.find_simple_bar(server=server_type_remote_process)
+    model = dpf.core.Model(path, server=server_type_remote_process)
+    model2 = dpf.core.Model(path, server=server_type_remote_process)
+    # the files are not inspected on the client, so the metadata is not shared
+    assert model2.metadata.result_info is not model.metadata.result_info
+    assert model2.metadata.time_freq_support is not model.metadata.time_freq_support
+    assert model2.metadata.result_info.n_results == model.metadata.result_info.n_results
+
+
 def test_result_not_overrided(plate_msup):
     model1 = dpf.core.Model(examples.find_electric_therm())
     size = len(model1.results)
@@ -182,6 +222,42 @@ def test_result_time_scoping(plate_msup):
     assert np.allclose(fc.time_freq_support.time_frequencies.data, np.array([0.115, 0.125]))
 
 
+def test_result_iter_time_sets(plate_msup):
+    model = dpf.core.Model(plate_msup)
+    disp = model.results.displacement
+    all_sets = disp.on_all_time_freqs.eval()
+    chunks = list(disp.iter_time_sets(chunk=6))
+    assert [len(fc) for fc in chunks] == [6, 6, 6, 2]
+    assert np.allclose(chunks[-1][1].data, all_sets[19].data)
+    chunks = list(disp.on_time_scoping([1, 2, 19]).iter_time_sets(chunk=2, prefetch=False))
+    assert [len(fc) for fc in chunks] == [2, 1]
+    assert np.allclose(chunks[1][0].data, all_sets[18].data)
+    with pytest.raises(ValueError):
+        next(disp.on_time_scoping([0.115, 0.125]).iter_time_sets())
+
+
+def test_result_iter_time_sets_stopped_early(plate_msup, monkeypatch):
+    from ansys.dpf.core import _futures
+
+    futures = []
+    submit = _futures._submit
+
+    def recording_submit(*args, **kwargs):
+        # the prefetched chunks are never started
+        futures.append(_futures._AwaitableFuture() if futures else submit(*args, **kwargs))
+        return futures[-1]
+
+    monkeypatch.setattr(_futures, "_submit", recording_submit)
+    model = dpf.core.Model(plate_msup)
+    time_sets = model.results.displacement.iter_time_sets(chunk=6)
+    for fc in time_sets:
+        assert len(fc) == 6
+        break
+    time_sets.close()
+    assert len(futures) == 2
+    assert futures[1].cancelled()
+
+
 def test_result_split_subset(allkindofcomplexity):
     model = dpf.core.Model(allkindofcomplexity)
     vol = model.results.elemental_volume
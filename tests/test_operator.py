@@ -1,3 +1,4 @@
+import asyncio
 import gc
 import os
 import shutil
@@ -296,6 +297,148 @@ def test_eval_operator(server_type):
     op.run()
 
 
+def test_get_output_async_operator(allkindofcomplexity, server_type):
+    model = dpf.core.Model(allkindofcomplexity, server=server_type)
+    disp_future = model.results.displacement().get_output_async(
+        0, dpf.core.types.fields_container
+    )
+    stress_future = model.results.stress().eval_async()
+    disp = disp_future.result()
+    stress = stress_future.result()
+    assert disp[0].unit == model.results.displacement().eval()[0].unit
+    assert len(stress) == len(model.results.stress().eval())
+
+    async def read_displacement():
+        return await model.results.displacement().get_output_async(
+            0, dpf.core.types.fields_container
+        )
+
+    assert len(asyncio.run(read_displacement())) == len(disp)
+
+    op = dpf.core.Operator("min_max", server=server_type)
+    with pytest.raises(Exception):
+        op.get_output_async(0, dpf.core.types.field).result()
+
+
+def test_eval_async_without_progress_bar(allkindofcomplexity, server_type):
+    model = dpf.core.Model(allkindofcomplexity, server=server_type)
+    op = model.results.displacement()
+    op.progress_bar = True
+    progress_bars = []
+    get_output = op._get_output
+
+    def recording_get_output(pin, output_type, progress_bar):
+        progress_bars.append(progress_bar)
+        return get_output(pin, output_type, progress_bar)
+
+    op._get_output = recording_get_output
+    disp = op.eval_async().result()
+    assert isinstance(disp, dpf.core.FieldsContainer)
+    assert progress_bars == [False]
+    assert op.eval_async(pin=100).result() is None
+
+
+def test_output_cache_operator(simple_bar, server_type):
+    from ansys.dpf.core.output_cache import OutputCache
+
+    data_sources = dpf.core.DataSources(simple_bar, server=server_type)
+    disp_op = dpf.core.operators.result.displacement(
+        data_sources=data_sources, server=server_type
+    )
+    norm_op = dpf.core.operators.math.norm_fc(disp_op, server=server_type)
+    cache = OutputCache(max_size=2)
+    norm_op.output_cache = cache
+    norm = norm_op.outputs.fields_container()
+    assert norm_op.outputs.fields_container() is norm
+    assert cache.statistics.hits == 1
+    assert cache.statistics.misses == 1
+
+    scoping = dpf.core.Scoping(ids=[1, 2], location=dpf.core.locations.nodal, server=server_type)
+    disp_op.inputs.mesh_scoping.connect(scoping)
+    scoped_norm = norm_op.outputs.fields_container()
+    assert scoped_norm is not norm
+    assert len(scoped_norm[0].scoping) == 2
+    assert cache.statistics.misses == 2
+
+    cache.invalidate(norm_op)
+    assert norm_op.outputs.fields_container() is not scoped_norm
+    cache.clear()
+    assert len(cache) == 0
+
+    op = dpf.core.Operator("min_max_fc", server=server_type)
+    op.output_cache = cache
+    op.connect(0, norm_op.outputs.fields_container())
+    field_max = op.get_output(1, dpf.core.types.field)
+    assert op.get_output(1, dpf.core.types.field) is field_max
+
+
+def test_output_cache_unknown_inputs(server_type):
+    from ansys.dpf.core.output_cache import OutputCache
+
+    field = dpf.core.fields_factory.field_from_array([1.0, 2.0, 3.0], server=server_type)
+    scale_op = dpf.core.operators.math.scale(field, 2.0, server=server_type)
+    # the operator has no cache, so the field is not kept alive
+    field_ref = weakref.ref(field)
+    del field
+    gc.collect()
+    assert field_ref() is None
+    cache = OutputCache()
+    scale_op.output_cache = cache
+    scale_op.outputs.field()
+    scale_op.outputs.field()
+    assert cache.statistics.hits == 0
+
+    # inputs connected once the cache is set are kept
+    scale_op.inputs.field.connect(
+        dpf.core.fields_factory.field_from_array([1.0, 2.0, 3.0], server=server_type)
+    )
+    scaled = scale_op.outputs.field()
+    assert scale_op.outputs.field() is scaled
+    assert np.allclose(scaled.data, [2.0, 4.0, 6.0])
+
+    # the pins named in a workflow can be connected through it
+    wf = dpf.core.Workflow(server=server_type)
+    wf.add_operator(scale_op)
+    wf.set_input_name("field", scale_op.inputs.field)
+    wf.connect(
+        "field", dpf.core.fields_factory.field_from_array([5.0, 5.0, 5.0], server=server_type)
+    )
+    hits = cache.statistics.hits
+    assert np.allclose(scale_op.outputs.field().data, [10.0, 10.0, 10.0])
+    assert cache.statistics.hits == hits
+
+
+def test_output_cache_modified_inputs(server_type, monkeypatch):
+    from ansys.dpf.core import output_cache
+
+    field = dpf.core.fields_factory.field_from_array([1.0, 2.0, 3.0], server=server_type)
+    scale_op = dpf.core.operators.math.scale(field, 2.0, server=server_type)
+    cache = output_cache.OutputCache()
+    scale_op.output_cache = cache
+    scaled = scale_op.outputs.field()
+    assert scale_op.outputs.field() is scaled
+    assert cache.statistics.hits == 1
+
+    # small fields are identified by their content
+    field.data = [2.0, 3.0, 4.0]
+    assert np.allclose(scale_op.outputs.field().data, [4.0, 6.0, 8.0])
+    assert cache.statistics.misses == 2
+    scale_op.inputs.field.connect(
+        dpf.core.fields_factory.field_from_array([2.0, 3.0, 4.0], server=server_type)
+    )
+    scale_op.outputs.field()
+    assert cache.statistics.hits == 2
+
+    # larger fields are identified by their instance until they are modified
+    monkeypatch.setattr(output_cache, "_CONTENT_HASH_MAX_SIZE", 2)
+    scale_op.inputs.field.connect(field)
+    scaled = scale_op.outputs.field()
+    assert scale_op.outputs.field() is scaled
+    field.data = [5.0, 5.0, 5.0]
+    assert np.allclose(scale_op.outputs.field().data, [10.0, 10.0, 10.0])
+    assert cache.statistics.misses == 4
+
+
 def test_inputs_outputs_1_operator(cyclic_lin_rst, cyclic_ds, tmpdir):
     data_sources = dpf.core.DataSources(cyclic_lin_rst)
     data_sources.add_file_path(cyclic_ds)
@@ -1232,6 +1375,31 @@ def test_operator_specification_none(server_type):
             assert False
 
 
+def test_operator_specification_cache(server_type, tmpdir):
+    from ansys.dpf.core import operator_specification
+
+    file_path = str(tmpdir.join("specifications.json"))
+    operator_specification.prewarm_specifications(
+        ["U", "S"], server=server_type, file_path=file_path
+    )
+    assert os.path.exists(file_path)
+    spec = Specification(operator_name="U", server=server_type)
+    # the specification is read from the cache, not requested from the server
+    assert spec._internal_obj is None
+    assert "displacement" in spec.description
+    assert "result file path" in spec.inputs[4].document
+    assert spec.outputs[0].name == "fields_container"
+    assert "mutex" in spec.config_specification
+    op = dpf.core.Operator("U", server=server_type)
+    assert op.inputs.data_sources is not None
+    assert operator_specification.load_specifications(file_path, server=server_type)
+    # loading a library can change the operators, so their cached specifications are dropped
+    server_type._clear_operator_caches()
+    spec = Specification(operator_name="U", server=server_type)
+    assert spec._internal_obj is not None
+    assert "displacement" in spec.description
+
+
 @conftest.raises_for_servers_version_under("3.0")
 def test_generated_operator_specification(server_type):
     op = ops.result.displacement(server=server_type)
@@ -1343,3 +1511,45 @@ def test_deep_copy_non_ascii_string(server_type):
     str = "\N{GREEK CAPITAL LETTER DELTA}"
     str_out = dpf.core.core._deep_copy(str, server_type)
     assert str == str_out
+
+
+def _run_in_subprocess(code):
+    """Run Python code in a new interpreter, so that no module is imported yet."""
+    import subprocess
+    import sys
+
+    process = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert process.returncode == 0, process.stderr
+
+
+def test_operators_are_loaded_lazily():
+    code = (
+        "import sys\n"
+        "import pytest\n"
+        "from ansys.dpf.core import operators as ops\n"
+        "from ansys.dpf.core.operators import result\n"
+        "name = 'ansys.dpf.core.operators.result.accu_eqv_creep_strain'\n"
+        "assert name not in sys.modules\n"
+        "assert 'accu_eqv_creep_strain' in dir(result)\n"
+        "op_class = result.accu_eqv_creep_strain\n"
+        "assert isinstance(op_class, type)\n"
+        "assert name in sys.modules\n"
+        "from ansys.dpf.core.operators.result import accu_eqv_creep_strain\n"
+        "assert accu_eqv_creep_strain is op_class\n"
+        "import ansys.dpf.core.operators.result.accu_eqv_plastic_strain\n"
+        "assert isinstance(ops.result.accu_eqv_plastic_strain, type)\n"
+        "with pytest.raises(AttributeError):\n"
+        "    ops.result.not_an_operator\n"
+    )
+    _run_in_subprocess(code)
+
+
+def test_import_time_operators():
+    # Only the operators used by ansys.dpf.core itself are imported, not the whole package
+    code = (
+        "import sys\n"
+        "import ansys.dpf.core\n"
+        "n = sum(name.startswith('ansys.dpf.core.operators.') for name in sys.modules)\n"
+        "assert n < 20, n\n"
+    )
+    _run_in_subprocess(code)
@@ -1,5 +1,6 @@
 import os
 
+import numpy as np
 import pytest
 
 from ansys import dpf
@@ -8,7 +9,11 @@ from ansys.dpf.core import Model, Operator
 from ansys.dpf.core import errors as dpf_errors
 from ansys.dpf.core import misc
 from ansys.dpf.core.plotter import plot_chart
-from conftest import running_docker, SERVERS_VERSION_GREATER_THAN_OR_EQUAL_TO_5_0
+from conftest import (
+    running_docker,
+    SERVERS_VERSION_GREATER_THAN_OR_EQUAL_TO_5_0,
+    SERVERS_VERSION_GREATER_THAN_OR_EQUAL_TO_7_0,
+)
 from ansys.dpf.core import element_types
 
 if misc.module_exists("pyvista"):
@@ -300,6 +305,75 @@ def test_plot_fields_on_mesh_scoping_title(multishells):
     mesh.plot(s[0], text="test")
 
 
+@pytest.mark.skipif(not HAS_PYVISTA, reason="Please install pyvista")
+def test_plotter_add_field_cached_mapping(plate_msup):
+    from ansys.dpf.core.plotter import DpfPlotter
+
+    model = core.Model(plate_msup)
+    mesh = model.metadata.meshed_region
+    fc = model.results.displacement.on_all_time_freqs.eval()
+    data_buffer = np.empty((mesh.nodes.n_nodes, 3))
+    for field in fc:
+        pl = DpfPlotter()
+        pl.add_field(field, mesh, data_buffer=data_buffer)
+    assert len(mesh._scoping_mappings) == 1
+    ind, mask = mesh._map_scoping(mesh.nodes, fc[0].scoping)
+    assert not ind.flags.writeable
+    expected = np.full((mesh.nodes.n_nodes, 3), np.nan)
+    expected[ind] = fc[-1].data[mask]
+    assert np.allclose(data_buffer, expected, equal_nan=True)
+    with pytest.raises(ValueError):
+        pl.add_field(fc[0], mesh, data_buffer=np.empty(mesh.nodes.n_nodes))
+
+
+@pytest.mark.skipif(not HAS_PYVISTA, reason="Please install pyvista")
+def test_plotter_level_of_detail_skin(simple_bar):
+    from ansys.dpf.core.level_of_detail import LevelOfDetail
+    from ansys.dpf.core.plotter import DpfPlotter
+
+    model = core.Model(simple_bar)
+    mesh = model.metadata.meshed_region
+    disp = model.results.displacement().outputs.fields_container()[0]
+    lod = LevelOfDetail(mesh)
+    skin = lod.reduced_mesh
+    assert not lod.is_decimated
+    assert skin.nodes.n_nodes < mesh.nodes.n_nodes
+    mapped = lod.map_field(disp)
+    assert set(mapped.scoping.ids).issubset(skin.nodes.scoping.ids)
+    node_ids = mesh.nodes.scoping.ids[:2]
+    probed = lod.probe(disp, mesh.nodes.coordinates_field.data[:2])
+    expected = [disp.get_entity_data_by_id(node_id)[0] for node_id in node_ids]
+    assert np.allclose(probed.data, expected)
+    pl = DpfPlotter()
+    pl.add_field(disp, mesh, lod=lod)
+    pl.add_mesh(mesh, lod=True)
+    assert mesh._levels_of_detail[None].reduced_mesh is not None
+    mesh.set_coordinates_field(mesh.nodes.coordinates_field)
+    assert not mesh._levels_of_detail
+    with pytest.raises(ValueError):
+        LevelOfDetail(mesh, method="surface")
+
+
+@pytest.mark.skipif(not HAS_PYVISTA, reason="Please install pyvista")
+@pytest.mark.skipif(
+    not SERVERS_VERSION_GREATER_THAN_OR_EQUAL_TO_7_0,
+    reason="Mesh decimation requires a server version higher than 7.0",
+)
+def test_plotter_level_of_detail_decimate(simple_bar):
+    from ansys.dpf.core.level_of_detail import LevelOfDetail
+
+    model = core.Model(simple_bar)
+    mesh = model.metadata.meshed_region
+    disp = model.results.displacement().outputs.fields_container()[0]
+    lod = LevelOfDetail(mesh, max_cells=100)
+    assert lod.is_decimated
+    mapped = lod.map_field(disp)
+    assert mapped.location == core.locations.nodal
+    assert len(mapped.data) > 0
+    mesh.plot(disp, lod=100)
+    assert mesh._levels_of_detail[100].is_decimated
+
+
 @pytest.mark.skipif(not HAS_PYVISTA, reason="Please install pyvista")
 def test_throw_on_several_time_steps(plate_msup):
     model = core.Model(plate_msup)
@@ -758,3 +832,78 @@ def test_plot_polyhedron():
 
     # Plot the MeshedRegion
     mesh.plot()
+
+
+def _synthetic_polyhedral_mesh(is_polyhedron):
+    """Return the connectivity arrays of a mesh of polyhedrons with six quadrangle
+    faces and of hexahedrons."""
+    is_polyhedron = np.asarray(is_polyhedron, dtype=bool)
+    n_faces = 6 * int(is_polyhedron.sum())
+    faces_nodes = np.arange(4 * n_faces, dtype=np.int32) % 1000
+    faces_nodes_dp = np.arange(0, 4 * n_faces, 4, dtype=np.int32)
+    elements_faces = np.arange(n_faces, dtype=np.int32)
+    elements_faces_dp = (6 * (np.cumsum(is_polyhedron) - is_polyhedron)).astype(np.int32)
+    etypes = np.where(
+        is_polyhedron, element_types.Polyhedron.value, element_types.Hex8.value
+    ).astype(np.int32)
+    connectivity = np.arange(8 * is_polyhedron.size, dtype=np.int32) % 1000
+    connectivity_dp = np.arange(0, connectivity.size, 8, dtype=np.int32)
+    return (
+        etypes,
+        connectivity,
+        connectivity_dp,
+        elements_faces,
+        elements_faces_dp,
+        faces_nodes,
+        faces_nodes_dp,
+    )
+
+
+def _cells_with_polyhedrons_loop(
+    etypes,
+    connectivity,
+    connectivity_dp,
+    elements_faces,
+    elements_faces_dp,
+    faces_nodes,
+    faces_nodes_dp,
+):
+    elem_size = np.diff(np.append(connectivity_dp, connectivity.size))
+    elements_faces_dp = np.append(elements_faces_dp, elements_faces.size)
+    faces_nodes_dp = np.append(faces_nodes_dp, faces_nodes.size)
+    cells = []
+    for i, etype in enumerate(etypes):
+        if etype == element_types.Polyhedron.value:
+            polyhedron = []
+            faces = elements_faces[elements_faces_dp[i] : elements_faces_dp[i + 1]]
+            for face in faces:
+                face_nodes = faces_nodes[faces_nodes_dp[face] : faces_nodes_dp[face + 1]]
+                polyhedron += [len(face_nodes)] + list(face_nodes)
+            polyhedron = [len(faces)] + polyhedron
+            cells += [len(polyhedron)] + polyhedron
+        else:
+            start = connectivity_dp[i]
+            cells += [elem_size[i]] + list(connectivity[start : start + elem_size[i]])
+    return np.array(cells)
+
+
+@pytest.mark.skipif(not HAS_PYVISTA, reason="This test requires pyvista")
+def test_vtk_cells_with_polyhedrons():
+    from ansys.dpf.core.vtk_helper import _cells_with_polyhedrons
+
+    is_polyhedron = [True, False, True, False, True, True, False, True]
+    mesh_arrays = _synthetic_polyhedral_mesh(is_polyhedron)
+    cells, cells_insert_ind, cell_sizes = _cells_with_polyhedrons(*mesh_arrays)
+    assert np.array_equal(cells, _cells_with_polyhedrons_loop(*mesh_arrays))
+    assert np.array_equal(cells_insert_ind, np.cumsum(cell_sizes) - cell_sizes)
+    assert np.array_equal(cells[cells_insert_ind[np.logical_not(is_polyhedron)]], [8, 8, 8])
+    assert np.array_equal(cells[cells_insert_ind[is_polyhedron]], [31] * 5)
+
+
+@pytest.mark.skipif(not HAS_PYVISTA, reason="This test requires pyvista")
+def test_vtk_cells_with_polyhedrons_large_mesh():
+    from ansys.dpf.core.vtk_helper import _cells_with_polyhedrons
+
+    mesh_arrays = _synthetic_polyhedral_mesh(np.arange(50000) % 10 != 0)
+    cells, _, _ = _cells_with_polyhedrons(*mesh_arrays)
+    assert np.array_equal(cells, _cells_with_polyhedrons_loop(*mesh_arrays))
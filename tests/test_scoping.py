@@ -274,6 +274,44 @@ def test_as_local_scoping2():
         assert hasattr(loc, "_is_set") is False
 
 
+def test_as_local_scoping_append_many():
+    scop = Scoping()
+    with scop.as_local_scoping() as loc:
+        loc.location = "Nodal"
+        loc.append_many(np.arange(1, 50001))
+        loc.append(50001)
+        assert loc.size == 50001
+        assert loc.index(25000) == 24999
+        assert loc.index(50001) == 50000
+        assert loc.index(-5) == -1
+        loc.set_id(0, 60000)
+        assert loc.index(60000) == 0
+        assert loc.id(1) == 2
+    assert np.allclose(scop.ids[1:], np.arange(2, 50002))
+    assert scop.ids[0] == 60000
+
+
+def test_as_local_scoping_append_and_index():
+    scop = Scoping()
+    with scop.as_local_scoping() as loc:
+        for i in range(3000):
+            loc.append(i + 1)
+            assert loc.index(i + 1) == i
+        loc.append(10)
+        assert loc.index(10) == 9
+        assert loc.index(3001) == -1
+        loc.append_many(np.arange(3001, 6001))
+        assert loc.index(6000) == 6000
+        assert loc.index(3001) == 3001
+        loc.set_id(3001, 7000)
+        assert loc.index(7000) == 3001
+        assert loc.index(3001) == -1
+        loc.set_id(9, 8000)
+        assert loc.index(10) == 3000
+        assert loc.index(8000) == 9
+    assert scop.size == 6001
+
+
 def test_auto_delete_scoping_local():
     scop = Scoping()
     s = scop.as_local_scoping()
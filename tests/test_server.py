@@ -1,4 +1,6 @@
+import gc
 import time
+import weakref
 
 import pytest
 import subprocess
@@ -268,6 +270,32 @@ def test_connect_to_remote_server(remote_config_server_type):
     assert server.config == remote_config_server_type
 
 
+def test_connect_to_server_shares_connection(remote_config_server_type):
+    server_type_remote_process = start_local_server(
+        config=remote_config_server_type, as_global=False
+    )
+    servers = [
+        connect_to_server(
+            ip=server_type_remote_process.external_ip,
+            port=server_type_remote_process.external_port,
+            as_global=False,
+            config=remote_config_server_type,
+        )
+        for _ in range(2)
+    ]
+    assert servers[0]._connection is servers[1]._connection
+    assert servers[0]._connection is not server_type_remote_process._connection
+    assert servers[1].version == server_type_remote_process.version
+    assert servers[1].info["server_port"] == server_type_remote_process.info["server_port"]
+    assert servers[0]._thread_pool is servers[1]._thread_pool
+    field = dpf.core.Field(server=servers[1])
+    assert field._internal_obj is not None
+    connection = weakref.ref(servers[0]._connection)
+    del field, servers
+    gc.collect()
+    assert connection() is None
+
+
 @pytest.mark.skipif(
     not SERVERS_VERSION_GREATER_THAN_OR_EQUAL_TO_4_0,
     reason="Not existing in version lower than 4.0",
@@ -0,0 +1,50 @@
+import pytest
+
+import conftest
+from ansys.dpf import core as dpf
+from ansys.dpf.core import examples
+
+
+@pytest.mark.skipif(
+    not conftest.SERVERS_VERSION_GREATER_THAN_OR_EQUAL_TO_4_0,
+    reason="Requires server version higher than 4.0",
+)
+def test_server_pool_evaluate_models(server_type):
+    paths = [examples.find_simple_bar(), examples.find_static_rst(), examples.find_simple_bar()]
+    with dpf.ServerPool(n_servers=2, gather_server=server_type) as pool:
+        assert len(pool) == 2
+        results = pool.evaluate_models(
+            paths, lambda model: model.results.displacement().eval()
+        )
+        assert [result.task for result in results] == paths
+        for result in results:
+            assert result.output._server is server_type
+            assert result.server_index in (0, 1)
+            assert result.elapsed_time >= 0.0
+        expected = dpf.Model(paths[0], server=server_type).results.displacement().eval()
+        assert len(results[0].output) == len(expected)
+        assert results[0].output[0].unit == expected[0].unit
+
+        not_gathered = pool.map(
+            lambda server, path: dpf.DataSources(path, server=server), paths[:1], gather=False
+        )
+        assert not_gathered[0].output._server in pool.servers
+        assert not_gathered[0].gather_time == 0.0
+    assert len(pool.servers) == 0
+
+
+@pytest.mark.skipif(
+    not conftest.SERVERS_VERSION_GREATER_THAN_OR_EQUAL_TO_4_0,
+    reason="Requires server version higher than 4.0",
+)
+def test_server_pool_evaluate_workflow(server_type):
+    workflow = dpf.Workflow(server=server_type)
+    forward = dpf.operators.utility.forward(server=server_type)
+    workflow.add_operator(forward)
+    workflow.set_input_name("in", forward, 0)
+    workflow.set_output_name("out", forward, 0)
+    with dpf.ServerPool(n_servers=2, gather_server=server_type) as pool:
+        results = pool.evaluate_workflow(
+            workflow, "out", dpf.types.int, [{"in": i} for i in range(4)]
+        )
+    assert [result.output for result in results] == list(range(4))
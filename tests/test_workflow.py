@@ -388,6 +388,85 @@ def test_connect_get_output_double_list_workflow(server_type):
     assert np.allclose(d, d_out)
 
 
+def test_connect_many_get_outputs_workflow(server_type):
+    wf = dpf.core.Workflow(server=server_type)
+    wf.progress_bar = False
+    forward_int = dpf.core.operators.utility.forward(server=server_type)
+    forward_str = dpf.core.operators.utility.forward(server=server_type)
+    forward_op = dpf.core.operators.utility.forward(server=server_type)
+    wf.add_operators([forward_int, forward_str, forward_op])
+    wf.set_input_name("int", forward_int, 0)
+    wf.set_input_name("str", forward_str, 0)
+    wf.set_input_name("op", forward_op, 0)
+    wf.set_output_name("int", forward_int, 0)
+    wf.set_output_name("str", forward_str, 0)
+    wf.set_output_name("op", forward_op, 0)
+    source = dpf.core.operators.utility.forward(3.5, server=server_type)
+    timings = {}
+    wf.connect_many({"int": 2, "str": "hello", "op": (source, 0)}, timings)
+    assert set(timings) == {"int", "str", "op", "total"}
+    timings = {}
+    outputs = wf.get_outputs(
+        {"int": dpf.core.types.int, "str": dpf.core.types.string, "op": dpf.core.types.double},
+        timings,
+    )
+    assert outputs == {"int": 2, "str": "hello", "op": 3.5}
+    assert timings["total"] >= timings["int"]
+
+
+def test_get_output_async_workflow(server_type):
+    d = list(np.ones(1000))
+    wf = dpf.core.Workflow(server=server_type)
+    op = dpf.core.operators.utility.forward(d, server=server_type)
+    wf.add_operators([op])
+    wf.set_output_name("out", op, 0)
+    futures = [wf.get_output_async("out", dpf.core.types.vec_double) for _ in range(4)]
+    for future in futures:
+        assert np.allclose(d, future.result())
+
+
+def test_output_cache_workflow(server_type, tmpdir):
+    from ansys.dpf.core.output_cache import OutputCache
+
+    def create_workflow(cache):
+        wf = dpf.core.Workflow(server=server_type)
+        # the operators are only kept alive by the workflow once the cache is set
+        wf.output_cache = cache
+        wf.progress_bar = False
+        op = dpf.core.operators.utility.forward(server=server_type)
+        wf.add_operators([op])
+        wf.set_input_name("in", op, 0)
+        wf.set_output_name("out", op, 0)
+        return wf
+
+    cache = OutputCache(directory=str(tmpdir))
+    wf = create_workflow(cache)
+    wf.connect("in", 1)
+    assert wf.get_output("out", dpf.core.types.int) == 1
+    assert wf.get_output("out", dpf.core.types.int) == 1
+    assert cache.statistics.hits == 1
+    wf.connect("in", 2)
+    assert wf.get_output("out", dpf.core.types.int) == 2
+    assert cache.statistics.misses == 2
+
+    # identical workflows share the outputs stored in the directory
+    other_wf = create_workflow(OutputCache(directory=str(tmpdir)))
+    other_wf.connect("in", 1)
+    assert other_wf.get_output("out", dpf.core.types.int) == 1
+    assert other_wf.output_cache.statistics.hits == 1
+
+    cache.clear()
+    assert len(os.listdir(str(tmpdir))) == 0
+
+    # the operators of a workflow created from an existing one are unknown
+    copy = dpf.core.Workflow.get_recorded_workflow(wf.record(), server=server_type)
+    copy.output_cache = cache
+    copy.connect("in", 1)
+    assert copy.get_output("out", dpf.core.types.int) == 1
+    assert copy.get_output("out", dpf.core.types.int) == 1
+    assert len(cache) == 0
+
+
 @pytest.mark.skipif(
     not conftest.SERVERS_VERSION_GREATER_THAN_OR_EQUAL_TO_5_0,
     reason="Copying data is " "supported starting server version 5.0",